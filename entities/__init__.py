@@ -1,5 +1,7 @@
 # entities/__init__.py
 """Entity classes for the game."""
 from entities.player import Player
-from entities.enemy import Enemy, Chaser, Tank, Swarm, Ghost, Bat, Boss, create_enemy
+from entities.enemy import (
+    Enemy, EnemyManager, create_enemy, create_enemies, prewarm_enemy_pool
+)
 from entities.drops import ExperienceGem, HealthPickup, Chest, DropManager
@@ -6,39 +6,80 @@ Collectible drops: XP gems, health pickups, and chests.
 import pygame
 import math
 import random
-from settings import DROP_SETTINGS, COLORS
+from settings import DROP_SETTINGS, COLOR_WHITE, COLOR_BROWN
+from utils import SpatialGrid, prepare_surface, fast_sin
+
+# Settings bound once at import
+_GEM_TIERS = {
+    'small': DROP_SETTINGS['xp_gem_small'],
+    'medium': DROP_SETTINGS['xp_gem_medium'],
+    'large': DROP_SETTINGS['xp_gem_large'],
+}
+_HEALTH_DROP_CHANCE = DROP_SETTINGS['health_pickup']['drop_chance']
+_CHEST_DROP_CHANCE = DROP_SETTINGS['chest']['drop_chance']
 
 
 class Drop(pygame.sprite.Sprite):
     """Base class for all collectible drops."""
     
+    # Collected drops kept for reuse (each subclass has its own list)
+    _POOL = []
+    
     def __init__(self, pos, groups):
         super().__init__(groups)
         self.pos = pygame.math.Vector2(pos)
-        self.collected = False
         self.magnet_speed = 500  # Speed when being pulled to player
+    
+    @classmethod
+    def spawn(cls, pos, groups, *args):
+        """Get a drop from the pool, or create one if the pool is empty."""
+        if cls._POOL:
+            drop = cls._POOL.pop()
+            drop._reset(pos, *args)
+            drop.add(groups)
+            return drop
+        return cls(pos, groups, *args)
+    
+    def _reset(self, pos):
+        """Reset per-life state so a pooled drop can be reused."""
+        self.pos.update(pos)
+        self.collected = False
         self.is_magnetized = False
     
+    def kill(self):
+        """Remove from all groups and return to the pool for reuse."""
+        if self.alive():
+            super().kill()
+            self.recycle()
+    
+    def recycle(self):
+        """Return a drop that has already left its groups to the pool."""
+        self._POOL.append(self)
+    
     def magnetize(self, player_pos, pickup_radius, dt):
         """Move towards player if within pickup radius."""
-        to_player = pygame.math.Vector2(player_pos) - self.pos
-        distance = to_player.magnitude()
+        pos = self.pos
+        dx = player_pos[0] - pos.x
+        dy = player_pos[1] - pos.y
+        dist_sq = dx * dx + dy * dy
         
-        if distance <= pickup_radius:
+        # Fast rejection without a sqrt
+        if not self.is_magnetized:
+            if dist_sq > pickup_radius * pickup_radius:
+                return False
             self.is_magnetized = True
         
-        if self.is_magnetized and distance > 5:
-            # Move towards player
-            direction = to_player.normalize()
-            # Speed increases as we get closer
-            speed = self.magnet_speed * (1 + (pickup_radius - distance) / pickup_radius)
-            self.pos += direction * speed * dt
-            self.rect.center = self.pos
-            return False
-        elif self.is_magnetized and distance <= 5:
+        if dist_sq <= 25:
             # Close enough to collect
             return True
         
+        # Move towards player; speed increases as we get closer
+        distance = math.sqrt(dist_sq)
+        speed = self.magnet_speed * (1 + (pickup_radius - distance) / pickup_radius)
+        step = speed * dt / distance
+        pos.x += dx * step
+        pos.y += dy * step
+        self.rect.center = pos
         return False
     
     def update(self, dt, player_pos, pickup_radius):
@@ -50,27 +91,36 @@ class Drop(pygame.sprite.Sprite):
 class ExperienceGem(Drop):
     """XP gem dropped by enemies."""
     
+    _POOL = []
+    
     def __init__(self, pos, groups, value=1):
         super().__init__(pos, groups)
+        self.tier = None
+        self._reset(pos, value)
+    
+    def _reset(self, pos, value=1):
+        """Reset the gem, redrawing only if its tier changed."""
+        super()._reset(pos)
         
         # Determine gem tier based on value
         if value >= 25:
-            self.tier = 'large'
-            self.data = DROP_SETTINGS['xp_gem_large']
+            tier = 'large'
         elif value >= 5:
-            self.tier = 'medium'
-            self.data = DROP_SETTINGS['xp_gem_medium']
+            tier = 'medium'
         else:
-            self.tier = 'small'
-            self.data = DROP_SETTINGS['xp_gem_small']
+            tier = 'small'
         
         self.value = value
-        self.color = self.data['color']
-        self.size = self.data['size']
-        
-        # Create image
-        self._create_image()
-        self.rect = self.image.get_rect(center=pos)
+        if tier != self.tier:
+            self.tier = tier
+            self.data = _GEM_TIERS[tier]
+            self.color = self.data['color']
+            self.size = self.data['size']
+            
+            # Create image
+            self._create_image()
+            self.rect = self.image.get_rect()
+        self.rect.center = self.pos
         
         # Animation
         self.bob_offset = random.uniform(0, math.pi * 2)
@@ -90,7 +140,7 @@ class ExperienceGem(Drop):
             (2, center)
         ]
         pygame.draw.polygon(self.image, self.color, points)
-        pygame.draw.polygon(self.image, COLORS['white'], points, 1)
+        pygame.draw.polygon(self.image, COLOR_WHITE, points, 1)
         
         # Inner shine
         inner_points = [
@@ -99,7 +149,8 @@ class ExperienceGem(Drop):
             (center, center + 3),
             (center - 3, center)
         ]
-        pygame.draw.polygon(self.image, COLORS['white'], inner_points)
+        pygame.draw.polygon(self.image, COLOR_WHITE, inner_points)
+        self.image = prepare_surface(self.image)
     
     def update(self, dt, player_pos, pickup_radius):
         """Update with bobbing animation."""
@@ -108,13 +159,15 @@ class ExperienceGem(Drop):
         # Bobbing animation when not magnetized
         if not self.is_magnetized:
             self.bob_timer += dt * 3
-            bob = math.sin(self.bob_timer + self.bob_offset) * 2
+            bob = fast_sin(self.bob_timer + self.bob_offset) * 2
             # We don't actually move, just visual effect could be added
 
 
 class HealthPickup(Drop):
     """Health pickup that restores HP."""
     
+    _POOL = []
+    
     def __init__(self, pos, groups):
         super().__init__(pos, groups)
         
@@ -126,6 +179,12 @@ class HealthPickup(Drop):
         # Create image
         self._create_image()
         self.rect = self.image.get_rect(center=pos)
+        self._reset(pos)
+    
+    def _reset(self, pos):
+        """Reset the pickup for reuse."""
+        super()._reset(pos)
+        self.rect.center = self.pos
         
         # Animation
         self.pulse_timer = 0
@@ -147,10 +206,11 @@ class HealthPickup(Drop):
                         (2, center - bar_width//2, size - 4, bar_width))
         
         # White border
-        pygame.draw.rect(self.image, COLORS['white'],
+        pygame.draw.rect(self.image, COLOR_WHITE,
                         (center - bar_width//2, 2, bar_width, size - 4), 1)
-        pygame.draw.rect(self.image, COLORS['white'],
+        pygame.draw.rect(self.image, COLOR_WHITE,
                         (2, center - bar_width//2, size - 4, bar_width), 1)
+        self.image = prepare_surface(self.image)
     
     def update(self, dt, player_pos, pickup_radius):
         """Update with pulsing animation."""
@@ -158,13 +218,15 @@ class HealthPickup(Drop):
         
         # Pulsing effect
         self.pulse_timer += dt * 4
-        scale = 1 + math.sin(self.pulse_timer) * 0.1
+        scale = 1 + fast_sin(self.pulse_timer) * 0.1
         # Visual effect only, not actually scaling
 
 
 class Chest(Drop):
     """Chest that grants random rewards when collected."""
     
+    _POOL = []
+    
     def __init__(self, pos, groups):
         super().__init__(pos, groups)
         
@@ -178,6 +240,12 @@ class Chest(Drop):
         # Create image
         self._create_image()
         self.rect = self.image.get_rect(center=pos)
+        self._reset(pos)
+    
+    def _reset(self, pos):
+        """Reset the chest for reuse."""
+        super()._reset(pos)
+        self.rect.center = self.pos
         
         # Animation
         self.sparkle_timer = 0
@@ -190,26 +258,26 @@ class Chest(Drop):
         # Chest body
         body_rect = pygame.Rect(2, self.size // 2, size - 4, self.size)
         pygame.draw.rect(self.image, self.color, body_rect)
-        pygame.draw.rect(self.image, COLORS['brown'], body_rect, 2)
+        pygame.draw.rect(self.image, COLOR_BROWN, body_rect, 2)
         
         # Chest lid
         lid_rect = pygame.Rect(2, 2, size - 4, self.size // 2 + 2)
         pygame.draw.rect(self.image, self.color, lid_rect)
-        pygame.draw.rect(self.image, COLORS['brown'], lid_rect, 2)
+        pygame.draw.rect(self.image, COLOR_BROWN, lid_rect, 2)
         
         # Lock/clasp
         clasp_rect = pygame.Rect(self.size - 4, self.size // 2 - 2, 8, 8)
-        pygame.draw.rect(self.image, COLORS['white'], clasp_rect)
+        pygame.draw.rect(self.image, COLOR_WHITE, clasp_rect)
+        self.image = prepare_surface(self.image)
     
     def magnetize(self, player_pos, pickup_radius, dt):
         """Chests don't magnetize, check direct collision."""
-        to_player = pygame.math.Vector2(player_pos) - self.pos
-        distance = to_player.magnitude()
+        dx = player_pos[0] - self.pos.x
+        dy = player_pos[1] - self.pos.y
+        reach = self.size + 10
         
         # Only collect when very close
-        if distance <= self.size + 10:
-            return True
-        return False
+        return dx * dx + dy * dy <= reach * reach
     
     def update(self, dt, player_pos, pickup_radius):
         """Update with sparkle effect."""
@@ -226,20 +294,38 @@ class DropManager:
     def __init__(self, drop_group, all_sprites_group):
         self.drop_group = drop_group
         self.all_sprites_group = all_sprites_group
+        
+        # Grid so only drops near the player are updated each frame
+        self.grid = SpatialGrid(cell_size=128)
+        self.magnetized = set()
+        self._to_kill = []
+        self.chest_reach = DROP_SETTINGS['chest']['size'] + 10
     
     def spawn_xp_gem(self, pos, value):
         """Spawn an XP gem at position."""
-        gem = ExperienceGem(pos, [self.drop_group, self.all_sprites_group], value)
+        gem = ExperienceGem.spawn(pos, [self.drop_group, self.all_sprites_group], value)
+        self.grid.insert(gem, gem.pos)
         return gem
     
+    def spawn_xp_gems(self, positions, values):
+        """Spawn several XP gems, adding them to each group in one call."""
+        gems = [ExperienceGem.spawn(pos, (), value) for pos, value in zip(positions, values)]
+        self.drop_group.add(*gems)
+        self.all_sprites_group.add(*gems)
+        for gem in gems:
+            self.grid.insert(gem, gem.pos)
+        return gems
+    
     def spawn_health_pickup(self, pos):
         """Spawn a health pickup at position."""
-        pickup = HealthPickup(pos, [self.drop_group, self.all_sprites_group])
+        pickup = HealthPickup.spawn(pos, [self.drop_group, self.all_sprites_group])
+        self.grid.insert(pickup, pickup.pos)
         return pickup
     
     def spawn_chest(self, pos):
         """Spawn a chest at position."""
-        chest = Chest(pos, [self.drop_group, self.all_sprites_group])
+        chest = Chest.spawn(pos, [self.drop_group, self.all_sprites_group])
+        self.grid.insert(chest, chest.pos)
         return chest
     
     def spawn_enemy_drops(self, enemy):
@@ -252,7 +338,7 @@ class DropManager:
         self.spawn_xp_gem(pos, xp_value)
         
         # Chance for health pickup
-        if random.random() < DROP_SETTINGS['health_pickup']['drop_chance']:
+        if random.random() < _HEALTH_DROP_CHANCE:
             # Offset slightly so they don't overlap
             offset_pos = pos + pygame.math.Vector2(
                 random.uniform(-10, 10),
@@ -261,7 +347,7 @@ class DropManager:
             self.spawn_health_pickup(offset_pos)
         
         # Chance for chest
-        if random.random() < DROP_SETTINGS['chest']['drop_chance']:
+        if random.random() < _CHEST_DROP_CHANCE:
             offset_pos = pos + pygame.math.Vector2(
                 random.uniform(-15, 15),
                 random.uniform(-15, 15)
@@ -274,8 +360,15 @@ class DropManager:
         collected_health = 0
         collected_chests = []
         
-        for drop in list(self.drop_group):
-            drop.update(dt, player.pos, player.pickup_radius)
+        # Only drops in reach of the player, or already flying toward them, can change
+        player_pos = player.pos
+        pickup_radius = player.pickup_radius
+        reach = max(pickup_radius, self.chest_reach)
+        nearby = self.magnetized.union(self.grid.query(player_pos, reach))
+        to_kill = self._to_kill
+        
+        for drop in nearby:
+            drop.update(dt, player_pos, pickup_radius)
             
             if drop.collected:
                 if isinstance(drop, ExperienceGem):
@@ -285,7 +378,20 @@ class DropManager:
                 elif isinstance(drop, Chest):
                     collected_chests.append(drop)
                 
-                drop.kill()
+                to_kill.append(drop)
+            elif drop.is_magnetized:
+                self.magnetized.add(drop)
+                self.grid.move(drop, drop.pos)
+        
+        # Remove collected drops from the groups in one batch
+        if to_kill:
+            self.drop_group.remove(*to_kill)
+            self.all_sprites_group.remove(*to_kill)
+            for drop in to_kill:
+                self.grid.remove(drop)
+                self.magnetized.discard(drop)
+                drop.recycle()
+            to_kill.clear()
         
         return {
             'xp': collected_xp,
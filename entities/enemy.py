@@ -6,73 +6,188 @@ Enemy entities that chase and attack the player.
 import pygame
 import math
 import random
-from settings import ENEMY_DATA, COLORS, WORLD_WIDTH, WORLD_HEIGHT
-from utils import distance_squared, draw_polygon
+from collections import namedtuple
+from collections.abc import Iterable
+from functools import lru_cache
+from settings import (
+    ENEMY_DATA, WORLD_WIDTH, WORLD_HEIGHT,
+    COLOR_WHITE, COLOR_BLACK, COLOR_RED, COLOR_GOLD
+)
+from utils import SpatialGrid, distance_squared, draw_polygon, prepare_surface
+
+# Largest enemy radius, used to pad spatial grid queries
+MAX_ENEMY_SIZE = max(data['size'] for data in ENEMY_DATA.values())
+
+EnemyStats = namedtuple(
+    'EnemyStats',
+    ['max_hp', 'damage', 'speed', 'xp_value', 'size', 'color', 'shape', 'special']
+)
+
+
+@lru_cache(maxsize=256)
+def _stats_for(enemy_type: str, difficulty_mult: float) -> EnemyStats:
+    """Get the scaled stats for an enemy type at a (quantized) difficulty."""
+    data = ENEMY_DATA.get(enemy_type, ENEMY_DATA['chaser'])
+    return EnemyStats(
+        int(data['hp'] * difficulty_mult),
+        int(data['damage'] * (1 + (difficulty_mult - 1) * 0.5)),
+        data['speed'],
+        data['xp_value'],
+        data['size'],
+        data['color'],
+        data['shape'],
+        data.get('special', None),
+    )
+
+
+def get_enemy_stats(enemy_type: str, difficulty_mult: float = 1.0) -> EnemyStats:
+    """Get memoized enemy stats, quantizing difficulty to steps of 0.05."""
+    return _stats_for(enemy_type, round(difficulty_mult * 20) / 20)
 
 
 class Enemy(pygame.sprite.Sprite):
     """
-    Base enemy class. Enemies chase the player and deal damage on contact.
+    Enemy that chases the player and deals damage on contact.
+    Type-specific looks and behaviors are driven by ENEMY_DATA.
     """
     
-    def __init__(self, pos, groups, enemy_type='chaser', difficulty_mult=1.0):
+    # Pre-rendered surfaces shared by every enemy with the same look
+    _IMAGE_CACHE = {}
+    
+    # White shape masks keyed by (shape, size) and flashed images keyed like _IMAGE_CACHE
+    _FLASH_MASKS = {}
+    _FLASH_CACHE = {}
+    
+    # Dead enemies kept for reuse, keyed by enemy type
+    _POOL = {}
+    
+    # How long the white hit flash stays up (seconds)
+    FLASH_DURATION = 0.08
+    
+    def __init__(self, pos, groups, enemy_type='chaser', difficulty_mult=1.0, stats=None):
         super().__init__(groups)
         
         # Get enemy data
         self.enemy_type = enemy_type
-        self.data = ENEMY_DATA.get(enemy_type, ENEMY_DATA['chaser']).copy()
-        
-        # Apply difficulty scaling
-        self.difficulty_mult = difficulty_mult
-        
-        # Stats
-        self.max_hp = int(self.data['hp'] * difficulty_mult)
-        self.hp = self.max_hp
-        self.damage = int(self.data['damage'] * (1 + (difficulty_mult - 1) * 0.5))
-        self.speed = self.data['speed']
-        self.xp_value = self.data['xp_value']
+        if stats is None:
+            stats = get_enemy_stats(enemy_type, difficulty_mult)
         
         # Visual
-        self.size = self.data['size']
-        self.color = self.data['color']
-        self.shape = self.data['shape']
+        self.size = stats.size
+        self.color = stats.color
+        self.shape = stats.shape
+        
+        # World clamp bounds (min_x, max_x, min_y, max_y) for this size
+        self.bounds = (
+            self.size, WORLD_WIDTH - self.size,
+            self.size, WORLD_HEIGHT - self.size
+        )
         
         # Position
         self.pos = pygame.math.Vector2(pos)
         self.direction = pygame.math.Vector2()
+        self.knockback = pygame.math.Vector2()
+        
+        # Special behaviors
+        self.special = stats.special
+        self.is_boss = enemy_type == 'boss'
         
-        # Create image
-        self._create_image()
+        # Image (shared until a hit flash needs a private copy)
+        self._base_image = self._get_base_image()
+        if self.special == 'phase':
+            # Own copy of the image since the alpha is animated per ghost
+            self._base_image = self._base_image.copy()
+        self.image = self._base_image
+        self._flash_timer = 0
         self.rect = self.image.get_rect(center=pos)
         self.hitbox = self.rect.inflate(-4, -4)
         
+        self.life = 0
+        self._reset(pos, difficulty_mult, stats)
+    
+    def _reset(self, pos, difficulty_mult, stats=None):
+        """Reset per-life state so a pooled enemy can be reused."""
+        # Per-life token: hit records keyed on (enemy, life) don't carry over
+        # from this object's previous life in the pool
+        self.life += 1
+        
+        # Apply difficulty scaling
+        self.difficulty_mult = difficulty_mult
+        
+        # Stats (callers spawning a batch resolve them once and pass them in)
+        if stats is None:
+            stats = get_enemy_stats(self.enemy_type, difficulty_mult)
+        self.max_hp = stats.max_hp
+        self.hp = self.max_hp
+        self.damage = stats.damage
+        self.speed = stats.speed
+        self.xp_value = stats.xp_value
+        
+        # Position
+        self.pos.update(pos)
+        self.direction.update(0, 0)
+        self.rect.center = self.pos
+        self.hitbox.center = self.rect.center
+        
+        # Image
+        self.image = self._base_image
+        self._flash_timer = 0
+        
+        # Spatial grid membership (set by update_enemies)
+        self._grid = None
+        self._hash_cell = None
+        
         # State
-        self.knockback = pygame.math.Vector2()
+        self.knockback.update(0, 0)
         self.knockback_timer = 0
         
         # Special behaviors
-        self.special = self.data.get('special', None)
         self.special_timer = 0
         self.zigzag_direction = 1
+        if self.special == 'phase':
+            self.alpha = 255
+            self.alpha_direction = -1
+            self._base_image.set_alpha(255)
         
         # Damage cooldown (to prevent instant multi-hits)
         self.damage_cooldown = 0
     
+    def kill(self):
+        """Remove from all groups and return to the pool for reuse."""
+        if self.alive():
+            super().kill()
+            if self._grid is not None:
+                self._grid.remove(self)
+                self._grid = None
+            Enemy._POOL.setdefault(self.enemy_type, []).append(self)
+    
+    def _get_base_image(self):
+        """Get the shared image for this enemy, rendering it on first use."""
+        key = (self.enemy_type, self.size, self.shape, self.color)
+        image = Enemy._IMAGE_CACHE.get(key)
+        if image is None:
+            image = prepare_surface(self._create_image())
+            Enemy._IMAGE_CACHE[key] = image
+        return image
+    
     def _create_image(self):
         """Create the enemy's visual representation based on shape."""
+        if self.is_boss:
+            return self._create_boss_image()
+        
         size = self.size * 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (self.size, self.size)
         
         if self.shape == 'circle':
-            pygame.draw.circle(self.image, self.color, center, self.size)
-            pygame.draw.circle(self.image, COLORS['white'], center, self.size, 2)
+            pygame.draw.circle(image, self.color, center, self.size)
+            pygame.draw.circle(image, COLOR_WHITE, center, self.size, 2)
         
         elif self.shape == 'square':
             rect = pygame.Rect(0, 0, self.size * 2 - 4, self.size * 2 - 4)
             rect.center = center
-            pygame.draw.rect(self.image, self.color, rect)
-            pygame.draw.rect(self.image, COLORS['white'], rect, 2)
+            pygame.draw.rect(image, self.color, rect)
+            pygame.draw.rect(image, COLOR_WHITE, rect, 2)
         
         elif self.shape == 'triangle':
             points = [
@@ -80,17 +195,46 @@ class Enemy(pygame.sprite.Sprite):
                 (2, self.size * 2 - 2),
                 (self.size * 2 - 2, self.size * 2 - 2)
             ]
-            pygame.draw.polygon(self.image, self.color, points)
-            pygame.draw.polygon(self.image, COLORS['white'], points, 2)
+            pygame.draw.polygon(image, self.color, points)
+            pygame.draw.polygon(image, COLOR_WHITE, points, 2)
+        
+        return image
+    
+    def _create_boss_image(self):
+        """Create a more impressive boss image."""
+        size = self.size * 2
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (self.size, self.size)
+        
+        # Outer glow
+        pygame.draw.circle(image, (*self.color[:3], 100), center, self.size + 4)
+        
+        # Main body
+        pygame.draw.rect(image, self.color, 
+                        (4, 4, self.size * 2 - 8, self.size * 2 - 8))
+        pygame.draw.rect(image, COLOR_GOLD, 
+                        (4, 4, self.size * 2 - 8, self.size * 2 - 8), 3)
+        
+        # Inner detail
+        inner_rect = pygame.Rect(0, 0, self.size, self.size)
+        inner_rect.center = center
+        pygame.draw.rect(image, COLOR_BLACK, inner_rect)
+        pygame.draw.rect(image, COLOR_RED, inner_rect, 2)
+        
+        return image
     
     def take_damage(self, damage, knockback_dir=None):
-        """Take damage and apply knockback."""
+        """Take damage and apply knockback along an (x, y) direction."""
         self.hp -= damage
         
-        # Apply knockback
-        if knockback_dir and knockback_dir.magnitude() > 0:
-            self.knockback = knockback_dir.normalize() * 200
-            self.knockback_timer = 0.1
+        # Apply knockback; a plain tuple is copied straight into the Vector2
+        if knockback_dir is not None:
+            kx, ky = knockback_dir
+            if kx or ky:
+                knockback = self.knockback
+                knockback.update(kx, ky)
+                knockback.scale_to_length(200)
+                self.knockback_timer = 0.1
         
         # Flash effect (change color briefly)
         self._flash()
@@ -102,66 +246,56 @@ class Enemy(pygame.sprite.Sprite):
     
     def _flash(self):
         """Flash white when hit."""
+        # Already flashing: just extend it instead of redrawing
+        if self._flash_timer > 0:
+            self._flash_timer = self.FLASH_DURATION
+            return
+        
+        if self.special == 'phase':
+            # Ghosts animate their own alpha, so they flash a private copy
+            self.image = self._base_image.copy()
+            self.image.blit(self._get_flash_mask(), (0, 0), special_flags=pygame.BLEND_ADD)
+        else:
+            self.image = self._get_flash_image()
+        self._flash_timer = self.FLASH_DURATION
+    
+    def _get_flash_image(self):
+        """Get the shared flashed image for this enemy's look."""
+        key = (self.enemy_type, self.size, self.shape, self.color)
+        image = Enemy._FLASH_CACHE.get(key)
+        if image is None:
+            image = self._base_image.copy()
+            image.blit(self._get_flash_mask(), (0, 0), special_flags=pygame.BLEND_ADD)
+            Enemy._FLASH_CACHE[key] = image
+        return image
+    
+    def _get_flash_mask(self):
+        """Get the white mask for this enemy's shape, drawing it on first use."""
+        key = (self.shape, self.size)
+        mask = Enemy._FLASH_MASKS.get(key)
+        if mask is not None:
+            return mask
+        
         size = self.size * 2
-        flash_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        mask = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (self.size, self.size)
         
         if self.shape == 'circle':
-            pygame.draw.circle(flash_surface, COLORS['white'], center, self.size)
+            pygame.draw.circle(mask, COLOR_WHITE, center, self.size)
         elif self.shape == 'square':
             rect = pygame.Rect(0, 0, self.size * 2 - 4, self.size * 2 - 4)
             rect.center = center
-            pygame.draw.rect(flash_surface, COLORS['white'], rect)
+            pygame.draw.rect(mask, COLOR_WHITE, rect)
         elif self.shape == 'triangle':
             points = [
                 (self.size, 2),
                 (2, self.size * 2 - 2),
                 (self.size * 2 - 2, self.size * 2 - 2)
             ]
-            pygame.draw.polygon(flash_surface, COLORS['white'], points)
+            pygame.draw.polygon(mask, COLOR_WHITE, points)
         
-        # Blend with original
-        self.image.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_ADD)
-    
-    def move_towards_player(self, player_pos, dt):
-        """Move towards the player position."""
-        # Calculate direction to player
-        to_player = pygame.math.Vector2(player_pos) - self.pos
-        
-        if to_player.magnitude() > 0:
-            self.direction = to_player.normalize()
-        
-        # Apply special movement patterns
-        if self.special == 'zigzag':
-            self.special_timer += dt
-            if self.special_timer >= 0.3:
-                self.special_timer = 0
-                self.zigzag_direction *= -1
-            
-            # Add perpendicular movement
-            perp = pygame.math.Vector2(-self.direction.y, self.direction.x)
-            self.direction += perp * 0.5 * self.zigzag_direction
-            if self.direction.magnitude() > 0:
-                self.direction = self.direction.normalize()
-        
-        # Apply knockback
-        if self.knockback_timer > 0:
-            self.knockback_timer -= dt
-            movement = self.knockback * dt
-        else:
-            movement = self.direction * self.speed * dt
-            self.knockback = pygame.math.Vector2()
-        
-        # Update position
-        self.pos += movement
-        
-        # Clamp to world bounds
-        self.pos.x = max(self.size, min(WORLD_WIDTH - self.size, self.pos.x))
-        self.pos.y = max(self.size, min(WORLD_HEIGHT - self.size, self.pos.y))
-        
-        # Update rect
-        self.rect.center = self.pos
-        self.hitbox.center = self.rect.center
+        Enemy._FLASH_MASKS[key] = mask
+        return mask
     
     def can_damage(self):
         """Check if enemy can deal damage (cooldown check)."""
@@ -173,14 +307,20 @@ class Enemy(pygame.sprite.Sprite):
     
     def update(self, dt, player_pos):
         """Update the enemy."""
-        self.move_towards_player(player_pos, dt)
-        
-        # Update damage cooldown
-        if self.damage_cooldown > 0:
-            self.damage_cooldown -= dt
+        update_enemies((self,), dt, player_pos)
+    
+    def update_phase(self, dt):
+        """Animate the phasing effect."""
+        # Phasing effect
+        self.alpha += self.alpha_direction * 200 * dt
+        if self.alpha <= 100:
+            self.alpha = 100
+            self.alpha_direction = 1
+        elif self.alpha >= 255:
+            self.alpha = 255
+            self.alpha_direction = -1
         
-        # Recreate image (reset flash)
-        self._create_image()
+        self.image.set_alpha(int(self.alpha))
     
     def get_drop_info(self):
         """Get information about what this enemy drops."""
@@ -190,96 +330,157 @@ class Enemy(pygame.sprite.Sprite):
         }
 
 
-class Chaser(Enemy):
-    """Fast, weak enemy."""
-    
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'chaser', difficulty_mult)
-
-
-class Tank(Enemy):
-    """Slow, strong enemy."""
-    
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'tank', difficulty_mult)
-
-
-class Swarm(Enemy):
-    """Small, fast enemy that spawns in groups."""
+def update_enemies(
+    enemies: list[Enemy],
+    dt: float,
+    player_pos: pygame.Vector2,
+    grid: SpatialGrid | None = None,
+) -> None:
+    """
+    Move every enemy toward the player and tick its timers in one pass.
+    Uses plain float math on locals instead of Vector2 temporaries, and
+    does as few attribute lookups and method calls per enemy as possible.
+    If a grid is given, enemies are re-bucketed only when they change cell.
+    """
+    px, py = player_pos
+    sqrt = math.sqrt
+    if grid is not None:
+        cell_size = grid.cell_size
     
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'swarm', difficulty_mult)
+    for enemy in enemies:
+        pos = enemy.pos
+        direction = enemy.direction
+        x, y = pos
+        
+        # Calculate direction to player
+        dx = px - x
+        dy = py - y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 0:
+            inv = 1 / sqrt(dist_sq)
+            dir_x = dx * inv
+            dir_y = dy * inv
+        else:
+            dir_x, dir_y = direction
+        
+        # Apply special movement patterns
+        special = enemy.special
+        if special == 'zigzag':
+            enemy.special_timer += dt
+            if enemy.special_timer >= 0.3:
+                enemy.special_timer = 0
+                enemy.zigzag_direction *= -1
+            
+            # Add perpendicular movement
+            side = 0.5 * enemy.zigzag_direction
+            dir_x, dir_y = dir_x - dir_y * side, dir_y + dir_x * side
+            length_sq = dir_x * dir_x + dir_y * dir_y
+            if length_sq > 0:
+                inv = 1 / sqrt(length_sq)
+                dir_x *= inv
+                dir_y *= inv
+        
+        direction.update(dir_x, dir_y)
+        
+        # Apply knockback
+        if enemy.knockback_timer > 0:
+            enemy.knockback_timer -= dt
+            kx, ky = enemy.knockback
+            x += kx * dt
+            y += ky * dt
+        else:
+            step = enemy.speed * dt
+            x += dir_x * step
+            y += dir_y * step
+        
+        # Clamp to world bounds
+        min_x, max_x, min_y, max_y = enemy.bounds
+        if x < min_x:
+            x = min_x
+        elif x > max_x:
+            x = max_x
+        if y < min_y:
+            y = min_y
+        elif y > max_y:
+            y = max_y
+        pos.update(x, y)
+        
+        # Update rect
+        rect = enemy.rect
+        rect.center = pos
+        enemy.hitbox.center = rect.center
+        if grid is not None:
+            cell = (int(x // cell_size), int(y // cell_size))
+            if cell != enemy._hash_cell:
+                enemy._hash_cell = cell
+                enemy._grid = grid
+                grid.move(enemy, pos)
+        
+        # Update damage cooldown
+        if enemy.damage_cooldown > 0:
+            enemy.damage_cooldown -= dt
+        
+        # Swap back to the shared image once the flash runs out
+        if enemy._flash_timer > 0:
+            enemy._flash_timer -= dt
+            if enemy._flash_timer <= 0:
+                enemy.image = enemy._base_image
+        
+        if special == 'phase':
+            enemy.update_phase(dt)
 
 
-class Ghost(Enemy):
-    """Enemy with phasing visual effect."""
+class EnemyManager:
+    """Manages per-frame updates for all enemies."""
     
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'ghost', difficulty_mult)
-        self.alpha = 255
-        self.alpha_direction = -1
+    def __init__(self, enemy_group, grid=None):
+        self.enemy_group = enemy_group
+        self.grid = grid
     
     def update(self, dt, player_pos):
-        super().update(dt, player_pos)
-        
-        # Phasing effect
-        self.alpha += self.alpha_direction * 200 * dt
-        if self.alpha <= 100:
-            self.alpha = 100
-            self.alpha_direction = 1
-        elif self.alpha >= 255:
-            self.alpha = 255
-            self.alpha_direction = -1
-        
-        self.image.set_alpha(int(self.alpha))
+        """Update all enemies in a single batched pass and keep the grid current."""
+        # ActiveGroup hands back its cached member list, so no per-frame copy
+        update_enemies(self.enemy_group.sprites(), dt, player_pos, self.grid)
 
 
-class Bat(Enemy):
-    """Fast enemy with zigzag movement."""
-    
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'bat', difficulty_mult)
+def create_enemy(enemy_type, pos, groups, difficulty_mult=1.0):
+    """Factory function to create enemies by type, reusing pooled ones."""
+    return create_enemies(enemy_type, (pos,), groups, difficulty_mult)[0]
 
 
-class Boss(Enemy):
-    """Large, powerful enemy that spawns periodically."""
+def create_enemies(
+    enemy_type: str,
+    positions: Iterable[tuple[float, float]],
+    groups: Iterable[pygame.sprite.AbstractGroup],
+    difficulty_mult: float = 1.0,
+) -> list[Enemy]:
+    """Create several enemies of one type, adding them to each group in one call."""
+    if enemy_type not in ENEMY_DATA:
+        enemy_type = 'chaser'
+    pool = Enemy._POOL.get(enemy_type, ())
     
-    def __init__(self, pos, groups, difficulty_mult=1.0):
-        super().__init__(pos, groups, 'boss', difficulty_mult)
-        self.is_boss = True
+    # Every enemy in the batch shares one stats record
+    stats = get_enemy_stats(enemy_type, difficulty_mult)
     
-    def _create_image(self):
-        """Create a more impressive boss image."""
-        size = self.size * 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = (self.size, self.size)
-        
-        # Outer glow
-        pygame.draw.circle(self.image, (*self.color[:3], 100), center, self.size + 4)
-        
-        # Main body
-        pygame.draw.rect(self.image, self.color, 
-                        (4, 4, self.size * 2 - 8, self.size * 2 - 8))
-        pygame.draw.rect(self.image, COLORS['gold'], 
-                        (4, 4, self.size * 2 - 8, self.size * 2 - 8), 3)
-        
-        # Inner detail
-        inner_rect = pygame.Rect(0, 0, self.size, self.size)
-        inner_rect.center = center
-        pygame.draw.rect(self.image, COLORS['black'], inner_rect)
-        pygame.draw.rect(self.image, COLORS['red'], inner_rect, 2)
+    enemies = []
+    for pos in positions:
+        if pool:
+            enemy = pool.pop()
+            enemy._reset(pos, difficulty_mult, stats)
+        else:
+            enemy = Enemy(pos, (), enemy_type, difficulty_mult, stats)
+        enemies.append(enemy)
+    
+    for group in groups:
+        group.add(*enemies)
+    return enemies
 
 
-def create_enemy(enemy_type, pos, groups, difficulty_mult=1.0):
-    """Factory function to create enemies by type."""
-    enemy_classes = {
-        'chaser': Chaser,
-        'tank': Tank,
-        'swarm': Swarm,
-        'ghost': Ghost,
-        'bat': Bat,
-        'boss': Boss,
-    }
-    
-    enemy_class = enemy_classes.get(enemy_type, Chaser)
-    return enemy_class(pos, groups, difficulty_mult)
+def prewarm_enemy_pool(enemy_type: str, count: int) -> None:
+    """Fill the pool so the next spawn burst of this type reuses instead of allocating."""
+    if enemy_type not in ENEMY_DATA:
+        enemy_type = 'chaser'
+    pool = Enemy._POOL.setdefault(enemy_type, [])
+    stats = get_enemy_stats(enemy_type)
+    for _ in range(count - len(pool)):
+        pool.append(Enemy((0, 0), (), enemy_type, 1.0, stats))
@@ -6,10 +6,41 @@ Player entity class with movement, stats, and combat handling.
 import pygame
 import math
 from settings import (
-    PLAYER_SETTINGS, COLORS, WORLD_WIDTH, WORLD_HEIGHT,
+    PLAYER_SETTINGS, COLOR_WHITE, WORLD_WIDTH, WORLD_HEIGHT,
     XP_SETTINGS, WINDOW_WIDTH, WINDOW_HEIGHT
 )
-from utils import clamp, CooldownTimer
+from utils import CooldownTimer, prepare_surface
+
+# Normalized movement vector for each (dx, dy) key combination
+_DIAGONAL = math.sqrt(0.5)
+_DIR_TABLE = {
+    (0, 0): (0.0, 0.0),
+    (1, 0): (1.0, 0.0),
+    (-1, 0): (-1.0, 0.0),
+    (0, 1): (0.0, 1.0),
+    (0, -1): (0.0, -1.0),
+    (1, 1): (_DIAGONAL, _DIAGONAL),
+    (1, -1): (_DIAGONAL, -_DIAGONAL),
+    (-1, 1): (-_DIAGONAL, _DIAGONAL),
+    (-1, -1): (-_DIAGONAL, -_DIAGONAL),
+}
+
+# XP needed to leave each level (index = level - 1); every level needs half
+# the base formula, including the first
+_XP_THRESHOLDS = [
+    (XP_SETTINGS['base_xp_to_level'] + i * XP_SETTINGS['xp_per_level_increase']) // 2
+    for i in range(200)
+]
+
+
+def _xp_to_next_level(level: int) -> int:
+    """Get the XP needed to advance past a level."""
+    if level <= len(_XP_THRESHOLDS):
+        return _XP_THRESHOLDS[level - 1]
+    return (
+        XP_SETTINGS['base_xp_to_level'] +
+        (level - 1) * XP_SETTINGS['xp_per_level_increase']
+    ) // 2
 
 
 class Player(pygame.sprite.Sprite):
@@ -28,6 +59,7 @@ class Player(pygame.sprite.Sprite):
         self.pos = pygame.math.Vector2(pos)
         self.direction = pygame.math.Vector2()
         self.facing = pygame.math.Vector2(1, 0)  # Direction player is facing
+        self._facing_dirty = False  # Set when facing changes so the image is re-rotated
         
         # Base stats (from settings)
         self.base_stats = PLAYER_SETTINGS.copy()
@@ -47,6 +79,12 @@ class Player(pygame.sprite.Sprite):
         self.color = self.base_stats['color']
         self._create_image()
         
+        # World clamp bounds (min_x, max_x, min_y, max_y) for this size
+        self.bounds = (
+            self.size, WORLD_WIDTH - self.size,
+            self.size, WORLD_HEIGHT - self.size
+        )
+        
         # Rect for collision
         self.rect = self.image.get_rect(center=pos)
         self.hitbox = self.rect.inflate(-8, -8)
@@ -55,15 +93,17 @@ class Player(pygame.sprite.Sprite):
         self.level = 1
         self.xp = 0
         # First level up (to level 2) requires half the base XP
-        self.xp_to_next_level = XP_SETTINGS['base_xp_to_level'] // 2
+        self.xp_to_next_level = _xp_to_next_level(1)
         
         # Combat
         self.i_frames_duration = self.base_stats['i_frames_duration']
         self.i_frames_timer = 0
         self.is_invincible = False
-        self.flash_timer = 0
         self.visible = True
         
+        # Cached stats dict (None when stale)
+        self._stats_dict = None
+        
         # Stats tracking
         self.kills = 0
         self.damage_dealt = 0
@@ -82,7 +122,7 @@ class Player(pygame.sprite.Sprite):
         # Draw player as a circle with a direction indicator
         center = (self.size, self.size)
         pygame.draw.circle(self.base_image, self.color, center, self.size)
-        pygame.draw.circle(self.base_image, COLORS['white'], center, self.size, 2)
+        pygame.draw.circle(self.base_image, COLOR_WHITE, center, self.size, 2)
         
         # Direction indicator (small triangle) - pointing right (0 degrees)
         indicator_points = [
@@ -90,10 +130,23 @@ class Player(pygame.sprite.Sprite):
             (self.size + self.size * 0.3, self.size - self.size * 0.3),
             (self.size + self.size * 0.3, self.size + self.size * 0.3),
         ]
-        pygame.draw.polygon(self.base_image, COLORS['white'], indicator_points)
+        pygame.draw.polygon(self.base_image, COLOR_WHITE, indicator_points)
+        self.base_image = prepare_surface(self.base_image)
+        
+        # Pre-bake rotated copies so turning is just an index lookup
+        self._rotation_steps = 64
+        self._rot_cache = [
+            prepare_surface(pygame.transform.rotate(self.base_image, i * 360 / self._rotation_steps))
+            for i in range(self._rotation_steps)
+        ]
+        
+        # Faded copies shown during i-frame flashes
+        self._flash_rot_cache = [self._create_flash_image(image) for image in self._rot_cache]
+        self._last_bucket = 0
+        self._image_visible = True
         
         # Set initial image
-        self.image = self.base_image.copy()
+        self.image = self._rot_cache[0]
     
     def _update_image_rotation(self):
         """Rotate the player image to match the facing direction."""
@@ -102,54 +155,74 @@ class Player(pygame.sprite.Sprite):
         # Pygame rotation is counter-clockwise, and atan2 gives angle from positive x-axis
         angle = math.degrees(math.atan2(-self.facing.y, self.facing.x))
         
-        # Rotate the base image
-        self.image = pygame.transform.rotate(self.base_image, angle)
+        # Pick the nearest pre-rotated image; nothing to do if it hasn't changed
+        steps = self._rotation_steps
+        bucket = int((angle % 360) * steps / 360 + 0.5) % steps
+        if bucket == self._last_bucket:
+            return
+        self._last_bucket = bucket
+        self._apply_image()
         
         # Update rect to keep the player centered after rotation
         self.rect = self.image.get_rect(center=self.pos)
         self.hitbox.center = self.rect.center
 
-    def _create_flash_image(self):
-        """Create a flashing white image for i-frames."""
-        flash_image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        center = (self.size, self.size)
-        pygame.draw.circle(flash_image, COLORS['white'], center, self.size)
-        return flash_image
+    def _create_flash_image(self, image):
+        """Create the faded copy of an image shown during i-frame flashes."""
+        # Bake the fade into the per-pixel alpha so blits need no surface alpha
+        flash_image = image.copy()
+        flash_image.fill((255, 255, 255, 100), special_flags=pygame.BLEND_RGBA_MULT)
+        return prepare_surface(flash_image)
+    
+    def _apply_image(self):
+        """Show the normal or faded image for the current rotation."""
+        cache = self._rot_cache if self.visible else self._flash_rot_cache
+        self.image = cache[self._last_bucket]
+        self._image_visible = self.visible
     
     def input(self):
         """Handle player input for movement."""
         keys = pygame.key.get_pressed()
         
-        # Reset direction
-        self.direction.x = 0
-        self.direction.y = 0
-        
-        # WASD / Arrow keys
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.direction.y = -1
+        # WASD / Arrow keys (down and right win when both are held)
         if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.direction.y = 1
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.direction.x = -1
+            dy = 1
+        elif keys[pygame.K_w] or keys[pygame.K_UP]:
+            dy = -1
+        else:
+            dy = 0
         if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.direction.x = 1
-        
-        # Normalize to prevent faster diagonal movement
-        if self.direction.magnitude() > 0:
-            self.direction = self.direction.normalize()
-            self.facing = self.direction.copy()
+            dx = 1
+        elif keys[pygame.K_a] or keys[pygame.K_LEFT]:
+            dx = -1
+        else:
+            dx = 0
+        
+        # Table lookup instead of normalizing (prevents faster diagonal movement)
+        nx, ny = _DIR_TABLE[(dx, dy)]
+        self.direction.update(nx, ny)
+        if (dx or dy) and (nx != self.facing.x or ny != self.facing.y):
+            self.facing.update(nx, ny)
+            self._facing_dirty = True
     
     def move(self, dt):
         """Move the player based on input and speed."""
-        # Calculate movement
-        movement = self.direction * self.move_speed * dt
-        
-        # Update position
-        self.pos += movement
-        
-        # Clamp to world bounds
-        self.pos.x = clamp(self.pos.x, self.size, WORLD_WIDTH - self.size)
-        self.pos.y = clamp(self.pos.y, self.size, WORLD_HEIGHT - self.size)
+        # Calculate movement with scalars (no Vector2 temporaries)
+        step = self.move_speed * dt
+        x = self.pos.x + self.direction.x * step
+        y = self.pos.y + self.direction.y * step
+        
+        # Clamp to world bounds and update position in place
+        min_x, max_x, min_y, max_y = self.bounds
+        if x < min_x:
+            x = min_x
+        elif x > max_x:
+            x = max_x
+        if y < min_y:
+            y = min_y
+        elif y > max_y:
+            y = max_y
+        self.pos.update(x, y)
         
         # Update rect
         self.rect.center = self.pos
@@ -170,6 +243,7 @@ class Player(pygame.sprite.Sprite):
         # Apply armor reduction
         actual_damage = max(1, damage - self.armor)
         self.hp -= actual_damage
+        self._stats_dict = None
         self.damage_taken += actual_damage
         
         # Start i-frames
@@ -187,10 +261,12 @@ class Player(pygame.sprite.Sprite):
     def heal(self, amount):
         """Heal the player."""
         self.hp = min(self.hp + amount, self.max_hp)
+        self._stats_dict = None
     
     def gain_xp(self, amount):
         """Add XP and check for level up."""
         self.xp += amount
+        self._stats_dict = None
         
         # Check for level up
         if self.xp >= self.xp_to_next_level:
@@ -202,14 +278,8 @@ class Player(pygame.sprite.Sprite):
         self.xp -= self.xp_to_next_level
         self.level += 1
         
-        # Calculate XP requirement for next level
-        # From level 2 onwards, XP requirement is reduced by 50%
-        base_xp = (
-            XP_SETTINGS['base_xp_to_level'] + 
-            (self.level - 1) * XP_SETTINGS['xp_per_level_increase']
-        )
-        # Apply 50% reduction for level 2 and onwards
-        self.xp_to_next_level = base_xp // 2
+        # XP requirement for next level (precomputed, already halved)
+        self.xp_to_next_level = _xp_to_next_level(self.level)
         
         # Small HP restore on level up
         self.heal(self.max_hp * 0.1)
@@ -218,41 +288,69 @@ class Player(pygame.sprite.Sprite):
     
     def apply_passive(self, passive_id, passive_data):
         """Apply a passive upgrade to player stats."""
-        stat = passive_data['stat']
-        value = passive_data['value']
-        
-        if stat == 'might':
-            self.might += value
-        elif stat == 'max_hp':
-            self.max_hp += value
-            self.hp += value  # Also heal the added HP
-        elif stat == 'regen':
-            self.regen += value
-        elif stat == 'pickup_radius':
-            self.pickup_radius *= (1 + value)
-        elif stat == 'armor':
-            self.armor += value
-        elif stat == 'move_speed':
-            self.move_speed *= (1 + value)
-        elif stat == 'cooldown_reduction':
-            self.cooldown_reduction += value
+        handler = self._PASSIVE_DISPATCH.get(passive_data['stat'])
+        if handler is None:
+            return
+        handler(self, passive_data['value'])
+        self._stats_dict = None
+    
+    def _apply_might(self, value):
+        """Add flat might."""
+        self.might += value
+    
+    def _apply_max_hp(self, value):
+        """Raise max HP and heal by the same amount."""
+        self.max_hp += value
+        self.hp += value  # Also heal the added HP
+    
+    def _apply_regen(self, value):
+        """Add HP regen per second."""
+        self.regen += value
+    
+    def _apply_pickup_radius(self, value):
+        """Scale pickup radius by a percentage."""
+        self.pickup_radius *= (1 + value)
+    
+    def _apply_armor(self, value):
+        """Add flat armor."""
+        self.armor += value
+    
+    def _apply_move_speed(self, value):
+        """Scale move speed by a percentage."""
+        self.move_speed *= (1 + value)
+    
+    def _apply_cooldown_reduction(self, value):
+        """Add cooldown reduction."""
+        self.cooldown_reduction += value
+    
+    # Stat name -> handler, looked up once per upgrade
+    _PASSIVE_DISPATCH = {
+        'might': _apply_might,
+        'max_hp': _apply_max_hp,
+        'regen': _apply_regen,
+        'pickup_radius': _apply_pickup_radius,
+        'armor': _apply_armor,
+        'move_speed': _apply_move_speed,
+        'cooldown_reduction': _apply_cooldown_reduction,
+    }
     
     def update_i_frames(self, dt):
         """Update invincibility frames."""
-        if self.is_invincible:
-            self.i_frames_timer -= dt
-            
-            # Flash effect
-            self.flash_timer += dt
-            if self.flash_timer >= 0.1:
-                self.flash_timer = 0
-                self.visible = not self.visible
-            
-            # End i-frames
-            if self.i_frames_timer <= 0:
-                self.is_invincible = False
-                self.visible = True
-                self.i_frames_timer = 0
+        if not self.is_invincible:
+            return
+        
+        self.i_frames_timer -= dt
+        
+        # End i-frames
+        if self.i_frames_timer <= 0:
+            self.is_invincible = False
+            self.visible = True
+            self.i_frames_timer = 0
+            return
+        
+        # Flash effect: toggle visibility every 0.1s since the hit
+        elapsed = self.i_frames_duration - self.i_frames_timer
+        self.visible = (int(elapsed * 10) & 1) == 0
     
     def update_regen(self, dt):
         """Update health regeneration."""
@@ -269,15 +367,17 @@ class Player(pygame.sprite.Sprite):
         
         self.input()
         self.move(dt)
-        self._update_image_rotation()
+        
+        # Only re-rotate when facing actually changed
+        if self._facing_dirty:
+            self._facing_dirty = False
+            self._update_image_rotation()
         self.update_i_frames(dt)
         self.update_regen(dt)
         
-        # Update image alpha for flash effect
-        if not self.visible:
-            self.image.set_alpha(100)
-        else:
-            self.image.set_alpha(255)
+        # Swap to the pre-baked faded image only when visibility flips
+        if self.visible != self._image_visible:
+            self._apply_image()
 
     def get_xp_progress(self):
         """Get XP progress as a value from 0 to 1."""
@@ -288,7 +388,17 @@ class Player(pygame.sprite.Sprite):
         return self.hp / self.max_hp
     
     def get_stats_dict(self):
-        """Get current stats as a dictionary."""
+        """Get current stats as a dictionary (rebuilt only after stats change)."""
+        stats = self._stats_dict
+        if stats is None:
+            stats = self._stats_dict = self._build_stats_dict()
+        
+        # Kills are counted by the game loop, so refresh them every call
+        stats['kills'] = self.kills
+        return stats
+    
+    def _build_stats_dict(self):
+        """Build the stats dictionary."""
         return {
             'hp': self.hp,
             'max_hp': self.max_hp,
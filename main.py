@@ -5,15 +5,20 @@ Main entry point for the Vampire Survivors-style roguelite game.
 
 import pygame
 import sys
+import time
 from settings import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, TITLE, COLORS,
+    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, TITLE, COLOR_RED, COLOR_BG,
     WORLD_WIDTH, WORLD_HEIGHT, CHEAT_SETTINGS, XP_SETTINGS, PASSIVE_DATA
 )
-from utils import SoundManager, load_high_score, save_high_score, format_time, draw_text
+from utils import (
+    ActiveGroup, SoundManager, SpatialGrid, load_high_score, save_high_score, format_time, draw_text,
+    get_font, coalesce_mouse_motion
+)
 from systems.camera import CameraGroup
 from systems.spawner import EnemySpawner
 from systems.ui import HUD, LevelUpMenu, PauseMenu, DeathScreen, MainMenu, OptionsMenu, CheatsMenu
 from entities.player import Player
+from entities.enemy import EnemyManager, MAX_ENEMY_SIZE
 from entities.drops import DropManager
 from weapons.controller import WeaponController
 
@@ -49,6 +54,7 @@ class Game:
         self.game_over = False
         self.level_up_active = False
         self.debug_mode = False
+        self.debug_info = {}
         
         # Time tracking
         self.game_time = 0
@@ -61,7 +67,7 @@ class Game:
         self._init_menus()
         
         # Font for watermark
-        self.watermark_font = pygame.font.Font(None, 24)
+        self.watermark_font = get_font(24)
     
     def _init_menus(self):
         """Initialize menu systems."""
@@ -80,9 +86,13 @@ class Game:
     def _init_groups(self):
         """Initialize sprite groups."""
         self.all_sprites = CameraGroup()
-        self.enemy_group = pygame.sprite.Group()
-        self.projectile_group = pygame.sprite.Group()
+        self.enemy_group = ActiveGroup()
+        self.projectile_group = ActiveGroup()
+        self.aura_group = pygame.sprite.Group()
         self.drop_group = pygame.sprite.Group()
+        
+        # Spatial index of enemies (64px cells), kept current by the enemy manager
+        self.enemy_grid = SpatialGrid(cell_size=64)
     
     def _init_entities(self):
         """Initialize game entities."""
@@ -95,7 +105,9 @@ class Game:
             self.player,
             self.projectile_group,
             self.enemy_group,
-            self.all_sprites
+            self.all_sprites,
+            self.enemy_grid,
+            self.aura_group
         )
         
         # Give player starting weapon based on cheat settings
@@ -123,6 +135,9 @@ class Game:
         # Enemy spawner
         self.spawner = EnemySpawner(self.enemy_group, self.all_sprites)
         
+        # Enemy manager
+        self.enemy_manager = EnemyManager(self.enemy_group, self.enemy_grid)
+        
         # Drop manager
         self.drop_manager = DropManager(self.drop_group, self.all_sprites)
     
@@ -142,6 +157,8 @@ class Game:
             sprite.kill()
         for sprite in self.projectile_group:
             sprite.kill()
+        for sprite in self.aura_group:
+            sprite.kill()
         for sprite in self.drop_group:
             sprite.kill()
         
@@ -174,7 +191,7 @@ class Game:
     
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
+        for event in coalesce_mouse_motion(pygame.event.get()):
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -272,58 +289,66 @@ class Game:
         if not self.game_started:
             return
         
+        # Hoist per-frame lookups into locals
+        dt = self.dt
+        player = self.player
+        weapon_controller = self.weapon_controller
+        
         # Update game time
-        self.game_time += self.dt
+        self.game_time += dt
         
         # Update player
-        self.player.update(self.dt)
+        player.update(dt)
         
         # Check for player death
-        if self.player.dead:
+        if player.dead:
             self._handle_player_death()
             return
         
         # Update spawner
-        self.spawner.update(self.dt, self.player.pos)
+        player_pos = player.pos
+        self.spawner.update(dt, player_pos)
         
         # Update enemies
-        for enemy in self.enemy_group:
-            enemy.update(self.dt, self.player.pos)
+        self.enemy_manager.update(dt, player_pos)
         
         # Update weapons
-        weapon_dead_enemies = self.weapon_controller.update(self.dt)
+        weapon_dead_enemies = weapon_controller.update(dt)
         
         # Update projectiles
-        for projectile in self.projectile_group:
-            projectile.update(self.dt)
+        for projectile in self.projectile_group.sprites():
+            projectile.update(dt)
         
         # Handle projectile-enemy collisions
-        damage_dealt, kills, dead_enemies = self.weapon_controller.handle_projectile_collisions()
-        self.player.damage_dealt += damage_dealt
-        self.player.kills += kills
+        damage_dealt, kills, dead_enemies = weapon_controller.handle_projectile_collisions()
+        player.damage_dealt += damage_dealt
+        player.kills += kills
         
         # Combine dead enemies from weapons and projectiles
         if weapon_dead_enemies:
             dead_enemies.extend(weapon_dead_enemies)
         
         # Handle enemy deaths and drops
-        for drop_info in dead_enemies:
-            self.drop_manager.spawn_xp_gem(drop_info['pos'], drop_info['xp_value'])
+        if dead_enemies:
+            self.drop_manager.spawn_xp_gems(
+                [drop_info['pos'] for drop_info in dead_enemies],
+                [drop_info['xp_value'] for drop_info in dead_enemies]
+            )
         
         # Update drops and check collection
-        collected = self.drop_manager.update(self.dt, self.player)
+        collected = self.drop_manager.update(dt, player)
         
         # Apply collected items
         if collected['xp'] > 0:
             # Apply EXP multiplier from cheat settings
             exp_multiplier = self.cheat_settings.get('exp_multiplier', 1.0)
             modified_xp = int(collected['xp'] * exp_multiplier)
-            if self.player.gain_xp(modified_xp):
+            if player.gain_xp(modified_xp):
                 self._trigger_level_up()
             self.sound_manager.play('pickup')
         
         if collected['health'] > 0:
-            self.player.heal(collected['health'])
+            player.heal(collected['health'])
             self.sound_manager.play('pickup')
         
         # Handle chest collection (grants random upgrades)
@@ -335,15 +360,32 @@ class Game:
     
     def _handle_player_enemy_collision(self):
         """Handle collision between player and enemies."""
-        for enemy in self.enemy_group:
-            if self.player.hitbox.colliderect(enemy.hitbox):
-                if enemy.can_damage() and not self.player.is_invincible:
-                    if self.player.get_hit(enemy.damage):
-                        # Player died
-                        self._handle_player_death()
-                        return
-                    enemy.reset_damage_cooldown()
-                    self.sound_manager.play('hit')
+        # Nothing can land during i-frames, so skip the whole check
+        if self.player.is_invincible or self.player.dead:
+            return
+        
+        # Broadphase: only enemies in grid cells around the player whose
+        # damage cooldown has run out
+        hitbox = self.player.hitbox
+        nearby = [
+            enemy for enemy in self.enemy_grid.query_rect(hitbox, MAX_ENEMY_SIZE)
+            if enemy.damage_cooldown <= 0
+        ]
+        if not nearby:
+            return
+        
+        # Narrowphase in one C call; the first hit starts i-frames, so only
+        # one enemy can ever land per frame
+        index = hitbox.collidelist([enemy.hitbox for enemy in nearby])
+        if index < 0:
+            return
+        enemy = nearby[index]
+        if self.player.get_hit(enemy.damage):
+            # Player died
+            self._handle_player_death()
+            return
+        enemy.reset_damage_cooldown()
+        self.sound_manager.play('hit')
     
     def _trigger_level_up(self):
         """Trigger the level up menu."""
@@ -378,7 +420,7 @@ class Game:
         """Draw the cheats enabled watermark."""
         if self.cheat_settings.get('cheats_enabled', False):
             watermark_text = "Cheats Enabled"
-            text_surface = self.watermark_font.render(watermark_text, True, COLORS['red'])
+            text_surface = self.watermark_font.render(watermark_text, True, COLOR_RED)
             text_surface.set_alpha(180)
             # Position in bottom left
             x = 10
@@ -410,32 +452,24 @@ class Game:
             return
         
         # Clear screen
-        self.screen.fill(COLORS['bg_color'])
-        
-        # Draw all sprites with camera offset
-        self.all_sprites.custom_draw(self.player)
+        self.screen.fill(COLOR_BG)
         
-        # Draw projectiles (on top of enemies)
-        for projectile in self.projectile_group:
-            offset_pos = projectile.rect.topleft - self.all_sprites.offset
-            self.screen.blit(projectile.image, offset_pos)
-        
-        # Draw drops
-        for drop in self.drop_group:
-            offset_pos = drop.rect.topleft - self.all_sprites.offset
-            self.screen.blit(drop.image, offset_pos)
+        # Draw all sprites with camera offset (auras, projectiles and drops on top)
+        self.all_sprites.custom_draw(
+            self.player, (self.aura_group, self.projectile_group, self.drop_group)
+        )
         
         # Draw HUD
         debug_info = None
         if self.debug_mode:
-            debug_info = {
-                'FPS': int(self.clock.get_fps()),
-                'Enemies': len(self.enemy_group),
-                'Projectiles': len(self.projectile_group),
-                'Drops': len(self.drop_group),
-                'Player Pos': f"({int(self.player.pos.x)}, {int(self.player.pos.y)})",
-                'Spawn Rate': f"{self.spawner._get_spawn_rate():.1f}/s",
-            }
+            # Reuse one dict, updating its values in place
+            debug_info = self.debug_info
+            debug_info['FPS'] = int(self.clock.get_fps())
+            debug_info['Enemies'] = len(self.enemy_group)
+            debug_info['Projectiles'] = len(self.projectile_group)
+            debug_info['Drops'] = len(self.drop_group)
+            debug_info['Player Pos'] = f"({int(self.player.pos.x)}, {int(self.player.pos.y)})"
+            debug_info['Spawn Rate'] = f"{self.spawner._get_spawn_rate():.1f}/s"
         
         self.hud.draw(self.player, self.game_time, self.player.kills, debug_info)
         
@@ -457,12 +491,18 @@ class Game:
     
     def run(self):
         """Main game loop."""
+        frame_time = 1 / FPS
+        prev = time.perf_counter()
         while self.running:
-            # Calculate delta time
-            self.dt = self.clock.tick(FPS) / 1000.0
+            # Calculate delta time from the high-resolution clock
+            now = time.perf_counter()
             
             # Cap delta time to prevent physics issues
-            self.dt = min(self.dt, 0.1)
+            self.dt = min(now - prev, 0.1)
+            prev = now
+            
+            # Clock is still ticked (without a frame cap) so get_fps keeps working
+            self.clock.tick()
             
             # Handle events
             self.handle_events()
@@ -472,6 +512,15 @@ class Game:
             
             # Draw
             self.draw()
+            
+            # Sleep coarsely, then spin for the last couple of milliseconds so
+            # frame pacing doesn't depend on the OS timer granularity
+            target = prev + frame_time
+            remaining = target - time.perf_counter()
+            if remaining > 0.002:
+                time.sleep(remaining - 0.002)
+            while time.perf_counter() < target:
+                pass
         
         # Cleanup
         pygame.quit()
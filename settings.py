@@ -3,6 +3,8 @@
 Game settings and constants for Vampire Survivors-style roguelite.
 """
 
+from types import MappingProxyType
+
 # Display settings
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
@@ -15,28 +17,51 @@ WORLD_HEIGHT = 2000
 TILE_SIZE = 64
 
 # Colors (RGB)
+COLOR_WHITE = (255, 255, 255)
+COLOR_BLACK = (0, 0, 0)
+COLOR_RED = (255, 0, 0)
+COLOR_GREEN = (0, 255, 0)
+COLOR_BLUE = (0, 0, 255)
+COLOR_YELLOW = (255, 255, 0)
+COLOR_ORANGE = (255, 165, 0)
+COLOR_PURPLE = (128, 0, 128)
+COLOR_CYAN = (0, 255, 255)
+COLOR_PINK = (255, 192, 203)
+COLOR_GRAY = (128, 128, 128)
+COLOR_DARK_GRAY = (64, 64, 64)
+COLOR_LIGHT_GRAY = (192, 192, 192)
+COLOR_DARK_GREEN = (0, 100, 0)
+COLOR_DARK_RED = (139, 0, 0)
+COLOR_GOLD = (255, 215, 0)
+COLOR_SILVER = (192, 192, 192)
+COLOR_BROWN = (139, 69, 19)
+COLOR_BG = (30, 30, 40)
+COLOR_GROUND1 = (40, 40, 50)
+COLOR_GROUND2 = (35, 35, 45)
+
+# Color lookup by name (for code that picks colors dynamically)
 COLORS = {
-    'white': (255, 255, 255),
-    'black': (0, 0, 0),
-    'red': (255, 0, 0),
-    'green': (0, 255, 0),
-    'blue': (0, 0, 255),
-    'yellow': (255, 255, 0),
-    'orange': (255, 165, 0),
-    'purple': (128, 0, 128),
-    'cyan': (0, 255, 255),
-    'pink': (255, 192, 203),
-    'gray': (128, 128, 128),
-    'dark_gray': (64, 64, 64),
-    'light_gray': (192, 192, 192),
-    'dark_green': (0, 100, 0),
-    'dark_red': (139, 0, 0),
-    'gold': (255, 215, 0),
-    'silver': (192, 192, 192),
-    'brown': (139, 69, 19),
-    'bg_color': (30, 30, 40),
-    'ground_color1': (40, 40, 50),
-    'ground_color2': (35, 35, 45),
+    'white': COLOR_WHITE,
+    'black': COLOR_BLACK,
+    'red': COLOR_RED,
+    'green': COLOR_GREEN,
+    'blue': COLOR_BLUE,
+    'yellow': COLOR_YELLOW,
+    'orange': COLOR_ORANGE,
+    'purple': COLOR_PURPLE,
+    'cyan': COLOR_CYAN,
+    'pink': COLOR_PINK,
+    'gray': COLOR_GRAY,
+    'dark_gray': COLOR_DARK_GRAY,
+    'light_gray': COLOR_LIGHT_GRAY,
+    'dark_green': COLOR_DARK_GREEN,
+    'dark_red': COLOR_DARK_RED,
+    'gold': COLOR_GOLD,
+    'silver': COLOR_SILVER,
+    'brown': COLOR_BROWN,
+    'bg_color': COLOR_BG,
+    'ground_color1': COLOR_GROUND1,
+    'ground_color2': COLOR_GROUND2,
 }
 
 # Player settings
@@ -49,7 +74,7 @@ PLAYER_SETTINGS = {
     'armor': 0,
     'regen': 0,  # HP per second
     'size': 24,
-    'color': COLORS['cyan'],
+    'color': COLOR_CYAN,
     'i_frames_duration': 0.5,  # Invincibility frames duration
 }
 
@@ -65,7 +90,7 @@ WEAPON_DATA = {
     'whip': {
         'name': 'Whip',
         'description': 'Horizontal slash in facing direction',
-        'color': COLORS['brown'],
+        'color': COLOR_BROWN,
         'base_damage': 20,
         'base_cooldown': 1.5,
         'base_area': 1.0,
@@ -85,7 +110,7 @@ WEAPON_DATA = {
     'wand': {
         'name': 'Magic Wand',
         'description': 'Fires projectile at nearest enemy',
-        'color': COLORS['blue'],
+        'color': COLOR_BLUE,
         'base_damage': 10,
         'base_cooldown': 1.0,
         'base_area': 1.0,
@@ -105,7 +130,7 @@ WEAPON_DATA = {
     'garlic': {
         'name': 'Garlic',
         'description': 'Damages nearby enemies',
-        'color': COLORS['white'],
+        'color': COLOR_WHITE,
         'base_damage': 5,
         'base_cooldown': 0.5,
         'base_area': 1.0,
@@ -126,7 +151,7 @@ WEAPON_DATA = {
     'axe': {
         'name': 'Axe',
         'description': 'Thrown in high arc, passes through enemies',
-        'color': COLORS['gray'],
+        'color': COLOR_GRAY,
         'base_damage': 25,
         'base_cooldown': 2.0,
         'base_area': 1.0,
@@ -146,7 +171,7 @@ WEAPON_DATA = {
     'knife': {
         'name': 'Knife',
         'description': 'Throws knives in facing direction',
-        'color': COLORS['silver'],
+        'color': COLOR_SILVER,
         'base_damage': 8,
         'base_cooldown': 0.3,
         'base_area': 1.0,
@@ -171,7 +196,7 @@ EVOLUTION_DATA = {
         'name': 'Bloody Whip',
         'base_weapon': 'whip',
         'required_passive': 'might_boost',
-        'color': COLORS['dark_red'],
+        'color': COLOR_DARK_RED,
         'damage_mult': 2.0,
         'special': 'lifesteal',  # Heals on hit
     },
@@ -179,7 +204,7 @@ EVOLUTION_DATA = {
         'name': 'Holy Wand',
         'base_weapon': 'wand',
         'required_passive': 'cooldown_boost',
-        'color': COLORS['gold'],
+        'color': COLOR_GOLD,
         'damage_mult': 1.5,
         'special': 'homing',  # Projectiles home in
     },
@@ -187,7 +212,7 @@ EVOLUTION_DATA = {
         'name': 'Soul Eater',
         'base_weapon': 'garlic',
         'required_passive': 'regen_boost',
-        'color': COLORS['purple'],
+        'color': COLOR_PURPLE,
         'damage_mult': 1.8,
         'special': 'steal_hp',  # Steals HP from enemies
     },
@@ -197,7 +222,7 @@ EVOLUTION_DATA = {
 ENEMY_DATA = {
     'chaser': {
         'name': 'Chaser',
-        'color': COLORS['red'],
+        'color': COLOR_RED,
         'shape': 'circle',
         'size': 16,
         'hp': 10,
@@ -208,7 +233,7 @@ ENEMY_DATA = {
     },
     'tank': {
         'name': 'Tank',
-        'color': COLORS['blue'],
+        'color': COLOR_BLUE,
         'shape': 'square',
         'size': 24,
         'hp': 50,
@@ -219,7 +244,7 @@ ENEMY_DATA = {
     },
     'swarm': {
         'name': 'Swarm',
-        'color': COLORS['green'],
+        'color': COLOR_GREEN,
         'shape': 'triangle',
         'size': 12,
         'hp': 5,
@@ -231,7 +256,7 @@ ENEMY_DATA = {
     },
     'ghost': {
         'name': 'Ghost',
-        'color': COLORS['light_gray'],
+        'color': COLOR_LIGHT_GRAY,
         'shape': 'circle',
         'size': 20,
         'hp': 15,
@@ -243,7 +268,7 @@ ENEMY_DATA = {
     },
     'bat': {
         'name': 'Bat',
-        'color': COLORS['purple'],
+        'color': COLOR_PURPLE,
         'shape': 'triangle',
         'size': 14,
         'hp': 8,
@@ -255,7 +280,7 @@ ENEMY_DATA = {
     },
     'boss': {
         'name': 'Boss',
-        'color': COLORS['dark_red'],
+        'color': COLOR_DARK_RED,
         'shape': 'square',
         'size': 48,
         'hp': 500,
@@ -271,7 +296,7 @@ PASSIVE_DATA = {
     'might_boost': {
         'name': 'Spinach',
         'description': '+10% Might (damage)',
-        'color': COLORS['green'],
+        'color': COLOR_GREEN,
         'stat': 'might',
         'value': 0.1,
         'max_level': 5,
@@ -279,7 +304,7 @@ PASSIVE_DATA = {
     'max_hp_boost': {
         'name': 'Hollow Heart',
         'description': '+20 Max HP',
-        'color': COLORS['red'],
+        'color': COLOR_RED,
         'stat': 'max_hp',
         'value': 20,
         'max_level': 5,
@@ -287,7 +312,7 @@ PASSIVE_DATA = {
     'regen_boost': {
         'name': 'Pummarola',
         'description': '+0.5 HP/s Regen',
-        'color': COLORS['pink'],
+        'color': COLOR_PINK,
         'stat': 'regen',
         'value': 0.5,
         'max_level': 5,
@@ -295,7 +320,7 @@ PASSIVE_DATA = {
     'pickup_boost': {
         'name': 'Attractorb',
         'description': '+20% Pickup Radius',
-        'color': COLORS['yellow'],
+        'color': COLOR_YELLOW,
         'stat': 'pickup_radius',
         'value': 0.2,  # Percentage
         'max_level': 5,
@@ -303,7 +328,7 @@ PASSIVE_DATA = {
     'armor_boost': {
         'name': 'Armor',
         'description': '+1 Armor (damage reduction)',
-        'color': COLORS['gray'],
+        'color': COLOR_GRAY,
         'stat': 'armor',
         'value': 1,
         'max_level': 5,
@@ -311,7 +336,7 @@ PASSIVE_DATA = {
     'speed_boost': {
         'name': 'Wings',
         'description': '+10% Move Speed',
-        'color': COLORS['cyan'],
+        'color': COLOR_CYAN,
         'stat': 'move_speed',
         'value': 0.1,  # Percentage
         'max_level': 5,
@@ -319,7 +344,7 @@ PASSIVE_DATA = {
     'cooldown_boost': {
         'name': 'Empty Tome',
         'description': '-8% Cooldown',
-        'color': COLORS['purple'],
+        'color': COLOR_PURPLE,
         'stat': 'cooldown_reduction',
         'value': 0.08,
         'max_level': 5,
@@ -330,27 +355,27 @@ PASSIVE_DATA = {
 DROP_SETTINGS = {
     'xp_gem_small': {
         'value': 1,
-        'color': COLORS['blue'],
+        'color': COLOR_BLUE,
         'size': 6,
     },
     'xp_gem_medium': {
         'value': 5,
-        'color': COLORS['green'],
+        'color': COLOR_GREEN,
         'size': 8,
     },
     'xp_gem_large': {
         'value': 25,
-        'color': COLORS['yellow'],
+        'color': COLOR_YELLOW,
         'size': 10,
     },
     'health_pickup': {
         'value': 20,
-        'color': COLORS['red'],
+        'color': COLOR_RED,
         'size': 12,
         'drop_chance': 0.02,  # 2% chance
     },
     'chest': {
-        'color': COLORS['gold'],
+        'color': COLOR_GOLD,
         'size': 16,
         'drop_chance': 0.005,  # 0.5% chance
     },
@@ -412,3 +437,23 @@ AVAILABLE_STARTING_WEAPONS = ['whip', 'wand', 'garlic', 'axe', 'knife']
 
 # Available passives for cheat menu
 AVAILABLE_STARTING_PASSIVES = ['might_boost', 'max_hp_boost', 'regen_boost', 'pickup_boost', 'armor_boost', 'speed_boost', 'cooldown_boost']
+
+# Read-only views of the config tables so nothing mutates them at runtime
+# (copy() still returns a plain dict for code that needs its own version)
+COLORS = MappingProxyType(COLORS)
+PLAYER_SETTINGS = MappingProxyType(PLAYER_SETTINGS)
+XP_SETTINGS = MappingProxyType(XP_SETTINGS)
+# Weapons keep a reference to their entry rather than a copy, so the entries
+# (and their scaling tables) are read-only too
+WEAPON_DATA = MappingProxyType({
+    weapon_id: MappingProxyType({**entry, 'scaling': MappingProxyType(entry['scaling'])})
+    for weapon_id, entry in WEAPON_DATA.items()
+})
+EVOLUTION_DATA = MappingProxyType(EVOLUTION_DATA)
+ENEMY_DATA = MappingProxyType(ENEMY_DATA)
+PASSIVE_DATA = MappingProxyType(PASSIVE_DATA)
+DROP_SETTINGS = MappingProxyType(DROP_SETTINGS)
+SPAWNER_SETTINGS = MappingProxyType(SPAWNER_SETTINGS)
+UI_SETTINGS = MappingProxyType(UI_SETTINGS)
+SOUND_SETTINGS = MappingProxyType(SOUND_SETTINGS)
+CHEAT_SETTINGS = MappingProxyType(CHEAT_SETTINGS)
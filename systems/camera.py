@@ -4,9 +4,10 @@ Camera system for following the player and rendering the world.
 """
 
 import pygame
+from operator import itemgetter
 from settings import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT,
-    TILE_SIZE, COLORS
+    TILE_SIZE, COLOR_GROUND1, COLOR_GROUND2, COLOR_DARK_RED, COLOR_GREEN
 )
 
 
@@ -19,61 +20,118 @@ class CameraGroup(pygame.sprite.Group):
     def __init__(self):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
-        self.offset = pygame.math.Vector2()
+        # Camera offset as plain ints (no Vector2 arithmetic on the draw path)
+        self.offset_x = 0
+        self.offset_y = 0
         self.half_width = WINDOW_WIDTH // 2
         self.half_height = WINDOW_HEIGHT // 2
         
-        # Ground surface for tiled background
-        self.ground_surface = self._create_ground_surface()
-        self.ground_rect = self.ground_surface.get_rect(topleft=(0, 0))
+        # Screen-sized checkerboard for the ground, built on first draw; the
+        # world itself is never rendered into one big surface
+        self.ground_surface = None
+        self.ground_rect = pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
         
         # Debug mode
         self.debug_mode = False
     
     def _create_ground_surface(self):
-        """Create a tiled ground surface."""
-        ground = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT))
-        ground.fill(COLORS['bg_color'])
+        """
+        Create a checkerboard one pattern period larger than the window.
+        Blitting it at the camera offset modulo the period covers the screen.
+        """
+        period = TILE_SIZE * 2
         
-        # Draw checkerboard pattern
-        for x in range(0, WORLD_WIDTH, TILE_SIZE):
-            for y in range(0, WORLD_HEIGHT, TILE_SIZE):
-                if (x // TILE_SIZE + y // TILE_SIZE) % 2 == 0:
-                    color = COLORS['ground_color1']
-                else:
-                    color = COLORS['ground_color2']
-                pygame.draw.rect(ground, color, (x, y, TILE_SIZE, TILE_SIZE))
-        
-        # Draw world boundary
-        pygame.draw.rect(ground, COLORS['dark_red'], (0, 0, WORLD_WIDTH, WORLD_HEIGHT), 4)
+        # One 2x2-tile block of the checkerboard
+        block = pygame.Surface((period, period))
+        block.fill(COLOR_GROUND1)
+        block.fill(COLOR_GROUND2, (TILE_SIZE, 0, TILE_SIZE, TILE_SIZE))
+        block.fill(COLOR_GROUND2, (0, TILE_SIZE, TILE_SIZE, TILE_SIZE))
         
+        # Stamp the block across the surface in one batched call
+        width = WINDOW_WIDTH + period
+        height = WINDOW_HEIGHT + period
+        ground = pygame.Surface((width, height))
+        ground.blits(
+            [(block, (x, y)) for x in range(0, width, period) for y in range(0, height, period)],
+            doreturn=False
+        )
         return ground
     
+    def _draw_ground(self, ox, oy):
+        """Draw the visible part of the ground and the world boundary."""
+        if self.ground_surface is None:
+            self.ground_surface = self._create_ground_surface()
+        
+        surface = self.display_surface
+        world_rect = self.ground_rect.move(-ox, -oy)
+        
+        # Align the pattern to the world tile grid and clip it to the world
+        period = TILE_SIZE * 2
+        old_clip = surface.get_clip()
+        surface.set_clip(world_rect.clip(old_clip))
+        surface.blit(self.ground_surface, (-(ox % period), -(oy % period)))
+        surface.set_clip(old_clip)
+        
+        # Draw world boundary
+        pygame.draw.rect(surface, COLOR_DARK_RED, world_rect, 4)
+    
     def center_target_camera(self, target):
         """Center the camera on a target (usually the player)."""
-        self.offset.x = target.rect.centerx - self.half_width
-        self.offset.y = target.rect.centery - self.half_height
+        self.offset_x = target.rect.centerx - self.half_width
+        self.offset_y = target.rect.centery - self.half_height
     
-    def custom_draw(self, player):
-        """Draw all sprites with camera offset."""
+    def custom_draw(self, player, overlay_groups=()):
+        """
+        Draw all sprites with camera offset.
+        Members of overlay_groups are drawn once, on top, in group order.
+        """
         # Center camera on player
         self.center_target_camera(player)
         
         # Draw ground
-        ground_offset = self.ground_rect.topleft - self.offset
-        self.display_surface.blit(self.ground_surface, ground_offset)
+        self._draw_ground(self.offset_x, self.offset_y)
         
-        # Sort sprites by y position for depth effect (optional)
-        # For now, just draw all sprites
-        for sprite in sorted(self.sprites(), key=lambda s: s.rect.centery):
-            offset_pos = sprite.rect.topleft - self.offset
-            self.display_surface.blit(sprite.image, offset_pos)
-            
-            # Debug: draw hitboxes
-            if self.debug_mode:
-                debug_rect = sprite.rect.copy()
-                debug_rect.topleft = offset_pos
-                pygame.draw.rect(self.display_surface, COLORS['green'], debug_rect, 1)
+        # Sprites drawn later as overlays are skipped here so nothing is blitted twice
+        overlay = set()
+        for group in overlay_groups:
+            overlay.update(group.spritedict)
+        base_sprites = [sprite for sprite in self.spritedict if sprite not in overlay]
+        
+        # Sort sprites by y position for depth effect
+        self._draw_sprites(base_sprites, y_sort=True)
+        
+        for group in overlay_groups:
+            self._draw_sprites(group.sprites())
+    
+    def _draw_sprites(self, sprites, y_sort=False):
+        """Blit sprites at their camera-offset positions in one batched call."""
+        ox = self.offset_x
+        oy = self.offset_y
+        
+        # Cull sprites outside the view in one C call before sorting/blitting
+        rects = [sprite.rect for sprite in sprites]
+        view = pygame.Rect(ox, oy, WINDOW_WIDTH, WINDOW_HEIGHT)
+        visible = view.collidelistall(rects)
+        
+        # Rect.move does the offset subtraction in C
+        if y_sort:
+            # Sort on the cached centery, so the sort never touches sprite attributes
+            entries = []
+            for index in visible:
+                rect = rects[index]
+                entries.append((rect.centery, (sprites[index].image, rect.move(-ox, -oy))))
+            entries.sort(key=itemgetter(0))
+            blit_list = [entry[1] for entry in entries]
+        else:
+            blit_list = [(sprites[index].image, rects[index].move(-ox, -oy)) for index in visible]
+        self.display_surface.blits(blit_list, doreturn=False)
+        
+        # Debug: draw hitboxes, reusing the screen rects already built for blitting
+        if self.debug_mode:
+            draw_rect = pygame.draw.rect
+            surface = self.display_surface
+            for _, screen_rect in blit_list:
+                draw_rect(surface, COLOR_GREEN, screen_rect, 1)
     
     def toggle_debug(self):
         """Toggle debug mode."""
@@ -88,26 +146,33 @@ class SimpleCamera:
     """
     
     def __init__(self):
-        self.offset = pygame.math.Vector2()
+        self.offset_x = 0
+        self.offset_y = 0
         self.half_width = WINDOW_WIDTH // 2
         self.half_height = WINDOW_HEIGHT // 2
     
     def update(self, target):
         """Update camera position to follow target."""
-        self.offset.x = target.rect.centerx - self.half_width
-        self.offset.y = target.rect.centery - self.half_height
+        self.offset_x = target.rect.centerx - self.half_width
+        self.offset_y = target.rect.centery - self.half_height
     
     def apply(self, entity):
         """Apply camera offset to an entity's rect."""
-        return entity.rect.move(-self.offset.x, -self.offset.y)
+        return entity.rect.move(-self.offset_x, -self.offset_y)
     
     def apply_pos(self, pos):
         """Apply camera offset to a position."""
-        return (pos[0] - self.offset.x, pos[1] - self.offset.y)
+        return (pos[0] - self.offset_x, pos[1] - self.offset_y)
+    
+    def apply_positions(self, positions):
+        """Apply camera offset to many positions at once."""
+        ox = self.offset_x
+        oy = self.offset_y
+        return [(x - ox, y - oy) for x, y in positions]
     
     def reverse_apply(self, screen_pos):
         """Convert screen position to world position."""
-        return (screen_pos[0] + self.offset.x, screen_pos[1] + self.offset.y)
+        return (screen_pos[0] + self.offset_x, screen_pos[1] + self.offset_y)
 
 
 class ParallaxLayer:
@@ -117,12 +182,16 @@ class ParallaxLayer:
         self.image = image
         self.parallax_factor = parallax_factor
         self.rect = self.image.get_rect()
+        self._width = self.rect.width
+        self._height = self.rect.height
     
     def draw(self, surface, camera_offset):
         """Draw the layer with parallax effect."""
-        offset_x = -camera_offset.x * self.parallax_factor
-        offset_y = -camera_offset.y * self.parallax_factor
+        # Whole pixels, so the wrap below is integer modulo
+        offset_x = int(-camera_offset[0] * self.parallax_factor)
+        offset_y = int(-camera_offset[1] * self.parallax_factor)
         
         # Tile the image if needed
-        surface.blit(self.image, (offset_x % self.rect.width - self.rect.width,
-                                   offset_y % self.rect.height - self.rect.height))
+        width = self._width
+        height = self._height
+        surface.blit(self.image, (offset_x % width - width, offset_y % height - height))
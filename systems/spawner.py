@@ -3,15 +3,20 @@
 Enemy spawner system with difficulty scaling.
 """
 
-import pygame
 import random
 import math
+from itertools import accumulate
 from settings import (
     ENEMY_DATA, SPAWNER_SETTINGS, WINDOW_WIDTH, WINDOW_HEIGHT,
     WORLD_WIDTH, WORLD_HEIGHT
 )
-from entities.enemy import create_enemy
-from utils import get_spawn_position_outside_camera, clamp
+from entities.enemy import create_enemy, create_enemies, prewarm_enemy_pool
+from utils import get_spawn_position_outside_camera
+
+# Bound methods of the shared RNG (so random.seed still applies)
+_random = random.random
+_choice = random.choice
+_choices = random.choices
 
 
 class EnemySpawner:
@@ -44,9 +49,27 @@ class EnemySpawner:
         # Enemy type weights (changes over time)
         self.enemy_weights = self._get_initial_weights()
         
+        # Enemies created per spawn for each type
+        self._spawn_counts = {
+            enemy_type: data.get('spawn_count', 1) for enemy_type, data in ENEMY_DATA.items()
+        }
+        
+        # Cumulative weight table, rebuilt at most once per game time value
+        self._type_table = None
+        self._type_table_time = None
+        
+        # Base weights in a fixed type order, plus a scratch list reused for
+        # the time-adjusted weights
+        self._types = list(self.enemy_weights)
+        self._base_weights = list(self.enemy_weights.values())
+        self._weight_buf = list(self._base_weights)
+        
+        # Indices of types boosted after 2 and 3 minutes
+        self._boost_indices_2 = self._type_indices(('tank',))
+        self._boost_indices_3 = self._type_indices(('tank', 'ghost', 'bat'))
+        
         # Stats
         self.total_spawned = 0
-        self.enemies_alive = 0
     
     def _get_initial_weights(self):
         """Get initial spawn weights for enemy types."""
@@ -68,78 +91,86 @@ class EnemySpawner:
         hp_mult = 1 + self.difficulty_hp_scale * minutes
         return hp_mult
     
-    def _select_enemy_type(self):
-        """Select a random enemy type based on weights."""
-        # Adjust weights based on game time
-        adjusted_weights = self.enemy_weights.copy()
-        minutes = self.game_time / 60
+    def _type_indices(self, enemy_types):
+        """Get the positions of enemy types in the weight lists."""
+        return [i for i, enemy_type in enumerate(self._types) if enemy_type in enemy_types]
+    
+    def _get_type_table(self):
+        """Get enemy types and their cumulative weights for the current time."""
+        if self._type_table_time == self.game_time:
+            return self._type_table
+        
+        # Start from the base weights in the reused scratch list
+        weights = self._weight_buf
+        weights[:] = self._base_weights
         
         # Increase tank and special enemy weights over time
-        if minutes > 2:
-            adjusted_weights['tank'] = adjusted_weights.get('tank', 0) * (1 + minutes * 0.1)
+        minutes = self.game_time / 60
         if minutes > 3:
-            adjusted_weights['ghost'] = adjusted_weights.get('ghost', 0) * (1 + minutes * 0.1)
-            adjusted_weights['bat'] = adjusted_weights.get('bat', 0) * (1 + minutes * 0.1)
-        
-        # Weighted random selection
-        total_weight = sum(adjusted_weights.values())
-        if total_weight == 0:
-            return 'chaser'
-        
-        roll = random.uniform(0, total_weight)
-        cumulative = 0
+            boosted = self._boost_indices_3
+        elif minutes > 2:
+            boosted = self._boost_indices_2
+        else:
+            boosted = ()
+        scale = 1 + minutes * 0.1
+        for i in boosted:
+            weights[i] *= scale
         
-        for enemy_type, weight in adjusted_weights.items():
-            cumulative += weight
-            if roll <= cumulative:
-                return enemy_type
+        self._type_table = (self._types, list(accumulate(weights)))
+        self._type_table_time = self.game_time
+        return self._type_table
+    
+    def _select_enemy_type(self, type_table=None):
+        """Select a random enemy type based on weights."""
+        types, cum_weights = type_table or self._get_type_table()
         
-        return 'chaser'
+        # Weighted random selection (bisect runs in C)
+        if not cum_weights or cum_weights[-1] == 0:
+            return 'chaser'
+        return _choices(types, cum_weights=cum_weights)[0]
     
     def _get_spawn_position(self, player_pos):
         """Get a valid spawn position outside camera view."""
         return get_spawn_position_outside_camera(player_pos, self.spawn_buffer)
     
-    def spawn_enemy(self, player_pos, enemy_type=None):
-        """Spawn a single enemy."""
+    def spawn_enemy(self, player_pos, enemy_type=None, difficulty_mult=None, type_table=None):
+        """
+        Spawn a single enemy.
+        Callers spawning several at once can pass difficulty_mult and
+        type_table so they are computed once per batch.
+        """
         if enemy_type is None:
-            enemy_type = self._select_enemy_type()
+            enemy_type = self._select_enemy_type(type_table)
         
         pos = self._get_spawn_position(player_pos)
-        difficulty_mult = self._get_difficulty_multiplier()
+        if difficulty_mult is None:
+            difficulty_mult = self._get_difficulty_multiplier()
+        positions = [pos]
         
-        enemy = create_enemy(
+        # Handle swarm spawning
+        spawn_count = self._spawn_counts.get(enemy_type, 1)
+        
+        if spawn_count > 1:
+            # Scatter clones within +-30px, kept 50px inside the world
+            px, py = pos
+            rand = _random
+            max_x = WORLD_WIDTH - 50
+            max_y = WORLD_HEIGHT - 50
+            for _ in range(spawn_count - 1):
+                swarm_x = px + rand() * 60 - 30
+                swarm_y = py + rand() * 60 - 30
+                positions.append((min(max(swarm_x, 50), max_x), min(max(swarm_y, 50), max_y)))
+        
+        # Spawn the whole group with one add per sprite group
+        enemies = create_enemies(
             enemy_type,
-            pos,
+            positions,
             [self.enemy_group, self.all_sprites_group],
             difficulty_mult
         )
+        self.total_spawned += len(enemies)
         
-        self.total_spawned += 1
-        
-        # Handle swarm spawning
-        enemy_data = ENEMY_DATA.get(enemy_type, {})
-        spawn_count = enemy_data.get('spawn_count', 1)
-        
-        if spawn_count > 1:
-            for i in range(spawn_count - 1):
-                offset = pygame.math.Vector2(
-                    random.uniform(-30, 30),
-                    random.uniform(-30, 30)
-                )
-                swarm_pos = pos + offset
-                swarm_pos.x = clamp(swarm_pos.x, 50, WORLD_WIDTH - 50)
-                swarm_pos.y = clamp(swarm_pos.y, 50, WORLD_HEIGHT - 50)
-                
-                create_enemy(
-                    enemy_type,
-                    swarm_pos,
-                    [self.enemy_group, self.all_sprites_group],
-                    difficulty_mult
-                )
-                self.total_spawned += 1
-        
-        return enemy
+        return enemies[0]
     
     def spawn_boss(self, player_pos):
         """Spawn a boss enemy."""
@@ -160,33 +191,50 @@ class EnemySpawner:
     
     def spawn_wave(self, player_pos, count=10, enemy_type=None):
         """Spawn a wave of enemies."""
+        difficulty_mult = self._get_difficulty_multiplier()
+        type_table = self._get_type_table() if enemy_type is None else None
+        
         enemies = []
         for _ in range(count):
-            enemy = self.spawn_enemy(player_pos, enemy_type)
+            enemy = self.spawn_enemy(player_pos, enemy_type, difficulty_mult, type_table)
             enemies.append(enemy)
         return enemies
     
     def update(self, dt, player_pos):
         """Update spawner and spawn enemies as needed."""
-        self.game_time += dt
-        self.spawn_timer += dt
+        game_time = self.game_time = self.game_time + dt
+        spawn_timer = self.spawn_timer = self.spawn_timer + dt
         
         # Calculate spawn interval
         spawn_rate = self._get_spawn_rate()
         spawn_interval = 1.0 / spawn_rate if spawn_rate > 0 else 1.0
         
-        # Spawn enemies
-        while self.spawn_timer >= spawn_interval:
-            self.spawn_timer -= spawn_interval
-            self.spawn_enemy(player_pos)
+        # Boss is due once a full interval has passed since the last one
+        # (last_boss_time starts at 0, so this also covers the first boss)
+        boss_due = game_time >= self.last_boss_time + self.boss_spawn_interval
+        
+        # Most frames spawn nothing
+        if spawn_timer < spawn_interval and not boss_due:
+            return
+        
+        # Spawn enemies (per-frame invariants computed once)
+        if spawn_timer >= spawn_interval:
+            difficulty_mult = self._get_difficulty_multiplier()
+            type_table = self._get_type_table()
+            spawn_enemy = self.spawn_enemy
+            while spawn_timer >= spawn_interval:
+                spawn_timer -= spawn_interval
+                spawn_enemy(player_pos, None, difficulty_mult, type_table)
+            self.spawn_timer = spawn_timer
         
         # Check for boss spawn
-        if (self.game_time - self.last_boss_time >= self.boss_spawn_interval and 
-            self.game_time >= self.boss_spawn_interval):
+        if boss_due:
             self.spawn_boss(player_pos)
-        
-        # Update alive count
-        self.enemies_alive = len(self.enemy_group)
+    
+    @property
+    def enemies_alive(self):
+        """Number of enemies currently alive (read on demand, not every frame)."""
+        return len(self.enemy_group)
     
     def get_stats(self):
         """Get spawner statistics."""
@@ -204,7 +252,8 @@ class EnemySpawner:
         self.game_time = 0
         self.last_boss_time = 0
         self.total_spawned = 0
-        self.enemies_alive = 0
+        self._type_table = None
+        self._type_table_time = None
 
 
 class WaveSpawner:
@@ -212,6 +261,8 @@ class WaveSpawner:
     Alternative spawner that uses discrete waves instead of continuous spawning.
     """
     
+    WAVE_TYPES = ('chaser', 'tank', 'swarm')
+    
     def __init__(self, enemy_group, all_sprites_group):
         self.enemy_group = enemy_group
         self.all_sprites_group = all_sprites_group
@@ -221,6 +272,10 @@ class WaveSpawner:
         self.wave_interval = 30  # Seconds between waves
         self.enemies_per_wave = 10
         self.wave_active = False
+        
+        # Waves spawn in bursts, so keep a pool of each wave type ready
+        for enemy_type in self.WAVE_TYPES:
+            prewarm_enemy_pool(enemy_type, self.enemies_per_wave)
     
     def start_wave(self, player_pos):
         """Start a new wave."""
@@ -230,17 +285,18 @@ class WaveSpawner:
         # Calculate enemies for this wave
         enemy_count = self.enemies_per_wave + self.wave_number * 5
         
-        # Spawn enemies
+        # Group spawn positions by type
+        positions_by_type = {}
         for _ in range(enemy_count):
             pos = get_spawn_position_outside_camera(player_pos, 100)
-            enemy_type = random.choice(['chaser', 'tank', 'swarm'])
-            
-            create_enemy(
-                enemy_type,
-                pos,
-                [self.enemy_group, self.all_sprites_group],
-                1 + self.wave_number * 0.1
-            )
+            enemy_type = _choice(self.WAVE_TYPES)
+            positions_by_type.setdefault(enemy_type, []).append(pos)
+        
+        # Spawn each type as one batch (pooled enemies are reused)
+        groups = [self.enemy_group, self.all_sprites_group]
+        difficulty_mult = 1 + self.wave_number * 0.1
+        for enemy_type, positions in positions_by_type.items():
+            create_enemies(enemy_type, positions, groups, difficulty_mult)
     
     def update(self, dt, player_pos):
         """Update wave spawner."""
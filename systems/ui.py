@@ -4,12 +4,89 @@ UI system for HUD, menus, and overlays.
 """
 
 import pygame
+from collections.abc import Sequence
+from functools import lru_cache
 from settings import (
-    COLORS, UI_SETTINGS, WINDOW_WIDTH, WINDOW_HEIGHT,
+    COLOR_WHITE, COLOR_BLACK, COLOR_RED, COLOR_GREEN, COLOR_BLUE, COLOR_YELLOW,
+    COLOR_CYAN, COLOR_GRAY, COLOR_DARK_GRAY, COLOR_LIGHT_GRAY, COLOR_GOLD, COLOR_BG,
+    UI_SETTINGS, WINDOW_WIDTH, WINDOW_HEIGHT,
     WEAPON_DATA, PASSIVE_DATA, CHEAT_SETTINGS, AVAILABLE_STARTING_WEAPONS,
     AVAILABLE_STARTING_PASSIVES
 )
-from utils import draw_text, draw_bar, format_time
+from utils import TextCache, draw_text, draw_bar, format_time, get_font
+
+# Menu key bindings, built once instead of per key event
+_UP_KEYS = frozenset((pygame.K_UP, pygame.K_w))
+_DOWN_KEYS = frozenset((pygame.K_DOWN, pygame.K_s))
+_LEFT_KEYS = frozenset((pygame.K_LEFT, pygame.K_a))
+_RIGHT_KEYS = frozenset((pygame.K_RIGHT, pygame.K_d))
+_CONFIRM_KEYS = frozenset((pygame.K_RETURN, pygame.K_SPACE))
+_RESTART_KEYS = frozenset((pygame.K_RETURN, pygame.K_SPACE, pygame.K_r))
+_NUMBER_KEYS = frozenset((pygame.K_1, pygame.K_2, pygame.K_3))
+
+
+def _build_exp_slider_display(multiplier: float) -> str:
+    """Build the slider text for an EXP multiplier."""
+    # Multiplier ranges from 0.25 to 5.0 in steps of 0.25
+    # That's 20 steps total (0.25, 0.5, 0.75, ... 5.0)
+    min_val = 0.25
+    max_val = 5.0
+    step = 0.25
+    
+    # Calculate position (0-19)
+    position = int((multiplier - min_val) / step)
+    total_positions = int((max_val - min_val) / step) + 1  # 20 positions
+    
+    # Create slider visual: [----O-----------] 1.0x
+    slider_width = 19  # Number of dashes
+    slider_chars = ['-'] * slider_width
+    
+    # Place the selector
+    selector_pos = int((position / (total_positions - 1)) * (slider_width - 1))
+    slider_chars[selector_pos] = 'O'
+    
+    slider_str = ''.join(slider_chars)
+    return f"[{slider_str}] {multiplier:.2f}x"
+
+
+# Every value the cheats menu can step through (0.25 to 5.0 in 0.25 steps)
+_EXP_SLIDER_DISPLAYS = {
+    multiplier: _build_exp_slider_display(multiplier)
+    for multiplier in (0.25 * step for step in range(1, 21))
+}
+
+
+@lru_cache(maxsize=None)
+def _get_panel(
+    size: tuple[int, int],
+    bg_color: tuple[int, ...],
+    border_color: tuple[int, ...],
+    border_width: int,
+) -> pygame.Surface:
+    """Get a pre-rendered filled rectangle with a border, shared by all menus."""
+    panel = pygame.Surface(size).convert()
+    panel.fill(bg_color)
+    pygame.draw.rect(panel, border_color, panel.get_rect(), border_width)
+    return panel
+
+
+def _dim_screen(surface: pygame.Surface, alpha: int) -> None:
+    """Darken a surface as if a black overlay with the given alpha were blitted over it."""
+    # A multiply fill needs no overlay surface and skips alpha blending entirely
+    keep = 255 - alpha
+    surface.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+
+
+def _index_at(rects: Sequence[pygame.Rect], pos: tuple[int, int]) -> int:
+    """Get the index of the first rect containing pos, or -1, in one C call."""
+    return pygame.Rect(pos, (1, 1)).collidelist(rects)
+
+
+def _hover_index(rects: Sequence[pygame.Rect], pos: tuple[int, int], current: int) -> int:
+    """Like _index_at, but checks the current selection first since the cursor usually stays on it."""
+    if 0 <= current < len(rects) and rects[current].collidepoint(pos):
+        return current
+    return _index_at(rects, pos)
 
 
 class HUD:
@@ -19,15 +96,28 @@ class HUD:
         self.display_surface = pygame.display.get_surface()
         
         # Fonts
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.small_font = pygame.font.Font(None, UI_SETTINGS['small_font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.small_font = get_font(UI_SETTINGS['small_font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         # Bar settings
         self.hp_bar_width = UI_SETTINGS['hp_bar_width']
         self.hp_bar_height = UI_SETTINGS['hp_bar_height']
         self.xp_bar_width = UI_SETTINGS['xp_bar_width']
         self.xp_bar_height = UI_SETTINGS['xp_bar_height']
+        
+        # Text is re-rendered only when a slot's string changes
+        self.text_cache = TextCache()
+        
+        # Last integer values shown, so strings are only formatted on change
+        self._hp_key = None
+        self._hp_text = ""
+        self._level = None
+        self._level_text = ""
+        self._seconds = None
+        self._time_text = ""
+        self._kills = None
+        self._kills_text = ""
     
     def draw(self, player, game_time, kills, debug_info=None):
         """Draw the HUD."""
@@ -38,13 +128,16 @@ class HUD:
             hp_pos,
             (self.hp_bar_width, self.hp_bar_height),
             player.get_hp_progress(),
-            COLORS['red'],
-            COLORS['dark_gray']
+            COLOR_RED,
+            COLOR_DARK_GRAY
         )
-        hp_text = f"{int(player.hp)}/{int(player.max_hp)}"
-        draw_text(self.display_surface, hp_text, 
-                 (hp_pos[0] + self.hp_bar_width // 2, hp_pos[1] + self.hp_bar_height // 2),
-                 self.small_font, COLORS['white'], center=True)
+        hp_key = (int(player.hp), int(player.max_hp))
+        if hp_key != self._hp_key:
+            self._hp_key = hp_key
+            self._hp_text = f"{hp_key[0]}/{hp_key[1]}"
+        self.text_cache.draw(self.display_surface, 'hp', self._hp_text,
+                             (hp_pos[0] + self.hp_bar_width // 2, hp_pos[1] + self.hp_bar_height // 2),
+                             self.small_font, COLOR_WHITE, center=True)
         
         # XP Bar (top center)
         xp_pos = (WINDOW_WIDTH // 2 - self.xp_bar_width // 2, 20)
@@ -53,27 +146,34 @@ class HUD:
             xp_pos,
             (self.xp_bar_width, self.xp_bar_height),
             player.get_xp_progress(),
-            COLORS['blue'],
-            COLORS['dark_gray']
+            COLOR_BLUE,
+            COLOR_DARK_GRAY
         )
         
         # Level (above XP bar)
-        level_text = f"Level {player.level}"
-        draw_text(self.display_surface, level_text,
-                 (WINDOW_WIDTH // 2, 45),
-                 self.font, COLORS['gold'], center=True)
+        if player.level != self._level:
+            self._level = player.level
+            self._level_text = f"Level {player.level}"
+        self.text_cache.draw(self.display_surface, 'level', self._level_text,
+                             (WINDOW_WIDTH // 2, 45),
+                             self.font, COLOR_GOLD, center=True)
         
         # Timer (top right)
-        time_text = format_time(game_time)
-        draw_text(self.display_surface, time_text,
-                 (WINDOW_WIDTH - 80, 25),
-                 self.large_font, COLORS['white'], center=True)
+        seconds = int(game_time)
+        if seconds != self._seconds:
+            self._seconds = seconds
+            self._time_text = format_time(seconds)
+        self.text_cache.draw(self.display_surface, 'timer', self._time_text,
+                             (WINDOW_WIDTH - 80, 25),
+                             self.large_font, COLOR_WHITE, center=True)
         
         # Kills (below timer)
-        kills_text = f"Kills: {kills}"
-        draw_text(self.display_surface, kills_text,
-                 (WINDOW_WIDTH - 80, 55),
-                 self.small_font, COLORS['white'], center=True)
+        if kills != self._kills:
+            self._kills = kills
+            self._kills_text = f"Kills: {kills}"
+        self.text_cache.draw(self.display_surface, 'kills', self._kills_text,
+                             (WINDOW_WIDTH - 80, 55),
+                             self.small_font, COLOR_WHITE, center=True)
         
         # Debug info (if enabled)
         if debug_info:
@@ -84,8 +184,8 @@ class HUD:
         y = 80
         for key, value in debug_info.items():
             text = f"{key}: {value}"
-            draw_text(self.display_surface, text, (20, y),
-                     self.small_font, COLORS['green'])
+            self.text_cache.draw(self.display_surface, ('debug', key), text, (20, y),
+                                 self.small_font, COLOR_GREEN)
             y += 20
 
 
@@ -96,9 +196,9 @@ class LevelUpMenu:
         self.display_surface = pygame.display.get_surface()
         
         # Fonts
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.small_font = pygame.font.Font(None, UI_SETTINGS['small_font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.small_font = get_font(UI_SETTINGS['small_font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         # Card settings
         self.card_width = UI_SETTINGS['card_width']
@@ -109,17 +209,25 @@ class LevelUpMenu:
         self.active = False
         self.options = []
         self.selected_index = 0
+        self._card_rects = []
+        # (title, level_text, desc, color) per option, resolved once in show()
+        self._card_info = []
+        # Wrapped description lines keyed by (text, max_width); descriptions come
+        # from the static data tables, so this is kept across level-ups
+        self._wrapped_desc = {}
     
     def show(self, options):
         """Show the level up menu with options."""
         self.active = True
         self.options = options
         self.selected_index = 0
+        self._card_info = [self._describe_option(option) for option in options]
     
     def hide(self):
         """Hide the menu."""
         self.active = False
         self.options = []
+        self._card_info = []
     
     def handle_input(self, event):
         """Handle input for menu navigation."""
@@ -127,13 +235,13 @@ class LevelUpMenu:
             return None
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_LEFT, pygame.K_a):
+            if event.key in _LEFT_KEYS:
                 self.selected_index = (self.selected_index - 1) % len(self.options)
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
+            elif event.key in _RIGHT_KEYS:
                 self.selected_index = (self.selected_index + 1) % len(self.options)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _CONFIRM_KEYS:
                 return self._select_option()
-            elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
+            elif event.key in _NUMBER_KEYS:
                 index = event.key - pygame.K_1
                 if index < len(self.options):
                     self.selected_index = index
@@ -158,21 +266,23 @@ class LevelUpMenu:
     
     def _handle_click(self, pos):
         """Handle mouse click."""
-        for i, rect in enumerate(self._get_card_rects()):
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                return self._select_option()
+        index = _index_at(self._get_card_rects(), pos)
+        if index >= 0:
+            self.selected_index = index
+            return self._select_option()
         return None
     
     def _handle_hover(self, pos):
         """Handle mouse hover."""
-        for i, rect in enumerate(self._get_card_rects()):
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                break
+        index = _hover_index(self._get_card_rects(), pos, self.selected_index)
+        if index >= 0:
+            self.selected_index = index
     
     def _get_card_rects(self):
-        """Get rectangles for all cards."""
+        """Get rectangles for all cards (rebuilt only when the card count changes)."""
+        if len(self._card_rects) == len(self.options):
+            return self._card_rects
+        
         rects = []
         total_width = len(self.options) * self.card_width + (len(self.options) - 1) * self.card_spacing
         start_x = WINDOW_WIDTH // 2 - total_width // 2
@@ -182,6 +292,7 @@ class LevelUpMenu:
             x = start_x + i * (self.card_width + self.card_spacing)
             rects.append(pygame.Rect(x, y, self.card_width, self.card_height))
         
+        self._card_rects = rects
         return rects
     
     def draw(self):
@@ -190,44 +301,39 @@ class LevelUpMenu:
             return
         
         # Darken background
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.display_surface.blit(overlay, (0, 0))
+        _dim_screen(self.display_surface, 180)
         
         # Title
         draw_text(self.display_surface, "LEVEL UP!",
                  (WINDOW_WIDTH // 2, 100),
-                 self.large_font, COLORS['gold'], center=True)
+                 self.large_font, COLOR_GOLD, center=True)
         
         draw_text(self.display_surface, "Choose an upgrade:",
                  (WINDOW_WIDTH // 2, 140),
-                 self.font, COLORS['white'], center=True)
+                 self.font, COLOR_WHITE, center=True)
         
-        # Draw cards
+        # Draw card backgrounds and borders in one batched call
         card_rects = self._get_card_rects()
+        normal = _get_panel((self.card_width, self.card_height), COLOR_DARK_GRAY, COLOR_WHITE, 1)
+        selected = _get_panel((self.card_width, self.card_height), COLOR_GRAY, COLOR_GOLD, 3)
+        self.display_surface.blits(
+            [(selected if i == self.selected_index else normal, rect)
+             for i, rect in enumerate(card_rects)],
+            doreturn=False
+        )
         
-        for i, (option, rect) in enumerate(zip(self.options, card_rects)):
-            self._draw_card(option, rect, i == self.selected_index, i + 1)
+        for i, (info, rect) in enumerate(zip(self._card_info, card_rects)):
+            self._draw_card(info, rect, i + 1)
     
-    def _draw_card(self, option, rect, selected, number):
-        """Draw a single upgrade card."""
-        # Card background
-        bg_color = COLORS['dark_gray'] if not selected else COLORS['gray']
-        pygame.draw.rect(self.display_surface, bg_color, rect)
-        
-        # Border
-        border_color = COLORS['gold'] if selected else COLORS['white']
-        border_width = 3 if selected else 1
-        pygame.draw.rect(self.display_surface, border_color, rect, border_width)
-        
-        # Get option info
+    def _describe_option(self, option):
+        """Look up the title, level text, description and icon color for an option."""
         option_type, option_id, is_new, current_level = option
         
         if option_type == 'weapon':
             data = WEAPON_DATA.get(option_id, {})
             name = data.get('name', option_id)
             desc = data.get('description', '')
-            color = data.get('color', COLORS['white'])
+            color = data.get('color', COLOR_WHITE)
             
             if is_new:
                 title = f"NEW: {name}"
@@ -240,7 +346,7 @@ class LevelUpMenu:
             data = PASSIVE_DATA.get(option_id, {})
             name = data.get('name', option_id)
             desc = data.get('description', '')
-            color = data.get('color', COLORS['white'])
+            color = data.get('color', COLOR_WHITE)
             
             if is_new:
                 title = f"NEW: {name}"
@@ -254,61 +360,81 @@ class LevelUpMenu:
             name = weapon_data.get('evolution', option_id)
             title = f"EVOLVE: {name}"
             desc = "Weapon evolution!"
-            color = COLORS['gold']
+            color = COLOR_GOLD
             level_text = "MAX"
         
         else:
             title = str(option_id)
             desc = ""
-            color = COLORS['white']
+            color = COLOR_WHITE
             level_text = ""
         
+        return title, level_text, desc, color
+    
+    def _draw_card(self, info, rect, number):
+        """Draw the contents of a single upgrade card."""
+        title, level_text, desc, color = info
+        
         # Draw icon (colored square)
         icon_rect = pygame.Rect(rect.centerx - 25, rect.y + 30, 50, 50)
         pygame.draw.rect(self.display_surface, color, icon_rect)
-        pygame.draw.rect(self.display_surface, COLORS['white'], icon_rect, 2)
+        pygame.draw.rect(self.display_surface, COLOR_WHITE, icon_rect, 2)
         
         # Draw number
         draw_text(self.display_surface, str(number),
                  (rect.x + 15, rect.y + 10),
-                 self.font, COLORS['yellow'])
+                 self.font, COLOR_YELLOW)
         
         # Draw title
         draw_text(self.display_surface, title,
                  (rect.centerx, rect.y + 100),
-                 self.small_font, COLORS['white'], center=True)
+                 self.small_font, COLOR_WHITE, center=True)
         
         # Draw level
         draw_text(self.display_surface, level_text,
                  (rect.centerx, rect.y + 125),
-                 self.small_font, COLORS['gold'], center=True)
+                 self.small_font, COLOR_GOLD, center=True)
         
         # Draw description (word wrap)
         self._draw_wrapped_text(desc, rect.centerx, rect.y + 160, 
                                rect.width - 20, self.small_font)
     
-    def _draw_wrapped_text(self, text, x, y, max_width, font):
-        """Draw text with word wrapping."""
-        words = text.split()
+    def _wrap_text(self, text, max_width, font):
+        """Split text into lines no wider than max_width, measuring each word once."""
+        space_width = font.size(' ')[0]
         lines = []
         current_line = []
+        current_width = 0
         
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
+        for word in text.split():
+            word_width = font.size(word)[0]
+            if not current_line:
+                current_line.append(word)
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
                 current_line.append(word)
+                current_width += space_width + word_width
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
+                lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
+        return lines
+    
+    def _draw_wrapped_text(self, text, x, y, max_width, font):
+        """Draw text with word wrapping."""
+        # Descriptions never change, so each is wrapped once per game session
+        key = (text, max_width)
+        lines = self._wrapped_desc.get(key)
+        if lines is None:
+            lines = self._wrapped_desc[key] = self._wrap_text(text, max_width, font)
         
         for i, line in enumerate(lines):
             draw_text(self.display_surface, line,
                      (x, y + i * 20),
-                     font, COLORS['light_gray'], center=True)
+                     font, COLOR_LIGHT_GRAY, center=True)
 
 
 class PauseMenu:
@@ -316,12 +442,16 @@ class PauseMenu:
     
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         self.active = False
         self.options = ['Resume', 'Restart', 'Quit']
         self.selected_index = 0
+        self._option_rects = []
+        
+        # Title and option text are cached
+        self.text_cache = TextCache()
     
     def show(self):
         """Show the pause menu."""
@@ -338,11 +468,11 @@ class PauseMenu:
             return None
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
+            if event.key in _UP_KEYS:
                 self.selected_index = (self.selected_index - 1) % len(self.options)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
+            elif event.key in _DOWN_KEYS:
                 self.selected_index = (self.selected_index + 1) % len(self.options)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _CONFIRM_KEYS:
                 return self.options[self.selected_index].lower()
             elif event.key == pygame.K_ESCAPE:
                 return 'resume'
@@ -357,7 +487,10 @@ class PauseMenu:
         return None
     
     def _get_option_rects(self):
-        """Get rectangles for menu options."""
+        """Get rectangles for menu options (rebuilt only when the option count changes)."""
+        if len(self._option_rects) == len(self.options):
+            return self._option_rects
+        
         rects = []
         start_y = WINDOW_HEIGHT // 2 - 50
         
@@ -365,21 +498,21 @@ class PauseMenu:
             rect = pygame.Rect(WINDOW_WIDTH // 2 - 100, start_y + i * 50, 200, 40)
             rects.append(rect)
         
+        self._option_rects = rects
         return rects
     
     def _handle_click(self, pos):
         """Handle mouse click."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                return self.options[i].lower()
+        index = _index_at(self._get_option_rects(), pos)
+        if index >= 0:
+            return self.options[index].lower()
         return None
     
     def _handle_hover(self, pos):
         """Handle mouse hover."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                break
+        index = _hover_index(self._get_option_rects(), pos, self.selected_index)
+        if index >= 0:
+            self.selected_index = index
     
     def draw(self):
         """Draw the pause menu."""
@@ -387,28 +520,27 @@ class PauseMenu:
             return
         
         # Darken background
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.display_surface.blit(overlay, (0, 0))
+        _dim_screen(self.display_surface, 180)
         
         # Title
-        draw_text(self.display_surface, "PAUSED",
-                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120),
-                 self.large_font, COLORS['white'], center=True)
+        self.text_cache.draw(self.display_surface, 'title', "PAUSED",
+                             (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120),
+                             self.large_font, COLOR_WHITE, center=True)
+        
+        # Option buttons in one batched call, then their labels
+        option_rects = self._get_option_rects()
+        normal = _get_panel(option_rects[0].size, COLOR_DARK_GRAY, COLOR_WHITE, 2)
+        selected = _get_panel(option_rects[0].size, COLOR_GRAY, COLOR_GOLD, 2)
+        self.display_surface.blits(
+            [(selected if i == self.selected_index else normal, rect)
+             for i, rect in enumerate(option_rects)],
+            doreturn=False
+        )
         
-        # Options
-        for i, (option, rect) in enumerate(zip(self.options, self._get_option_rects())):
-            selected = i == self.selected_index
-            
-            bg_color = COLORS['gray'] if selected else COLORS['dark_gray']
-            pygame.draw.rect(self.display_surface, bg_color, rect)
-            
-            border_color = COLORS['gold'] if selected else COLORS['white']
-            pygame.draw.rect(self.display_surface, border_color, rect, 2)
-            
-            text_color = COLORS['gold'] if selected else COLORS['white']
-            draw_text(self.display_surface, option,
-                     rect.center, self.font, text_color, center=True)
+        for i, (option, rect) in enumerate(zip(self.options, option_rects)):
+            text_color = COLOR_GOLD if i == self.selected_index else COLOR_WHITE
+            self.text_cache.draw(self.display_surface, i, option,
+                                 rect.center, self.font, text_color, center=True)
 
 
 class DeathScreen:
@@ -416,15 +548,20 @@ class DeathScreen:
     
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.small_font = pygame.font.Font(None, UI_SETTINGS['small_font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.small_font = get_font(UI_SETTINGS['small_font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         self.active = False
         self.stats = {}
         self.high_score = 0
         self.best_time = 0
         self.is_new_record = False
+        
+        # The whole screen is static between show() calls, so it renders once;
+        # the text cache keeps labels rendered across deaths
+        self._composed = None
+        self.text_cache = TextCache()
     
     def show(self, stats, high_score=0, best_time=0):
         """Show the death screen with stats."""
@@ -434,6 +571,7 @@ class DeathScreen:
         self.best_time = best_time
         self.is_new_record = (stats.get('kills', 0) > high_score or 
                               stats.get('time', 0) > best_time)
+        self._compose()
     
     def hide(self):
         """Hide the death screen."""
@@ -445,7 +583,7 @@ class DeathScreen:
             return None
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_r):
+            if event.key in _RESTART_KEYS:
                 return 'restart'
             elif event.key == pygame.K_ESCAPE:
                 return 'quit'
@@ -460,19 +598,30 @@ class DeathScreen:
         if not self.active:
             return
         
+        if self._composed is None:
+            self._compose()
+        self.display_surface.blit(self._composed, (0, 0))
+    
+    def _compose(self):
+        """Render the full death screen for the current stats."""
+        # One surface is reused for every death
+        if self._composed is None:
+            self._composed = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        screen = self._composed
+        
         # Dark background
-        self.display_surface.fill(COLORS['black'])
+        screen.fill(COLOR_BLACK)
         
         # Title
-        draw_text(self.display_surface, "GAME OVER",
-                 (WINDOW_WIDTH // 2, 100),
-                 self.large_font, COLORS['red'], center=True)
+        self.text_cache.draw(screen, 'title', "GAME OVER",
+                             (WINDOW_WIDTH // 2, 100),
+                             self.large_font, COLOR_RED, center=True)
         
         # New record indicator
         if self.is_new_record:
-            draw_text(self.display_surface, "NEW RECORD!",
-                     (WINDOW_WIDTH // 2, 150),
-                     self.font, COLORS['gold'], center=True)
+            self.text_cache.draw(screen, 'new_record', "NEW RECORD!",
+                                 (WINDOW_WIDTH // 2, 150),
+                                 self.font, COLOR_GOLD, center=True)
         
         # Stats
         y = 220
@@ -484,38 +633,38 @@ class DeathScreen:
         ]
         
         for label, value in stats_to_show:
-            draw_text(self.display_surface, f"{label}:",
-                     (WINDOW_WIDTH // 2 - 100, y),
-                     self.font, COLORS['white'])
-            draw_text(self.display_surface, value,
-                     (WINDOW_WIDTH // 2 + 100, y),
-                     self.font, COLORS['gold'])
+            self.text_cache.draw(screen, ('label', label), f"{label}:",
+                                 (WINDOW_WIDTH // 2 - 100, y),
+                                 self.font, COLOR_WHITE)
+            self.text_cache.draw(screen, ('value', label), value,
+                                 (WINDOW_WIDTH // 2 + 100, y),
+                                 self.font, COLOR_GOLD)
             y += 40
         
         # High scores
         y += 30
-        draw_text(self.display_surface, "--- Best Records ---",
-                 (WINDOW_WIDTH // 2, y),
-                 self.font, COLORS['gray'], center=True)
+        self.text_cache.draw(screen, 'records_header', "--- Best Records ---",
+                             (WINDOW_WIDTH // 2, y),
+                             self.font, COLOR_GRAY, center=True)
         y += 40
         
-        draw_text(self.display_surface, f"Best Time: {format_time(self.best_time)}",
-                 (WINDOW_WIDTH // 2, y),
-                 self.font, COLORS['white'], center=True)
+        self.text_cache.draw(screen, 'best_time', f"Best Time: {format_time(self.best_time)}",
+                             (WINDOW_WIDTH // 2, y),
+                             self.font, COLOR_WHITE, center=True)
         y += 30
         
-        draw_text(self.display_surface, f"Most Kills: {self.high_score}",
-                 (WINDOW_WIDTH // 2, y),
-                 self.font, COLORS['white'], center=True)
+        self.text_cache.draw(screen, 'most_kills', f"Most Kills: {self.high_score}",
+                             (WINDOW_WIDTH // 2, y),
+                             self.font, COLOR_WHITE, center=True)
         
         # Restart prompt
-        draw_text(self.display_surface, "Press ENTER or SPACE to restart",
-                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100),
-                 self.font, COLORS['white'], center=True)
+        self.text_cache.draw(screen, 'restart', "Press ENTER or SPACE to restart",
+                             (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100),
+                             self.font, COLOR_WHITE, center=True)
         
-        draw_text(self.display_surface, "Press ESC to quit",
-                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60),
-                 self.small_font, COLORS['gray'], center=True)
+        self.text_cache.draw(screen, 'quit', "Press ESC to quit",
+                             (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60),
+                             self.small_font, COLOR_GRAY, center=True)
 
 
 class MainMenu:
@@ -523,13 +672,19 @@ class MainMenu:
     
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
-        self.title_font = pygame.font.Font(None, 72)
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
+        self.title_font = get_font(72)
         
         self.active = True
         self.options = ['Start', 'Options', 'Quit']
         self.selected_index = 0
+        self._option_rects = []
+        
+        # Background, title and instructions never change, so they are
+        # pre-rendered into one layer on first draw
+        self._static_layer = None
+        self.text_cache = TextCache()
     
     def show(self):
         """Show the main menu."""
@@ -546,11 +701,11 @@ class MainMenu:
             return None
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
+            if event.key in _UP_KEYS:
                 self.selected_index = (self.selected_index - 1) % len(self.options)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
+            elif event.key in _DOWN_KEYS:
                 self.selected_index = (self.selected_index + 1) % len(self.options)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _CONFIRM_KEYS:
                 return self.options[self.selected_index].lower()
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -563,7 +718,10 @@ class MainMenu:
         return None
     
     def _get_option_rects(self):
-        """Get rectangles for menu options."""
+        """Get rectangles for menu options (rebuilt only when the option count changes)."""
+        if len(self._option_rects) == len(self.options):
+            return self._option_rects
+        
         rects = []
         start_y = WINDOW_HEIGHT // 2
         
@@ -571,57 +729,69 @@ class MainMenu:
             rect = pygame.Rect(WINDOW_WIDTH // 2 - 120, start_y + i * 60, 240, 50)
             rects.append(rect)
         
+        self._option_rects = rects
         return rects
     
     def _handle_click(self, pos):
         """Handle mouse click."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                return self.options[i].lower()
+        index = _index_at(self._get_option_rects(), pos)
+        if index >= 0:
+            return self.options[index].lower()
         return None
     
     def _handle_hover(self, pos):
         """Handle mouse hover."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                break
+        index = _hover_index(self._get_option_rects(), pos, self.selected_index)
+        if index >= 0:
+            self.selected_index = index
     
     def draw(self):
         """Draw the main menu."""
         if not self.active:
             return
         
+        # Background, title and instructions
+        if self._static_layer is None:
+            self._static_layer = self._create_static_layer()
+        self.display_surface.blit(self._static_layer, (0, 0))
+        
+        # Option buttons in one batched call, then their labels
+        option_rects = self._get_option_rects()
+        normal = _get_panel(option_rects[0].size, COLOR_DARK_GRAY, COLOR_WHITE, 2)
+        selected = _get_panel(option_rects[0].size, COLOR_GRAY, COLOR_GOLD, 2)
+        self.display_surface.blits(
+            [(selected if i == self.selected_index else normal, rect)
+             for i, rect in enumerate(option_rects)],
+            doreturn=False
+        )
+        
+        for i, (option, rect) in enumerate(zip(self.options, option_rects)):
+            text_color = COLOR_GOLD if i == self.selected_index else COLOR_WHITE
+            self.text_cache.draw(self.display_surface, i, option,
+                                 rect.center, self.font, text_color, center=True)
+
+    
+    def _create_static_layer(self):
+        """Render the parts of the menu that never change."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        
         # Dark background
-        self.display_surface.fill(COLORS['bg_color'])
+        layer.fill(COLOR_BG)
         
         # Title
-        draw_text(self.display_surface, "VAMPIRE SURVIVORS",
+        draw_text(layer, "VAMPIRE SURVIVORS",
                  (WINDOW_WIDTH // 2, 150),
-                 self.title_font, COLORS['red'], center=True)
+                 self.title_font, COLOR_RED, center=True)
         
-        draw_text(self.display_surface, "Clone",
+        draw_text(layer, "Clone",
                  (WINDOW_WIDTH // 2, 210),
-                 self.large_font, COLORS['gold'], center=True)
-        
-        # Options
-        for i, (option, rect) in enumerate(zip(self.options, self._get_option_rects())):
-            selected = i == self.selected_index
-            
-            bg_color = COLORS['gray'] if selected else COLORS['dark_gray']
-            pygame.draw.rect(self.display_surface, bg_color, rect)
-            
-            border_color = COLORS['gold'] if selected else COLORS['white']
-            pygame.draw.rect(self.display_surface, border_color, rect, 2)
-            
-            text_color = COLORS['gold'] if selected else COLORS['white']
-            draw_text(self.display_surface, option,
-                     rect.center, self.font, text_color, center=True)
+                 self.large_font, COLOR_GOLD, center=True)
         
         # Instructions
-        draw_text(self.display_surface, "Use W/S or Arrow Keys to navigate, ENTER to select",
+        draw_text(layer, "Use W/S or Arrow Keys to navigate, ENTER to select",
                  (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50),
-                 self.font, COLORS['gray'], center=True)
+                 self.font, COLOR_GRAY, center=True)
+        return layer
 
 
 class OptionsMenu:
@@ -629,12 +799,18 @@ class OptionsMenu:
     
     def __init__(self):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         self.active = False
         self.options = ['Cheats', 'Back']
         self.selected_index = 0
+        self._option_rects = []
+        
+        # Background, title and instructions never change, so they are
+        # pre-rendered into one layer on first draw
+        self._static_layer = None
+        self.text_cache = TextCache()
     
     def show(self):
         """Show the options menu."""
@@ -651,11 +827,11 @@ class OptionsMenu:
             return None
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
+            if event.key in _UP_KEYS:
                 self.selected_index = (self.selected_index - 1) % len(self.options)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
+            elif event.key in _DOWN_KEYS:
                 self.selected_index = (self.selected_index + 1) % len(self.options)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            elif event.key in _CONFIRM_KEYS:
                 return self.options[self.selected_index].lower()
             elif event.key == pygame.K_ESCAPE:
                 return 'back'
@@ -670,7 +846,10 @@ class OptionsMenu:
         return None
     
     def _get_option_rects(self):
-        """Get rectangles for menu options."""
+        """Get rectangles for menu options (rebuilt only when the option count changes)."""
+        if len(self._option_rects) == len(self.options):
+            return self._option_rects
+        
         rects = []
         start_y = WINDOW_HEIGHT // 2 - 30
         
@@ -678,63 +857,79 @@ class OptionsMenu:
             rect = pygame.Rect(WINDOW_WIDTH // 2 - 120, start_y + i * 60, 240, 50)
             rects.append(rect)
         
+        self._option_rects = rects
         return rects
     
     def _handle_click(self, pos):
         """Handle mouse click."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                return self.options[i].lower()
+        index = _index_at(self._get_option_rects(), pos)
+        if index >= 0:
+            return self.options[index].lower()
         return None
     
     def _handle_hover(self, pos):
         """Handle mouse hover."""
-        for i, rect in enumerate(self._get_option_rects()):
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                break
+        index = _hover_index(self._get_option_rects(), pos, self.selected_index)
+        if index >= 0:
+            self.selected_index = index
     
     def draw(self):
         """Draw the options menu."""
         if not self.active:
             return
         
+        # Background, title and instructions
+        if self._static_layer is None:
+            self._static_layer = self._create_static_layer()
+        self.display_surface.blit(self._static_layer, (0, 0))
+        
+        # Option buttons in one batched call, then their labels
+        option_rects = self._get_option_rects()
+        normal = _get_panel(option_rects[0].size, COLOR_DARK_GRAY, COLOR_WHITE, 2)
+        selected = _get_panel(option_rects[0].size, COLOR_GRAY, COLOR_GOLD, 2)
+        self.display_surface.blits(
+            [(selected if i == self.selected_index else normal, rect)
+             for i, rect in enumerate(option_rects)],
+            doreturn=False
+        )
+        
+        for i, (option, rect) in enumerate(zip(self.options, option_rects)):
+            text_color = COLOR_GOLD if i == self.selected_index else COLOR_WHITE
+            self.text_cache.draw(self.display_surface, i, option,
+                                 rect.center, self.font, text_color, center=True)
+
+    
+    def _create_static_layer(self):
+        """Render the parts of the menu that never change."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        
         # Dark background
-        self.display_surface.fill(COLORS['bg_color'])
+        layer.fill(COLOR_BG)
         
         # Title
-        draw_text(self.display_surface, "OPTIONS",
+        draw_text(layer, "OPTIONS",
                  (WINDOW_WIDTH // 2, 150),
-                 self.large_font, COLORS['gold'], center=True)
-        
-        # Options
-        for i, (option, rect) in enumerate(zip(self.options, self._get_option_rects())):
-            selected = i == self.selected_index
-            
-            bg_color = COLORS['gray'] if selected else COLORS['dark_gray']
-            pygame.draw.rect(self.display_surface, bg_color, rect)
-            
-            border_color = COLORS['gold'] if selected else COLORS['white']
-            pygame.draw.rect(self.display_surface, border_color, rect, 2)
-            
-            text_color = COLORS['gold'] if selected else COLORS['white']
-            draw_text(self.display_surface, option,
-                     rect.center, self.font, text_color, center=True)
+                 self.large_font, COLOR_GOLD, center=True)
         
         # Instructions
-        draw_text(self.display_surface, "Press ESC to go back",
+        draw_text(layer, "Press ESC to go back",
                  (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50),
-                 self.font, COLORS['gray'], center=True)
+                 self.font, COLOR_GRAY, center=True)
+        return layer
 
 
 class CheatsMenu:
     """Cheats submenu with toggles for unlimited health, starting weapons, weapon level, and power-ups."""
     
+    # Option list layout: top of the first row and the spacing between rows
+    _LIST_TOP = 180
+    _ITEM_HEIGHT = 40
+    
     def __init__(self, cheat_settings):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(None, UI_SETTINGS['font_size'])
-        self.small_font = pygame.font.Font(None, UI_SETTINGS['small_font_size'])
-        self.large_font = pygame.font.Font(None, UI_SETTINGS['large_font_size'])
+        self.font = get_font(UI_SETTINGS['font_size'])
+        self.small_font = get_font(UI_SETTINGS['small_font_size'])
+        self.large_font = get_font(UI_SETTINGS['large_font_size'])
         
         self.active = False
         self.cheat_settings = cheat_settings
@@ -745,6 +940,7 @@ class CheatsMenu:
         # Import available weapons and passives
         from settings import AVAILABLE_STARTING_WEAPONS, WEAPON_DATA, PASSIVE_DATA, AVAILABLE_STARTING_PASSIVES
         self.available_weapons = AVAILABLE_STARTING_WEAPONS
+        self._weapon_index = {weapon: i for i, weapon in enumerate(self.available_weapons)}
         self.weapon_data = WEAPON_DATA
         self.passive_data = PASSIVE_DATA
         self.available_passives = AVAILABLE_STARTING_PASSIVES
@@ -754,12 +950,25 @@ class CheatsMenu:
             self.cheat_settings['starting_passives'] = {}
         if 'starting_weapon_level' not in self.cheat_settings:
             self.cheat_settings['starting_weapon_level'] = 1
+        
+        # Option strings are rebuilt only after a cheat setting changes
+        self._options_dirty = True
+        self._cached_options = []
+        # Visible option rects, keyed by (scroll_offset, option count)
+        self._rects_key = None
+        self._cached_rects = []
+        
+        # Background, title, warning and instructions are rendered once;
+        # option labels re-render only when their text or color changes
+        self._static_layer = None
+        self.text_cache = TextCache()
     
     def show(self):
         """Show the cheats menu."""
         self.active = True
         self.selected_index = 0
         self.scroll_offset = 0
+        self._options_dirty = True
     
     def hide(self):
         """Hide the cheats menu."""
@@ -767,6 +976,13 @@ class CheatsMenu:
     
     def _get_options(self):
         """Get current options with their states."""
+        if self._options_dirty:
+            self._cached_options = self._build_options()
+            self._options_dirty = False
+        return self._cached_options
+    
+    def _build_options(self):
+        """Build the option strings from the current cheat settings."""
         unlimited_health_state = "ON" if self.cheat_settings['unlimited_health'] else "OFF"
         current_weapon = self.weapon_data.get(self.cheat_settings['starting_weapon'], {}).get('name', 'Whip')
         weapon_level = self.cheat_settings.get('starting_weapon_level', 1)
@@ -814,26 +1030,14 @@ class CheatsMenu:
         options = self._get_options()
         
         if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                self.selected_index = (self.selected_index - 1) % len(options)
-                # Skip separator
-                if self.selected_index == 4:
-                    self.selected_index = 3
-                self._update_scroll()
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                self.selected_index = (self.selected_index + 1) % len(options)
-                # Skip separator
-                if self.selected_index == 4:
-                    self.selected_index = 5
-                self._update_scroll()
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            if event.key in _CONFIRM_KEYS:
                 return self._select_option()
-            elif event.key in (pygame.K_LEFT, pygame.K_a):
-                return self._adjust_option(-1)
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                return self._adjust_option(1)
-            elif event.key == pygame.K_ESCAPE:
+            if event.key == pygame.K_ESCAPE:
                 return 'back'
+            action = self._KEY_ACTIONS.get(event.key)
+            if action is not None:
+                handler, direction = action
+                return handler(self, direction)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
@@ -849,6 +1053,14 @@ class CheatsMenu:
         
         return None
     
+    def _move_selection(self, direction):
+        """Move the selection up or down, skipping the separator."""
+        options = self._get_options()
+        self.selected_index = (self.selected_index + direction) % len(options)
+        if self.selected_index == 4:
+            self.selected_index += direction
+        self._update_scroll()
+    
     def _update_scroll(self):
         """Update scroll offset to keep selected item visible."""
         options = self._get_options()
@@ -861,27 +1073,15 @@ class CheatsMenu:
         """Select the current option."""
         options = self._get_options()
         
-        if self.selected_index == 0:
-            # Toggle unlimited health
-            self.cheat_settings['unlimited_health'] = not self.cheat_settings['unlimited_health']
-            self._update_cheats_enabled()
-        elif self.selected_index == 1:
-            # Cycle to next weapon
-            self._cycle_weapon(1)
-        elif self.selected_index == 2:
-            # Cycle weapon level
-            self._cycle_weapon_level(1)
-        elif self.selected_index == 3:
-            # Adjust EXP multiplier (increase on select)
-            self._adjust_exp_multiplier(1)
-        elif self.selected_index == 4:
-            # Separator - do nothing
-            pass
+        # Setting rows step forward on select (the EXP multiplier increases)
+        adjust = self._ROW_ADJUSTERS.get(self.selected_index)
+        if adjust is not None:
+            adjust(self, 1)
         elif self.selected_index == len(options) - 1:
             # Back
             return 'back'
         else:
-            # Toggle passive
+            # Toggle passive (the separator maps to no passive)
             passive_idx = self._get_passive_index(self.selected_index)
             if passive_idx >= 0:
                 self._toggle_passive(passive_idx)
@@ -892,40 +1092,28 @@ class CheatsMenu:
         """Adjust the current option (for left/right keys)."""
         options = self._get_options()
         
-        if self.selected_index == 0:
-            # Toggle unlimited health
-            self.cheat_settings['unlimited_health'] = not self.cheat_settings['unlimited_health']
-            self._update_cheats_enabled()
-        elif self.selected_index == 1:
-            # Cycle weapon
-            self._cycle_weapon(direction)
-        elif self.selected_index == 2:
-            # Cycle weapon level
-            self._cycle_weapon_level(direction)
-        elif self.selected_index == 3:
-            # Adjust EXP multiplier
-            self._adjust_exp_multiplier(direction)
-        elif self.selected_index == 4:
-            # Separator - do nothing
-            pass
+        adjust = self._ROW_ADJUSTERS.get(self.selected_index)
+        if adjust is not None:
+            adjust(self, direction)
         elif self.selected_index == len(options) - 1:
             # Back - do nothing
             pass
         else:
-            # Adjust passive level
+            # Adjust passive level (the separator maps to no passive)
             passive_idx = self._get_passive_index(self.selected_index)
             if passive_idx >= 0:
                 self._adjust_passive_level(passive_idx, direction)
         
         return None
     
+    def _toggle_unlimited_health(self, direction):
+        """Toggle unlimited health (either direction flips it)."""
+        self.cheat_settings['unlimited_health'] = not self.cheat_settings['unlimited_health']
+        self._update_cheats_enabled()
+    
     def _cycle_weapon(self, direction):
         """Cycle through available weapons."""
-        current_weapon = self.cheat_settings['starting_weapon']
-        try:
-            current_index = self.available_weapons.index(current_weapon)
-        except ValueError:
-            current_index = 0
+        current_index = self._weapon_index.get(self.cheat_settings['starting_weapon'], 0)
         
         new_index = (current_index + direction) % len(self.available_weapons)
         self.cheat_settings['starting_weapon'] = self.available_weapons[new_index]
@@ -934,56 +1122,25 @@ class CheatsMenu:
     def _cycle_weapon_level(self, direction):
         """Cycle through weapon levels (1-8)."""
         current_level = self.cheat_settings.get('starting_weapon_level', 1)
-        new_level = current_level + direction
         
-        # Clamp to valid range (1-8)
-        if new_level < 1:
-            new_level = 8
-        elif new_level > 8:
-            new_level = 1
-        
-        self.cheat_settings['starting_weapon_level'] = new_level
+        # Wrap around the valid range (1-8)
+        self.cheat_settings['starting_weapon_level'] = (current_level - 1 + direction) % 8 + 1
         self._update_cheats_enabled()
     
     def _get_exp_slider_display(self, multiplier):
         """Get a visual slider display for the EXP multiplier."""
-        # Multiplier ranges from 0.25 to 5.0 in steps of 0.25
-        # That's 20 steps total (0.25, 0.5, 0.75, ... 5.0)
-        min_val = 0.25
-        max_val = 5.0
-        step = 0.25
-        
-        # Calculate position (0-19)
-        position = int((multiplier - min_val) / step)
-        total_positions = int((max_val - min_val) / step) + 1  # 20 positions
-        
-        # Create slider visual: [----O-----------] 1.0x
-        slider_width = 19  # Number of dashes
-        slider_chars = ['-'] * slider_width
-        
-        # Place the selector
-        selector_pos = int((position / (total_positions - 1)) * (slider_width - 1))
-        slider_chars[selector_pos] = 'O'
-        
-        slider_str = ''.join(slider_chars)
-        return f"[{slider_str}] {multiplier:.2f}x"
+        display = _EXP_SLIDER_DISPLAYS.get(multiplier)
+        if display is None:
+            display = _build_exp_slider_display(multiplier)
+        return display
     
     def _adjust_exp_multiplier(self, direction):
         """Adjust the EXP multiplier by 0.25 per step."""
-        current = self.cheat_settings.get('exp_multiplier', 1.0)
-        step = 0.25
-        min_val = 0.25
-        max_val = 5.0
-        
-        new_val = current + (direction * step)
-        
-        # Clamp to valid range
-        new_val = max(min_val, min(max_val, new_val))
+        # Step in whole quarter units (1-20 covers 0.25 to 5.0), so no float drift
+        units = round(self.cheat_settings.get('exp_multiplier', 1.0) * 4) + direction
+        units = min(max(units, 1), 20)
         
-        # Round to avoid floating point issues
-        new_val = round(new_val * 4) / 4
-        
-        self.cheat_settings['exp_multiplier'] = new_val
+        self.cheat_settings['exp_multiplier'] = units / 4
         self._update_cheats_enabled()
     
     def _toggle_passive(self, passive_idx):
@@ -1041,13 +1198,38 @@ class CheatsMenu:
             self.cheat_settings.get('exp_multiplier', 1.0) != 1.0
         )
         self.cheat_settings['cheats_enabled'] = has_cheats
+        self._options_dirty = True
+    
+    # Fixed setting rows -> handler(self, direction)
+    _ROW_ADJUSTERS = {
+        0: _toggle_unlimited_health,
+        1: _cycle_weapon,
+        2: _cycle_weapon_level,
+        3: _adjust_exp_multiplier,
+    }
+    
+    # Navigation and adjust keys -> (handler, direction)
+    _KEY_ACTIONS = {
+        pygame.K_UP: (_move_selection, -1),
+        pygame.K_w: (_move_selection, -1),
+        pygame.K_DOWN: (_move_selection, 1),
+        pygame.K_s: (_move_selection, 1),
+        pygame.K_LEFT: (_adjust_option, -1),
+        pygame.K_a: (_adjust_option, -1),
+        pygame.K_RIGHT: (_adjust_option, 1),
+        pygame.K_d: (_adjust_option, 1),
+    }
     
     def _get_option_rects(self):
-        """Get rectangles for menu options."""
-        rects = []
+        """Get rectangles for menu options (rebuilt only when scrolling or the option count changes)."""
         options = self._get_options()
-        start_y = 180
-        item_height = 40
+        key = (self.scroll_offset, len(options))
+        if key == self._rects_key:
+            return self._cached_rects
+        
+        rects = []
+        start_y = self._LIST_TOP
+        item_height = self._ITEM_HEIGHT
         
         visible_start = self.scroll_offset
         visible_end = min(len(options), self.scroll_offset + self.max_visible_items)
@@ -1057,48 +1239,54 @@ class CheatsMenu:
             rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, y, 400, item_height - 5)
             rects.append((i, rect))
         
+        self._rects_key = key
+        self._cached_rects = rects
         return rects
     
+    def _option_at(self, pos):
+        """Get the index of the visible option under pos, or -1."""
+        # Rows are evenly stacked, so the hit test is arithmetic on the layout
+        left = WINDOW_WIDTH // 2 - 200
+        if not left <= pos[0] < left + 400:
+            return -1
+        
+        row, offset = divmod(pos[1] - self._LIST_TOP, self._ITEM_HEIGHT)
+        if row < 0 or row >= self.max_visible_items or offset >= self._ITEM_HEIGHT - 5:
+            return -1
+        
+        index = self.scroll_offset + row
+        return index if index < len(self._get_options()) else -1
+    
     def _handle_click(self, pos):
         """Handle mouse click."""
-        for i, rect in self._get_option_rects():
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                return self._select_option()
+        index = self._option_at(pos)
+        if index >= 0:
+            self.selected_index = index
+            return self._select_option()
         return None
     
     def _handle_hover(self, pos):
         """Handle mouse hover."""
-        for i, rect in self._get_option_rects():
-            if rect.collidepoint(pos):
-                self.selected_index = i
-                break
+        index = self._option_at(pos)
+        if index >= 0:
+            self.selected_index = index
     
     def draw(self):
         """Draw the cheats menu."""
         if not self.active:
             return
         
-        # Dark background
-        self.display_surface.fill(COLORS['bg_color'])
-        
-        # Title
-        draw_text(self.display_surface, "CHEATS",
-                 (WINDOW_WIDTH // 2, 60),
-                 self.large_font, COLORS['red'], center=True)
-        
-        # Warning
-        draw_text(self.display_surface, "Enabling cheats will show a watermark during gameplay",
-                 (WINDOW_WIDTH // 2, 100),
-                 self.small_font, COLORS['yellow'], center=True)
+        if self._static_layer is None:
+            self._static_layer = self._create_static_layer()
+        self.display_surface.blit(self._static_layer, (0, 0))
         
         # Scroll indicator
         options = self._get_options()
         if len(options) > self.max_visible_items:
             scroll_text = f"Showing {self.scroll_offset + 1}-{min(len(options), self.scroll_offset + self.max_visible_items)} of {len(options)}"
-            draw_text(self.display_surface, scroll_text,
-                     (WINDOW_WIDTH // 2, 140),
-                     self.small_font, COLORS['gray'], center=True)
+            self.text_cache.draw(self.display_surface, 'scroll', scroll_text,
+                                 (WINDOW_WIDTH // 2, 140),
+                                 self.small_font, COLOR_GRAY, center=True)
         
         # Options
         for i, rect in self._get_option_rects():
@@ -1107,32 +1295,50 @@ class CheatsMenu:
             
             # Different styling for separator
             if option.startswith("---"):
-                draw_text(self.display_surface, option,
-                         rect.center, self.small_font, COLORS['cyan'], center=True)
+                self.text_cache.draw(self.display_surface, i, option,
+                                     rect.center, self.small_font, COLOR_CYAN, center=True)
                 continue
             
-            bg_color = COLORS['gray'] if selected else COLORS['dark_gray']
+            bg_color = COLOR_GRAY if selected else COLOR_DARK_GRAY
             pygame.draw.rect(self.display_surface, bg_color, rect)
             
-            border_color = COLORS['gold'] if selected else COLORS['white']
+            border_color = COLOR_GOLD if selected else COLOR_WHITE
             pygame.draw.rect(self.display_surface, border_color, rect, 2)
             
             # Color coding for enabled options
             if option.startswith("[X]"):
-                text_color = COLORS['green'] if not selected else COLORS['gold']
+                text_color = COLOR_GREEN if not selected else COLOR_GOLD
             elif option.startswith("[ ]"):
-                text_color = COLORS['light_gray'] if not selected else COLORS['gold']
+                text_color = COLOR_LIGHT_GRAY if not selected else COLOR_GOLD
             else:
-                text_color = COLORS['gold'] if selected else COLORS['white']
+                text_color = COLOR_GOLD if selected else COLOR_WHITE
             
-            draw_text(self.display_surface, option,
-                     rect.center, self.font, text_color, center=True)
+            self.text_cache.draw(self.display_surface, i, option,
+                                 rect.center, self.font, text_color, center=True)
+    
+    def _create_static_layer(self):
+        """Render the parts of the menu that never change."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        
+        # Dark background
+        layer.fill(COLOR_BG)
+        
+        # Title
+        draw_text(layer, "CHEATS",
+                 (WINDOW_WIDTH // 2, 60),
+                 self.large_font, COLOR_RED, center=True)
+        
+        # Warning
+        draw_text(layer, "Enabling cheats will show a watermark during gameplay",
+                 (WINDOW_WIDTH // 2, 100),
+                 self.small_font, COLOR_YELLOW, center=True)
         
         # Instructions
-        draw_text(self.display_surface, "UP/DOWN to navigate | LEFT/RIGHT to adjust | ENTER to toggle | ESC to go back",
+        draw_text(layer, "UP/DOWN to navigate | LEFT/RIGHT to adjust | ENTER to toggle | ESC to go back",
                  (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60),
-                 self.small_font, COLORS['gray'], center=True)
+                 self.small_font, COLOR_GRAY, center=True)
         
-        draw_text(self.display_surface, "Scroll with mouse wheel if needed",
+        draw_text(layer, "Scroll with mouse wheel if needed",
                  (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 35),
-                 self.small_font, COLORS['gray'], center=True)
+                 self.small_font, COLOR_GRAY, center=True)
+        return layer
@@ -0,0 +1,22 @@
+# tests/conftest.py
+"""
+Shared test setup: headless pygame with the project root importable.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def pygame_session():
+    """Initialize pygame once for the whole test run."""
+    pygame.init()
+    yield
+    pygame.quit()
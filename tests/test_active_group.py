@@ -0,0 +1,82 @@
+# tests/test_active_group.py
+"""
+Tests for ActiveGroup's cached member list.
+"""
+
+import pygame
+
+from utils import ActiveGroup
+
+
+def make_sprites(count: int) -> list:
+    return [pygame.sprite.Sprite() for _ in range(count)]
+
+
+def test_sprites_reflects_add_remove_and_kill() -> None:
+    a, b, c = make_sprites(3)
+    group = ActiveGroup(a)
+    assert group.sprites() == [a]
+    
+    group.add(b, c)
+    assert group.sprites() == [a, b, c]
+    
+    group.remove(b)
+    assert group.sprites() == [a, c]
+    
+    c.kill()
+    assert group.sprites() == [a]
+    
+    group.empty()
+    assert group.sprites() == []
+
+
+def test_sprites_list_is_reused_until_membership_changes() -> None:
+    a, b = make_sprites(2)
+    group = ActiveGroup(a)
+    first = group.sprites()
+    assert group.sprites() is first
+    
+    group.add(b)
+    second = group.sprites()
+    assert second is not first
+    # The list handed out earlier is left untouched
+    assert first == [a]
+
+
+def test_sprites_joined_through_sprite_add_are_seen() -> None:
+    sprite, = make_sprites(1)
+    group = ActiveGroup()
+    group.sprites()
+    
+    sprite.add(group)
+    assert group.sprites() == [sprite]
+
+
+def test_killing_while_iterating_visits_each_member_once() -> None:
+    sprites = make_sprites(5)
+    group = ActiveGroup(*sprites)
+    
+    visited = []
+    for sprite in group:
+        visited.append(sprite)
+        sprite.kill()
+        # Killing a member that hasn't been visited yet must not skip it
+        if sprite is sprites[0]:
+            sprites[3].kill()
+    
+    assert visited == sprites
+    assert len(group) == 0
+    assert group.sprites() == []
+
+
+def test_adding_while_iterating_does_not_visit_new_members() -> None:
+    originals = make_sprites(3)
+    group = ActiveGroup(*originals)
+    
+    visited = []
+    for sprite in group.sprites():
+        visited.append(sprite)
+        group.add(pygame.sprite.Sprite())
+    
+    assert visited == originals
+    assert len(group) == 6
@@ -0,0 +1,48 @@
+# tests/test_beep_samples.py
+"""
+Tests that tiled beep synthesis matches direct per-sample synthesis.
+"""
+
+import math
+
+import pytest
+
+from utils import _beep_samples
+
+SAMPLE_RATE = 22050
+
+
+def direct_levels(frequency: float, duration_ms: int, volume: float) -> list:
+    """The original per-sample synthesis, before truncation to bytes."""
+    n_samples = int(SAMPLE_RATE * duration_ms / 1000)
+    return [
+        127 + 127 * volume * math.sin(2 * math.pi * frequency * i / SAMPLE_RATE)
+        for i in range(n_samples)
+    ]
+
+
+@pytest.mark.parametrize('frequency, duration_ms, volume', [
+    (880, 50, 0.2),     # the pickup beep; 2205-sample period
+    (1200, 200, 0.3),   # 18.375 samples per cycle, so the tiled period is 147
+    (441, 300, 0.3),    # 50-sample period tiled over 132 copies
+    (100, 500, 0.4),    # the death beep
+    (440.5, 100, 0.3),  # non-integer frequency: synthesized directly
+    (1, 20, 0.3),       # shorter than one period
+    (1000, 1, 0.3),     # a couple of dozen samples
+])
+def test_tiled_samples_match_direct_synthesis(frequency, duration_ms, volume) -> None:
+    levels = direct_levels(frequency, duration_ms, volume)
+    samples = _beep_samples(frequency, duration_ms, volume)
+    
+    assert len(samples) == len(levels)
+    for sample, level in zip(samples, levels):
+        if sample != int(level):
+            # Tiling only changes the rounding noise on the phase, so a byte may
+            # differ only where the exact level is a whole number (e.g. sin(k*pi)
+            # gives 127 exactly) and the noise decides the truncation
+            assert abs(sample - level) <= 1
+            assert abs(level - round(level)) < 1e-9
+
+
+def test_zero_duration_is_empty() -> None:
+    assert _beep_samples(440, 0, 0.3) == b''
@@ -0,0 +1,46 @@
+# tests/test_coalesce_mouse_motion.py
+"""
+Tests for dropping superseded mouse motion events.
+"""
+
+import pygame
+
+from utils import coalesce_mouse_motion
+
+
+def motion(x: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 0))
+
+
+def click(x: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, 0), button=1)
+
+
+def test_empty_list() -> None:
+    assert coalesce_mouse_motion([]) == []
+
+
+def test_single_motion_is_kept() -> None:
+    event = motion(1)
+    assert coalesce_mouse_motion([event]) == [event]
+
+
+def test_runs_broken_by_clicks_keep_their_last_motion() -> None:
+    events = [motion(1), motion(2), motion(3), click(3), motion(4), motion(5), click(5)]
+    
+    result = coalesce_mouse_motion(events)
+    
+    assert result == [events[2], events[3], events[5], events[6]]
+
+
+def test_trailing_motion_is_kept() -> None:
+    events = [click(1), motion(2), motion(3)]
+    
+    assert coalesce_mouse_motion(events) == [events[0], events[2]]
+
+
+def test_other_events_keep_their_order() -> None:
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    events = [key, click(1), key]
+    
+    assert coalesce_mouse_motion(events) == events
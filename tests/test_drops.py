@@ -0,0 +1,79 @@
+# tests/test_drops.py
+"""
+Tests for pooled drop reuse.
+"""
+
+import pygame
+import pytest
+
+from entities.drops import Chest, ExperienceGem, HealthPickup
+
+
+@pytest.fixture(autouse=True)
+def empty_pools():
+    """Start and end every test with no pooled drops."""
+    for cls in (ExperienceGem, HealthPickup, Chest):
+        cls._POOL.clear()
+    yield
+    for cls in (ExperienceGem, HealthPickup, Chest):
+        cls._POOL.clear()
+
+
+def test_spawn_reuses_a_killed_drop_with_fresh_state() -> None:
+    group = pygame.sprite.Group()
+    gem = ExperienceGem.spawn((10, 10), [group], 1)
+    gem.is_magnetized = True
+    gem.collected = True
+    gem.kill()
+    assert ExperienceGem._POOL == [gem]
+    
+    reused = ExperienceGem.spawn((200, 50), [group], 1)
+    
+    assert reused is gem
+    assert ExperienceGem._POOL == []
+    assert group.has(reused)
+    assert reused.pos == pygame.math.Vector2(200, 50)
+    assert reused.rect.center == (200, 50)
+    assert not reused.collected
+    assert not reused.is_magnetized
+
+
+def test_reused_gem_redraws_when_its_tier_changes() -> None:
+    gem = ExperienceGem.spawn((10, 10), [], 1)
+    small_image = gem.image
+    gem.recycle()
+    
+    reused = ExperienceGem.spawn((10, 10), [], 30)
+    
+    assert reused is gem
+    assert reused.tier == 'large'
+    assert reused.value == 30
+    assert reused.image is not small_image
+    assert reused.rect.center == (10, 10)
+
+
+def test_recycle_returns_an_ungrouped_drop_to_its_own_pool() -> None:
+    group = pygame.sprite.Group()
+    chest = Chest.spawn((0, 0), [group])
+    pickup = HealthPickup.spawn((0, 0), [group])
+    
+    # DropManager removes collected drops from their groups, then recycles
+    group.remove(chest, pickup)
+    chest.recycle()
+    pickup.recycle()
+    
+    assert Chest._POOL == [chest]
+    assert HealthPickup._POOL == [pickup]
+    assert ExperienceGem._POOL == []
+    
+    reused = HealthPickup.spawn((40, 40), [group])
+    assert reused is pickup
+    assert reused.pulse_timer == 0
+    assert reused.rect.center == (40, 40)
+
+
+def test_kill_of_an_ungrouped_drop_does_not_pool_it_twice() -> None:
+    gem = ExperienceGem.spawn((0, 0), [pygame.sprite.Group()], 1)
+    gem.kill()
+    gem.kill()
+    assert ExperienceGem._POOL == [gem]
@@ -0,0 +1,93 @@
+# tests/test_enemy_pool.py
+"""
+Tests for pooled enemy reuse and per-life hit tracking.
+"""
+
+import pygame
+import pytest
+
+from entities.enemy import Enemy, create_enemies
+from weapons.projectiles import GarlicAura, KnifeProjectile, WhipSlash
+
+
+class FakePlayer:
+    """Just enough of a player for an aura to follow."""
+    
+    def __init__(self, pos):
+        self.pos = pygame.math.Vector2(pos)
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    """Start and end every test with no pooled enemies."""
+    Enemy._POOL.clear()
+    yield
+    Enemy._POOL.clear()
+
+
+def test_killed_enemy_is_respawned_from_the_pool() -> None:
+    group = pygame.sprite.Group()
+    enemy, = create_enemies('chaser', [(100, 100)], (group,))
+    enemy.kill()
+    
+    respawned, = create_enemies('chaser', [(300, 200)], (group,))
+    
+    assert respawned is enemy
+    assert group.has(respawned)
+
+
+def test_reset_restores_per_life_state() -> None:
+    group = pygame.sprite.Group()
+    enemy, = create_enemies('chaser', [(100, 100)], (group,))
+    first_life = enemy.life
+    enemy.take_damage(1, (1, 0))
+    assert enemy.knockback_timer > 0
+    enemy.kill()
+    
+    enemy, = create_enemies('chaser', [(300, 200)], (group,))
+    
+    assert enemy.life == first_life + 1
+    assert enemy.hp == enemy.max_hp
+    assert enemy.knockback_timer == 0
+    assert enemy.knockback == pygame.math.Vector2()
+    assert enemy.image is enemy._base_image
+    assert enemy.pos == pygame.math.Vector2(300, 200)
+    assert enemy.rect.center == (300, 200)
+    assert enemy._grid is None
+
+
+def test_garlic_hits_a_respawned_enemy_immediately() -> None:
+    group = pygame.sprite.Group()
+    aura = GarlicAura(FakePlayer((100, 100)), (), damage=1, radius=60, tick_rate=10)
+    enemy, = create_enemies('chaser', [(100, 100)], (group,))
+    
+    assert aura.can_damage_enemy(enemy)
+    assert not aura.can_damage_enemy(enemy)
+    
+    enemy.kill()
+    respawned, = create_enemies('chaser', [(100, 100)], (group,))
+    
+    # Same object, new life: the old tick must not shield it
+    assert respawned is enemy
+    assert aura.can_damage_enemy(respawned)
+    assert not aura.can_damage_enemy(respawned)
+
+
+@pytest.mark.parametrize('make_attack', [
+    lambda: KnifeProjectile((100, 100), (1, 0), (), damage=1, speed=0, pierce=5),
+    lambda: WhipSlash((100, 100), (1, 0), (), damage=1),
+])
+def test_live_attack_hits_a_respawned_enemy_again(make_attack) -> None:
+    group = pygame.sprite.Group()
+    attack = make_attack()
+    enemy, = create_enemies('chaser', [(100, 100)], (group,))
+    
+    assert attack.hit_enemy(enemy)
+    assert not attack.hit_enemy(enemy)
+    
+    enemy.kill()
+    respawned, = create_enemies('chaser', [(100, 100)], (group,))
+    
+    assert respawned is enemy
+    assert attack.hit_enemy(respawned)
+    assert not attack.hit_enemy(respawned)
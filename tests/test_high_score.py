@@ -0,0 +1,80 @@
+# tests/test_high_score.py
+"""
+Tests for the cached high score record and its atomic file replacement.
+"""
+
+import json
+import os
+
+import pytest
+
+import utils
+from utils import load_high_score, save_high_score
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Every test starts with nothing read from disk yet."""
+    utils._HIGH_SCORE_CACHE.clear()
+    yield
+    utils._HIGH_SCORE_CACHE.clear()
+
+
+@pytest.fixture
+def score_file(tmp_path) -> str:
+    return str(tmp_path / 'highscore.json')
+
+
+def test_missing_file_reads_as_zero(score_file: str) -> None:
+    assert load_high_score(score_file) == (0, 0)
+
+
+def test_save_then_load(score_file: str) -> None:
+    assert save_high_score(10, 60, score_file)
+    
+    assert load_high_score(score_file) == (10, 60)
+    with open(score_file) as f:
+        assert json.load(f) == {'high_score': 10, 'best_time': 60}
+    assert not os.path.exists(score_file + '.tmp')
+    
+    # A fresh read from disk agrees with the cached record
+    utils._HIGH_SCORE_CACHE.clear()
+    assert load_high_score(score_file) == (10, 60)
+
+
+def test_each_value_keeps_its_own_best(score_file: str) -> None:
+    save_high_score(10, 60, score_file)
+    
+    assert save_high_score(5, 120, score_file)
+    assert load_high_score(score_file) == (10, 120)
+
+
+def test_no_rewrite_when_neither_value_improves(score_file: str, monkeypatch) -> None:
+    save_high_score(10, 60, score_file)
+    
+    # save_high_score swallows errors, so record calls instead of raising
+    calls = []
+    monkeypatch.setattr(utils, 'open', lambda *args: calls.append(args), raising=False)
+    monkeypatch.setattr(utils.os, 'replace', lambda *args: calls.append(args))
+    
+    assert not save_high_score(10, 60, score_file)
+    assert not save_high_score(3, 30, score_file)
+    assert calls == []
+    assert load_high_score(score_file) == (10, 60)
+
+
+@pytest.mark.parametrize('contents', ['{not json', '[1, 2]', ''])
+def test_corrupt_file_reads_as_zero(score_file: str, contents: str) -> None:
+    with open(score_file, 'w') as f:
+        f.write(contents)
+    
+    assert load_high_score(score_file) == (0, 0)
+
+
+def test_save_over_a_corrupt_file_replaces_it(score_file: str) -> None:
+    with open(score_file, 'w') as f:
+        f.write('{not json')
+    
+    assert save_high_score(4, 20, score_file)
+    with open(score_file) as f:
+        assert json.load(f) == {'high_score': 4, 'best_time': 20}
@@ -0,0 +1,110 @@
+# tests/test_spatial_grid.py
+"""
+Tests for the SpatialGrid used by enemies, drops and weapons.
+"""
+
+import pygame
+import pytest
+
+from entities.enemy import Enemy, create_enemies, update_enemies
+from utils import ActiveGroup, SpatialGrid
+
+
+class Thing:
+    """Minimal hashable entity for grid tests."""
+
+
+@pytest.fixture
+def grid() -> SpatialGrid:
+    return SpatialGrid(cell_size=64)
+
+
+def test_insert_and_move_across_cell_boundary(grid: SpatialGrid) -> None:
+    thing = Thing()
+    grid.insert(thing, (60, 10))
+    assert grid.entity_cells[thing] == (0, 0)
+    
+    # Moving within the cell keeps the same bucket
+    grid.move(thing, (63.9, 10))
+    assert grid.entity_cells[thing] == (0, 0)
+    
+    # Crossing the boundary re-buckets and drops the emptied cell
+    grid.move(thing, (64, 10))
+    assert grid.entity_cells[thing] == (1, 0)
+    assert (0, 0) not in grid.cells
+    assert grid.cells[(1, 0)] == {thing}
+    assert len(grid) == 1
+
+
+def test_remove_missing_entity_is_a_no_op(grid: SpatialGrid) -> None:
+    present = Thing()
+    grid.insert(present, (10, 10))
+    
+    grid.remove(Thing())
+    
+    assert len(grid) == 1
+    assert grid.query((10, 10), 1) == [present]
+
+
+def test_remove_twice_is_a_no_op(grid: SpatialGrid) -> None:
+    thing = Thing()
+    grid.insert(thing, (10, 10))
+    grid.remove(thing)
+    grid.remove(thing)
+    assert len(grid) == 0
+    assert grid.cells == {}
+
+
+def test_query_covers_cells_touched_by_the_square(grid: SpatialGrid) -> None:
+    left = Thing()
+    right = Thing()
+    grid.insert(left, (63, 10))
+    grid.insert(right, (64, 10))
+    
+    # A square ending exactly on the boundary still touches the next cell
+    assert set(grid.query((0, 10), 64)) == {left, right}
+    assert grid.query((0, 10), 63) == [left]
+
+
+def test_query_with_negative_coordinates(grid: SpatialGrid) -> None:
+    below = Thing()
+    above = Thing()
+    grid.insert(below, (-1, -1))
+    grid.insert(above, (0, 0))
+    
+    # Floor division puts -1 in cell -1, not cell 0
+    assert grid.entity_cells[below] == (-1, -1)
+    assert grid.query((-10, -10), 5) == [below]
+    assert set(grid.query((0, 0), 1)) == {below, above}
+
+
+def test_query_rect_margin_at_cell_edges(grid: SpatialGrid) -> None:
+    near = Thing()
+    behind = Thing()
+    grid.insert(near, (140, 10))
+    grid.insert(behind, (-10, 10))
+    rect = pygame.Rect(0, 0, 64, 20)
+    
+    # Without a margin only cells 0 and 1 are touched (the right edge is x=64)
+    assert grid.query_rect(rect) == []
+    # One pixel of margin reaches x=-1, in cell -1
+    assert grid.query_rect(rect, 1) == [behind]
+    # Cell 2 starts at x=128, so it takes a margin of exactly 64
+    assert grid.query_rect(rect, 63) == [behind]
+    assert set(grid.query_rect(rect, 64)) == {near, behind}
+
+
+def test_len_tracks_enemy_group_after_kill(grid: SpatialGrid) -> None:
+    Enemy._POOL.clear()
+    group = ActiveGroup()
+    enemies = create_enemies('chaser', [(100, 100), (300, 300), (500, 100)], (group,))
+    update_enemies(group.sprites(), 0.0, (400, 400), grid)
+    assert len(grid) == len(group) == 3
+    
+    enemies[1].kill()
+    assert len(grid) == len(group) == 2
+    
+    # Killing an already-dead enemy changes nothing
+    enemies[1].kill()
+    assert len(grid) == len(group) == 2
+    Enemy._POOL.clear()
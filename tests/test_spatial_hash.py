@@ -0,0 +1,66 @@
+# tests/test_spatial_hash.py
+"""
+Tests for SpatialHash's packed integer cell keys.
+"""
+
+import pytest
+
+from utils import SpatialHash, _CELL_LIMIT
+
+
+@pytest.fixture
+def spatial_hash() -> SpatialHash:
+    return SpatialHash(cell_size=10)
+
+
+def test_neighbours_across_the_origin(spatial_hash: SpatialHash) -> None:
+    # One entity in each of the four cells meeting at (0, 0)
+    spatial_hash.insert('nw', (-1, -1))
+    spatial_hash.insert('ne', (1, -1))
+    spatial_hash.insert('sw', (-1, 1))
+    spatial_hash.insert('se', (1, 1))
+    
+    for pos in ((-5, -5), (5, -5), (-5, 5), (5, 5)):
+        assert sorted(spatial_hash.get_nearby(pos)) == ['ne', 'nw', 'se', 'sw']
+
+
+def test_negative_cells_stay_apart(spatial_hash: SpatialHash) -> None:
+    spatial_hash.insert('near', (-15, -15))
+    spatial_hash.insert('far', (-35, -15))
+    
+    assert spatial_hash.get_nearby((-5, -5)) == ['near']
+    assert sorted(spatial_hash.get_nearby((-25, -15))) == ['far', 'near']
+
+
+@pytest.mark.parametrize('row', [2 ** 15 - 1, 2 ** 15, 2 ** 16 + 3, -(2 ** 15) - 1])
+def test_neighbours_in_rows_past_the_half_range(spatial_hash: SpatialHash, row: int) -> None:
+    y = row * 10 + 5
+    spatial_hash.insert('here', (5, y))
+    spatial_hash.insert('above', (-5, y - 10))
+    spatial_hash.insert('below', (15, y + 10))
+    spatial_hash.insert('two_rows_down', (5, y + 20))
+    
+    assert sorted(spatial_hash.get_nearby((5, y))) == ['above', 'below', 'here']
+
+
+def test_columns_at_the_limit_do_not_alias_other_rows(spatial_hash: SpatialHash) -> None:
+    right_edge = (_CELL_LIMIT - 1) * 10 + 5
+    left_edge = -_CELL_LIMIT * 10 + 5
+    spatial_hash.insert('right', (right_edge, 5))
+    spatial_hash.insert('left_next_row', (left_edge, 15))
+    spatial_hash.insert('left_prev_row', (left_edge, -5))
+    
+    assert spatial_hash.get_nearby((right_edge, 5)) == ['right']
+    assert spatial_hash.get_nearby((left_edge, 5)) == ['left_prev_row', 'left_next_row']
+
+
+@pytest.mark.parametrize('x', [_CELL_LIMIT * 10, -_CELL_LIMIT * 10 - 1])
+def test_positions_outside_the_packable_range_are_rejected(spatial_hash: SpatialHash, x: int) -> None:
+    with pytest.raises(ValueError):
+        spatial_hash.insert('out', (x, 0))
+
+
+def test_radius_outside_the_packable_range_is_rejected(spatial_hash: SpatialHash) -> None:
+    with pytest.raises(ValueError):
+        spatial_hash.get_nearby((0, 0), _CELL_LIMIT)
+    assert _CELL_LIMIT not in spatial_hash._neighbor_offsets
@@ -0,0 +1,99 @@
+# tests/test_text_cache.py
+"""
+Tests that cached text is only re-rendered when its inputs change.
+"""
+
+import pygame
+import pytest
+
+from utils import TextCache, draw_text
+
+
+class CountingFont:
+    """Wraps a real font and counts how many times text is rendered."""
+    
+    def __init__(self):
+        self.font = pygame.font.Font(None, 24)
+        self.renders = 0
+    
+    def render(self, text, antialias, color):
+        self.renders += 1
+        return self.font.render(text, antialias, color)
+
+
+@pytest.fixture
+def font() -> CountingFont:
+    return CountingFont()
+
+
+@pytest.fixture
+def screen() -> pygame.Surface:
+    return pygame.Surface((200, 100))
+
+
+def test_slot_renders_once_for_an_unchanged_value(font: CountingFont, screen: pygame.Surface) -> None:
+    cache = TextCache()
+    for _ in range(3):
+        cache.draw(screen, 'kills', "Kills: 1", (0, 0), font)
+    
+    # Text plus its shadow, rendered once
+    assert font.renders == 2
+
+
+def test_slot_rerenders_on_a_changed_value(font: CountingFont, screen: pygame.Surface) -> None:
+    cache = TextCache()
+    cache.draw(screen, 'kills', "Kills: 1", (0, 0), font)
+    cache.draw(screen, 'kills', "Kills: 2", (0, 0), font)
+    cache.draw(screen, 'kills', "Kills: 2", (0, 0), font)
+    
+    assert font.renders == 4
+
+
+def test_slot_rerenders_on_a_color_change(font: CountingFont, screen: pygame.Surface) -> None:
+    cache = TextCache()
+    cache.draw(screen, 'title', "Paused", (0, 0), font, (255, 255, 255), shadow=False)
+    cache.draw(screen, 'title', "Paused", (0, 0), font, (255, 0, 0), shadow=False)
+    
+    assert font.renders == 2
+    
+    # The slot now holds the red render
+    screen.fill((0, 0, 0))
+    cache.draw(screen, 'title', "Paused", (0, 0), font, (255, 0, 0), shadow=False)
+    assert font.renders == 2
+    colors = {tuple(screen.get_at((x, y))) for x in range(60) for y in range(20)}
+    assert (255, 0, 0, 255) in colors
+    assert (255, 255, 255, 255) not in colors
+
+
+def test_slots_are_independent(font: CountingFont, screen: pygame.Surface) -> None:
+    cache = TextCache()
+    cache.draw(screen, 'a', "Same", (0, 0), font, shadow=False)
+    cache.draw(screen, 'b', "Same", (0, 20), font, shadow=False)
+    cache.draw(screen, 'a', "Same", (0, 0), font, shadow=False)
+    
+    assert font.renders == 2
+
+
+def test_clear_forces_a_rerender(font: CountingFont, screen: pygame.Surface) -> None:
+    cache = TextCache()
+    cache.draw(screen, 'a', "Text", (0, 0), font, shadow=False)
+    cache.clear()
+    cache.draw(screen, 'a', "Text", (0, 0), font, shadow=False)
+    
+    assert font.renders == 2
+
+
+def test_draw_text_renders_each_combination_once(font: CountingFont, screen: pygame.Surface) -> None:
+    draw_text(screen, "Level 2", (0, 0), font)
+    draw_text(screen, "Level 2", (50, 50), font, center=True)
+    assert font.renders == 2
+    
+    # Lists and tuples of the same color share an entry
+    draw_text(screen, "Level 2", (0, 0), font, [255, 255, 255])
+    assert font.renders == 2
+    
+    draw_text(screen, "Level 2", (0, 0), font, (0, 255, 0))
+    assert font.renders == 4
+    
+    draw_text(screen, "Level 3", (0, 0), font, (0, 255, 0))
+    assert font.renders == 6
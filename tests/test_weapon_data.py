@@ -0,0 +1,49 @@
+"""Tests for the read-only WEAPON_DATA entries shared by weapon instances."""
+
+import pygame
+import pytest
+
+from settings import WEAPON_DATA
+from weapons.controller import KnifeWeapon, WhipWeapon
+
+
+class FakePlayer:
+    def __init__(self) -> None:
+        self.pos = pygame.Vector2(0, 0)
+        self.might = 1.0
+        self.cooldown_reduction = 0.0
+
+
+def make_whip() -> WhipWeapon:
+    group = pygame.sprite.Group()
+    return WhipWeapon(FakePlayer(), group, group, group)
+
+
+@pytest.mark.parametrize('weapon_id', list(WEAPON_DATA))
+def test_entries_and_scaling_are_read_only(weapon_id: str) -> None:
+    entry = WEAPON_DATA[weapon_id]
+    with pytest.raises(TypeError):
+        entry['base_damage'] = 0
+    with pytest.raises(TypeError):
+        entry['scaling']['damage'] = 0
+
+
+def test_weapons_share_their_entry() -> None:
+    assert make_whip().data is make_whip().data is WEAPON_DATA['whip']
+
+
+def test_evolving_one_weapon_leaves_the_shared_entry_alone() -> None:
+    evolved = make_whip()
+    assert evolved.evolve()
+    fresh = make_whip()
+    
+    assert evolved.name != WEAPON_DATA['whip']['name']
+    assert fresh.name == WEAPON_DATA['whip']['name']
+    assert fresh.color == WEAPON_DATA['whip']['color']
+    assert fresh.damage == WEAPON_DATA['whip']['base_damage']
+
+
+def test_level_up_reads_scaling_without_copying() -> None:
+    knife = KnifeWeapon(FakePlayer(), *(pygame.sprite.Group(),) * 3)
+    knife.level_up()
+    assert knife.damage == WEAPON_DATA['knife']['base_damage'] + WEAPON_DATA['knife']['scaling']['damage']
@@ -8,6 +8,8 @@ import math
 import random
 import json
 import os
+from collections.abc import Iterable
+from functools import lru_cache
 from settings import SOUND_SETTINGS, WINDOW_WIDTH, WINDOW_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
 
 
@@ -76,10 +78,16 @@ class CooldownTimer:
         """Reset the cooldown."""
         self.last_time = pygame.time.get_ticks()
     
+    def set_duration(self, duration):
+        """Change the cooldown length without restarting the current cooldown."""
+        self.duration = duration
+    
     def use(self):
         """Use the ability if ready, returns True if successful."""
-        if self.ready():
-            self.reset()
+        # Same check as ready() + reset(), reading the clock only once
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_time >= self.duration * 1000:
+            self.last_time = current_time
             return True
         return False
     
@@ -105,20 +113,29 @@ def clamp_vector_to_world(pos):
 
 def distance(pos1, pos2):
     """Calculate distance between two positions."""
-    return math.sqrt((pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2)
+    # Vector2 does the whole calculation in C (pos2 may be any 2-sequence)
+    if isinstance(pos1, pygame.math.Vector2):
+        return pos1.distance_to(pos2)
+    return math.hypot(pos2[0] - pos1[0], pos2[1] - pos1[1])
 
 
 def distance_squared(pos1, pos2):
     """Calculate squared distance (faster, no sqrt)."""
-    return (pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2
+    if isinstance(pos1, pygame.math.Vector2):
+        return pos1.distance_squared_to(pos2)
+    dx = pos2[0] - pos1[0]
+    dy = pos2[1] - pos1[1]
+    return dx * dx + dy * dy
 
 
 def normalize_vector(vec):
     """Normalize a vector to unit length."""
-    length = math.sqrt(vec[0]**2 + vec[1]**2)
+    x = vec[0]
+    y = vec[1]
+    length = math.hypot(x, y)
     if length == 0:
         return (0, 0)
-    return (vec[0] / length, vec[1] / length)
+    return (x / length, y / length)
 
 
 def angle_to_vector(angle_degrees):
@@ -132,62 +149,126 @@ def vector_to_angle(vec):
     return math.degrees(math.atan2(vec[1], vec[0]))
 
 
+# Sine lookup table for visual-only animation and spawn directions (1024 steps per turn)
+_SIN_TABLE = tuple(math.sin(2 * math.pi * i / 1024) for i in range(1024))
+_SIN_SCALE = 1024 / (2 * math.pi)
+
+
+def fast_sin(x: float) -> float:
+    """Approximate math.sin(x) with a lookup table."""
+    return _SIN_TABLE[int(x * _SIN_SCALE) & 1023]
+
+
 def get_spawn_position_on_ring(center, min_radius, max_radius=None):
     """Get a random position on a ring around center."""
     if max_radius is None:
         max_radius = min_radius
     
-    angle = random.uniform(0, 2 * math.pi)
+    # Random direction from the sine table; cos is the same table a quarter turn on
+    step = random.getrandbits(10)
     radius = random.uniform(min_radius, max_radius)
     
-    x = center[0] + math.cos(angle) * radius
-    y = center[1] + math.sin(angle) * radius
+    x = center[0] + _SIN_TABLE[(step + 256) & 1023] * radius
+    y = center[1] + _SIN_TABLE[step] * radius
     
     return pygame.math.Vector2(x, y)
 
 
+# Half the screen diagonal, the base radius of the off-camera spawn ring
+_HALF_SCREEN_DIAGONAL = math.sqrt((WINDOW_WIDTH/2)**2 + (WINDOW_HEIGHT/2)**2)
+
+
 def get_spawn_position_outside_camera(player_pos, buffer=100):
     """Get a spawn position just outside the camera view."""
     # Calculate spawn ring radius (half screen diagonal + buffer)
-    spawn_radius = math.sqrt((WINDOW_WIDTH/2)**2 + (WINDOW_HEIGHT/2)**2) + buffer
+    spawn_radius = _HALF_SCREEN_DIAGONAL + buffer
     
-    angle = random.uniform(0, 2 * math.pi)
-    x = player_pos[0] + math.cos(angle) * spawn_radius
-    y = player_pos[1] + math.sin(angle) * spawn_radius
+    # Random direction from the sine table; cos is the same table a quarter turn on
+    step = random.getrandbits(10)
+    x = player_pos[0] + _SIN_TABLE[(step + 256) & 1023] * spawn_radius
+    y = player_pos[1] + _SIN_TABLE[step] * spawn_radius
     
     # Clamp to world bounds
-    x = clamp(x, 50, WORLD_WIDTH - 50)
-    y = clamp(y, 50, WORLD_HEIGHT - 50)
+    x = min(max(x, 50), WORLD_WIDTH - 50)
+    y = min(max(y, 50), WORLD_HEIGHT - 50)
     
     return pygame.math.Vector2(x, y)
 
 
-def get_closest_enemy(pos, enemy_group, max_range=None):
-    """Find the closest enemy to a position."""
-    closest = None
-    closest_dist_sq = float('inf')
-    
+def get_closest_enemy(pos, enemy_group, max_range=None, grid=None):
+    """
+    Find the closest enemy to a position.
+    If a grid holding every enemy is given, only nearby cells are searched.
+    """
     if max_range:
         max_range_sq = max_range ** 2
     else:
         max_range_sq = float('inf')
     
-    for enemy in enemy_group:
-        dist_sq = distance_squared(pos, enemy.rect.center)
+    if grid is not None and len(grid) == len(enemy_group):
+        return _closest_in_grid(pos, grid, max_range, max_range_sq)
+    return _closest_of(pos, enemy_group, max_range_sq)[0]
+
+
+def _closest_of(
+    pos: pygame.Vector2 | tuple[float, float],
+    enemies: Iterable[pygame.sprite.Sprite],
+    max_range_sq: float,
+) -> tuple[pygame.sprite.Sprite | None, float]:
+    """Scan enemies for the closest one, returning (enemy, dist_sq)."""
+    closest = None
+    closest_dist_sq = float('inf')
+    
+    # Distance math inlined; this scans every enemy given
+    px = pos[0]
+    py = pos[1]
+    for enemy in enemies:
+        cx, cy = enemy.rect.center
+        dx = cx - px
+        dy = cy - py
+        dist_sq = dx * dx + dy * dy
         if dist_sq < closest_dist_sq and dist_sq <= max_range_sq:
             closest_dist_sq = dist_sq
             closest = enemy
     
-    return closest
+    return closest, closest_dist_sq
+
+
+def _closest_in_grid(
+    pos: pygame.Vector2 | tuple[float, float],
+    grid: 'SpatialGrid',
+    max_range: float | None,
+    max_range_sq: float,
+) -> pygame.sprite.Sprite | None:
+    """
+    Search a growing square of grid cells until the closest hit lies within it.
+    Anything outside the square is farther away than the search radius.
+    """
+    radius = grid.cell_size
+    limit = max(WORLD_WIDTH, WORLD_HEIGHT)
+    if max_range:
+        limit = min(limit, max_range)
+    
+    while True:
+        # One extra pixel covers rect.center rounding away from the bucketed pos
+        closest, dist_sq = _closest_of(pos, grid.query(pos, radius + 1), max_range_sq)
+        if dist_sq <= radius * radius or radius >= limit:
+            return closest
+        radius *= 2
 
 
 def get_enemies_in_range(pos, enemy_group, range_radius):
     """Get all enemies within a certain range."""
     range_sq = range_radius ** 2
+    px = pos[0]
+    py = pos[1]
     enemies = []
     
     for enemy in enemy_group:
-        if distance_squared(pos, enemy.rect.center) <= range_sq:
+        cx, cy = enemy.rect.center
+        dx = cx - px
+        dy = cy - py
+        if dx * dx + dy * dy <= range_sq:
             enemies.append(enemy)
     
     return enemies
@@ -200,31 +281,66 @@ def lerp(a, b, t):
 
 def ease_out_quad(t):
     """Quadratic ease out function."""
-    return 1 - (1 - t) ** 2
+    return t * (2 - t)
 
 
 def ease_in_out_quad(t):
     """Quadratic ease in-out function."""
     if t < 0.5:
         return 2 * t * t
-    return 1 - (-2 * t + 2) ** 2 / 2
+    u = 2 - 2 * t
+    return 1 - u * u / 2
+
+
+def coalesce_mouse_motion(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    """Drop mouse motion events that are immediately followed by another one."""
+    # Menus only care where the cursor ended up, so a run of motions becomes its last event
+    motion = pygame.MOUSEMOTION
+    last = len(events) - 1
+    return [event for i, event in enumerate(events)
+            if event.type != motion or i == last or events[i + 1].type != motion]
 
 
 # Sound generation
+def _beep_samples(frequency: float, duration_ms: float, volume: float) -> bytes:
+    """Build the raw sample bytes for a beep."""
+    sample_rate = 22050
+    n_samples = int(sample_rate * duration_ms / 1000)
+    
+    # A whole-hertz tone repeats exactly every sample_rate / gcd samples, so
+    # only one period is synthesized and then tiled. Bytes can differ from
+    # direct synthesis only where the exact level is a whole number and phase
+    # rounding noise decides the truncation
+    period = n_samples
+    if isinstance(frequency, int) and frequency > 0:
+        period = min(n_samples, sample_rate // math.gcd(sample_rate, frequency))
+    
+    # Per-sample phase step and amplitude hoisted out of the loop
+    step = 2 * math.pi * frequency / sample_rate
+    amplitude = 127 * volume
+    sin = math.sin
+    cycle = bytes([int(127 + amplitude * sin(step * i)) for i in range(period)])
+    if period == n_samples:
+        return cycle
+    return (cycle * -(-n_samples // period))[:n_samples]
+
+
+# Generated sounds keyed by (frequency, duration_ms, volume); failures are not cached
+_SOUND_CACHE = {}
+
+
 def generate_beep(frequency, duration_ms, volume=0.3):
-    """Generate a simple beep sound."""
+    """Generate a simple beep sound (once per distinct beep)."""
+    key = (frequency, duration_ms, volume)
+    sound = _SOUND_CACHE.get(key)
+    if sound is not None:
+        return sound
+    
     try:
-        sample_rate = 22050
-        n_samples = int(sample_rate * duration_ms / 1000)
-        
-        # Generate samples
-        buf = bytes(
-            int(127 + 127 * volume * math.sin(2 * math.pi * frequency * i / sample_rate))
-            for i in range(n_samples)
-        )
-        
+        buf = _beep_samples(frequency, duration_ms, volume)
         sound = pygame.mixer.Sound(buffer=buf)
         sound.set_volume(volume)
+        _SOUND_CACHE[key] = sound
         return sound
     except Exception:
         return None
@@ -274,8 +390,20 @@ class SoundManager:
 
 
 # High score management
+# Records per file, read from disk once and kept in step with every save
+_HIGH_SCORE_CACHE = {}
+
+
 def load_high_score(filename='highscore.json'):
-    """Load high score from file."""
+    """Load high score from file (read once, then served from memory)."""
+    record = _HIGH_SCORE_CACHE.get(filename)
+    if record is None:
+        record = _HIGH_SCORE_CACHE[filename] = _read_high_score(filename)
+    return record
+
+
+def _read_high_score(filename: str) -> tuple[int, float]:
+    """Read the high score record from disk."""
     try:
         if os.path.exists(filename):
             with open(filename, 'r') as f:
@@ -291,11 +419,17 @@ def save_high_score(score, time_survived, filename='highscore.json'):
     try:
         current_score, current_time = load_high_score(filename)
         if score > current_score or time_survived > current_time:
-            with open(filename, 'w') as f:
+            record = (max(score, current_score), max(time_survived, current_time))
+            
+            # Write to a temp file and swap it in, so a crash can't truncate the record
+            temp_filename = filename + '.tmp'
+            with open(temp_filename, 'w') as f:
                 json.dump({
-                    'high_score': max(score, current_score),
-                    'best_time': max(time_survived, current_time)
+                    'high_score': record[0],
+                    'best_time': record[1]
                 }, f)
+            os.replace(temp_filename, filename)
+            _HIGH_SCORE_CACHE[filename] = record
             return True
     except Exception:
         pass
@@ -304,15 +438,50 @@ def save_high_score(score, time_survived, filename='highscore.json'):
 
 def format_time(seconds):
     """Format seconds into MM:SS string."""
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format a whole number of seconds; the string only changes once a second."""
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
 
 
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font at a size, loaded once and shared by all callers."""
+    return pygame.font.Font(None, size)
+
+
 def draw_text(surface, text, pos, font, color=(255, 255, 255), center=False, shadow=True):
     """Draw text with optional shadow."""
-    if shadow:
-        shadow_surf = font.render(text, True, (0, 0, 0))
+    shadow_surf, text_surf = _render_text(text, font, tuple(color), shadow)
+    _blit_text(surface, shadow_surf, text_surf, pos, center)
+
+
+@lru_cache(maxsize=256)
+def _render_text(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, ...],
+    shadow: bool,
+) -> tuple[pygame.Surface | None, pygame.Surface]:
+    """Render text and its shadow once per (text, font, color, shadow)."""
+    shadow_surf = prepare_surface(font.render(text, True, (0, 0, 0))) if shadow else None
+    text_surf = prepare_surface(font.render(text, True, color))
+    return shadow_surf, text_surf
+
+
+def _blit_text(
+    surface: pygame.Surface,
+    shadow_surf: pygame.Surface | None,
+    text_surf: pygame.Surface,
+    pos: tuple[float, float],
+    center: bool,
+) -> None:
+    """Blit rendered text (and its shadow, if any) at pos."""
+    if shadow_surf is not None:
         shadow_rect = shadow_surf.get_rect()
         if center:
             shadow_rect.center = (pos[0] + 2, pos[1] + 2)
@@ -320,7 +489,6 @@ def draw_text(surface, text, pos, font, color=(255, 255, 255), center=False, sha
             shadow_rect.topleft = (pos[0] + 2, pos[1] + 2)
         surface.blit(shadow_surf, shadow_rect)
     
-    text_surf = font.render(text, True, color)
     text_rect = text_surf.get_rect()
     if center:
         text_rect.center = pos
@@ -329,6 +497,30 @@ def draw_text(surface, text, pos, font, color=(255, 255, 255), center=False, sha
     surface.blit(text_surf, text_rect)
 
 
+class TextCache:
+    """
+    Rendered text kept per named slot.
+    A slot is only re-rendered when its text, font, color or shadow changes.
+    """
+    
+    def __init__(self):
+        self.slots = {}
+    
+    def draw(self, surface, slot, text, pos, font, color=(255, 255, 255), center=False, shadow=True):
+        """Draw text like draw_text, reusing the slot's surfaces when unchanged."""
+        key = (text, font, color, shadow)
+        entry = self.slots.get(slot)
+        if entry is None or entry[0] != key:
+            shadow_surf = prepare_surface(font.render(text, True, (0, 0, 0))) if shadow else None
+            text_surf = prepare_surface(font.render(text, True, color))
+            entry = self.slots[slot] = (key, shadow_surf, text_surf)
+        _blit_text(surface, entry[1], entry[2], pos, center)
+    
+    def clear(self):
+        """Drop all cached surfaces."""
+        self.slots.clear()
+
+
 def draw_bar(surface, pos, size, progress, color, bg_color=(50, 50, 50), border_color=(255, 255, 255)):
     """Draw a progress bar."""
     x, y = pos
@@ -346,6 +538,13 @@ def draw_bar(surface, pos, size, progress, color, bg_color=(50, 50, 50), border_
     pygame.draw.rect(surface, border_color, (x, y, width, height), 2)
 
 
+def prepare_surface(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display's pixel format for faster blits."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
 def draw_polygon(surface, color, center, size, sides, rotation=0):
     """Draw a regular polygon."""
     points = []
@@ -357,16 +556,30 @@ def draw_polygon(surface, color, center, size, sides, rotation=0):
     pygame.draw.polygon(surface, color, points)
 
 
+# Cells are keyed by a single int, cy * _CELL_ROW + cx, instead of a (cx, cy)
+# tuple, so neighbouring cells are a fixed integer offset away. Rows are
+# unbounded, but a column only stays unique while |cx| < _CELL_ROW // 2; cx is
+# kept within +-_CELL_LIMIT and neighbour radii below _CELL_LIMIT, so even a
+# neighbour offset can't wrap into the next row
+_CELL_ROW = 1 << 16
+_CELL_LIMIT = _CELL_ROW // 4
+
+
 class SpatialHash:
     """Simple spatial hash for collision optimization."""
     
     def __init__(self, cell_size=100):
         self.cell_size = cell_size
         self.cells = {}
+        self._neighbor_offsets = {}
     
     def _get_cell(self, pos):
-        """Get cell coordinates for a position."""
-        return (int(pos[0] // self.cell_size), int(pos[1] // self.cell_size))
+        """Get the cell key for a position."""
+        size = self.cell_size
+        cx = int(pos[0] // size)
+        if not -_CELL_LIMIT <= cx < _CELL_LIMIT:
+            raise ValueError(f"x={pos[0]} is outside the packable cell range")
+        return int(pos[1] // size) * _CELL_ROW + cx
     
     def clear(self):
         """Clear all cells."""
@@ -374,20 +587,131 @@ class SpatialHash:
     
     def insert(self, entity, pos):
         """Insert an entity at a position."""
-        cell = self._get_cell(pos)
-        if cell not in self.cells:
-            self.cells[cell] = []
-        self.cells[cell].append(entity)
+        self.cells.setdefault(self._get_cell(pos), []).append(entity)
     
     def get_nearby(self, pos, radius=1):
         """Get all entities in nearby cells."""
-        center_cell = self._get_cell(pos)
-        nearby = []
-        
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                cell = (center_cell[0] + dx, center_cell[1] + dy)
-                if cell in self.cells:
-                    nearby.extend(self.cells[cell])
+        offsets = self._neighbor_offsets.get(radius)
+        if offsets is None:
+            if not 0 <= radius < _CELL_LIMIT:
+                raise ValueError(f"neighbour radius {radius} is outside the packable range")
+            offsets = self._neighbor_offsets[radius] = [
+                dy * _CELL_ROW + dx
+                for dx in range(-radius, radius + 1)
+                for dy in range(-radius, radius + 1)
+            ]
         
+        center = self._get_cell(pos)
+        cells = self.cells
+        nearby = []
+        for offset in offsets:
+            bucket = cells.get(center + offset)
+            if bucket:
+                nearby.extend(bucket)
         return nearby
+
+
+class SpatialGrid:
+    """
+    Uniform grid for entities that persist across frames.
+    Entities are re-bucketed only when they cross a cell boundary.
+    """
+    
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entity_cells = {}
+    
+    def _get_cell(self, pos):
+        """Get cell coordinates for a position."""
+        return (int(pos[0] // self.cell_size), int(pos[1] // self.cell_size))
+    
+    def __len__(self):
+        return len(self.entity_cells)
+    
+    def clear(self):
+        """Remove every entity."""
+        self.cells.clear()
+        self.entity_cells.clear()
+    
+    def insert(self, entity, pos):
+        """Insert an entity at a position."""
+        cell = self._get_cell(pos)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = set()
+        bucket.add(entity)
+        self.entity_cells[entity] = cell
+    
+    def remove(self, entity):
+        """Remove an entity if it is in the grid."""
+        cell = self.entity_cells.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        bucket.discard(entity)
+        if not bucket:
+            del self.cells[cell]
+    
+    def move(self, entity, pos):
+        """Update an entity's position, re-bucketing only if its cell changed."""
+        cell = self._get_cell(pos)
+        if self.entity_cells.get(entity) != cell:
+            self.remove(entity)
+            self.insert(entity, pos)
+    
+    def query(self, pos, radius):
+        """Get all entities in the cells overlapping a square around pos."""
+        return self._query_area(pos[0] - radius, pos[1] - radius,
+                                pos[0] + radius, pos[1] + radius)
+    
+    def query_rect(self, rect, margin=0):
+        """Get all entities in the cells overlapping a rect grown by margin."""
+        return self._query_area(rect.left - margin, rect.top - margin,
+                                rect.right + margin, rect.bottom + margin)
+    
+    def _query_area(self, left, top, right, bottom):
+        """Get all entities in the cells overlapping an area."""
+        size = self.cell_size
+        min_x = int(left // size)
+        max_x = int(right // size)
+        min_y = int(top // size)
+        max_y = int(bottom // size)
+        
+        cells = self.cells
+        found = []
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
+class ActiveGroup(pygame.sprite.Group):
+    """
+    Sprite group that keeps a plain list of its members for hot loops.
+    The list is rebuilt only after membership changes, so iterating the
+    group doesn't copy the sprite dict every frame. Treat sprites() as
+    read-only; killing members mid-loop is safe because changes swap in
+    a new list rather than editing the one being iterated.
+    """
+    
+    def __init__(self, *sprites):
+        self._active = []
+        super().__init__(*sprites)
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._active = None
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._active = None
+    
+    def sprites(self):
+        """Get the cached list of member sprites."""
+        active = self._active
+        if active is None:
+            active = self._active = list(self.spritedict)
+        return active
@@ -5,13 +5,14 @@ Weapon controller that manages the player's weapon inventory.
 
 import pygame
 import random
-from settings import WEAPON_DATA, PASSIVE_DATA, MAX_WEAPONS, MAX_PASSIVES, COLORS
+from settings import WEAPON_DATA, PASSIVE_DATA, MAX_WEAPONS, MAX_PASSIVES, COLOR_WHITE
 from weapons.weapon_base import Weapon, WeaponUpgrade
 from weapons.projectiles import (
     WandProjectile, KnifeProjectile, AxeProjectile,
     WhipSlash, GarlicAura, DamageNumber
 )
 from utils import get_closest_enemy, get_enemies_in_range
+from entities.enemy import MAX_ENEMY_SIZE
 
 
 class WhipWeapon(Weapon):
@@ -25,12 +26,12 @@ class WhipWeapon(Weapon):
         for i in range(self.amount):
             # Alternate directions if multiple slashes
             if i % 2 == 0:
-                direction = self.player.facing.copy()
+                direction = self.player.facing
             else:
-                direction = -self.player.facing.copy()
+                direction = -self.player.facing
             
             slash = WhipSlash(
-                self.player.pos.copy(),
+                self.player.pos,
                 direction,
                 [self.projectile_group, self.all_sprites],
                 self.damage,
@@ -47,27 +48,33 @@ class WandWeapon(Weapon):
         super().__init__('wand', player, projectile_group, enemy_group, all_sprites)
         self.homing = False
     
+    def _recalculate_stats(self):
+        """Recalculate stats and the volley's spread angles."""
+        super()._recalculate_stats()
+        
+        # Slight spread for multiple projectiles
+        amount = self.amount
+        self._angle_offsets = [(i - amount // 2) * 15 for i in range(amount)]
+    
     def attack(self):
         """Fire projectile at nearest enemy."""
-        for i in range(self.amount):
-            target = get_closest_enemy(self.player.pos, self.enemy_group)
-            
-            if target:
-                direction = pygame.math.Vector2(target.rect.center) - self.player.pos
-            else:
-                # Fire in facing direction if no enemies
-                direction = self.player.facing.copy()
-            
-            if direction.magnitude() > 0:
-                direction = direction.normalize()
-            
-            # Slight spread for multiple projectiles
-            if self.amount > 1:
-                angle_offset = (i - self.amount // 2) * 15
-                direction = direction.rotate(angle_offset)
+        # Every projectile in a volley aims at the same enemy, so search once
+        target = get_closest_enemy(self.player.pos, self.enemy_group, grid=self.enemy_grid)
+        
+        if target:
+            aim = pygame.math.Vector2(target.rect.center) - self.player.pos
+        else:
+            # Fire in facing direction if no enemies
+            aim = self.player.facing
+        
+        if aim.magnitude() > 0:
+            aim = aim.normalize()
+        
+        for angle_offset in self._angle_offsets:
+            direction = aim.rotate(angle_offset) if angle_offset else aim
             
             projectile = WandProjectile(
-                self.player.pos.copy(),
+                self.player.pos,
                 direction,
                 [self.projectile_group, self.all_sprites],
                 self.damage,
@@ -91,14 +98,18 @@ class WandWeapon(Weapon):
 class GarlicWeapon(Weapon):
     """Garlic - aura that damages nearby enemies."""
     
-    def __init__(self, player, projectile_group, enemy_group, all_sprites):
+    def __init__(self, player, projectile_group, enemy_group, all_sprites, aura_group=None):
         super().__init__('garlic', player, projectile_group, enemy_group, all_sprites)
         
-        # Create persistent aura
+        # Create persistent aura; it hits through update, so it stays out of
+        # the projectile group that handle_projectile_collisions walks
+        groups = [self.all_sprites]
+        if aura_group is not None:
+            groups.append(aura_group)
         base_radius = self.data.get('base_radius', 60)
         self.aura = GarlicAura(
             player,
-            [self.projectile_group, self.all_sprites],
+            groups,
             self.damage,
             int(base_radius * self.area * self.size_multiplier),  # Apply size multiplier
             self.cooldown
@@ -124,12 +135,14 @@ class GarlicWeapon(Weapon):
         self.aura.update(dt)
         
         # Check for enemies in range
-        enemies_in_range = self.aura.get_enemies_in_range(self.enemy_group)
+        enemies_in_range = self.aura.get_enemies_in_range(self.enemy_group, self.enemy_grid)
         
         dead_enemies = []
+        px, py = self.player.pos
         for enemy in enemies_in_range:
             if self.aura.can_damage_enemy(enemy):
-                knockback_dir = pygame.math.Vector2(enemy.rect.center) - self.player.pos
+                ex, ey = enemy.rect.center
+                knockback_dir = (ex - px, ey - py)
                 # Get drop info BEFORE the enemy is killed
                 drop_info = enemy.get_drop_info()
                 if enemy.take_damage(self.damage, knockback_dir):
@@ -159,7 +172,7 @@ class AxeWeapon(Weapon):
                     direction.x = -abs(direction.x)
             
             AxeProjectile(
-                self.player.pos.copy(),
+                self.player.pos,
                 direction,
                 [self.projectile_group, self.all_sprites],
                 self.damage,
@@ -175,19 +188,22 @@ class KnifeWeapon(Weapon):
     def __init__(self, player, projectile_group, enemy_group, all_sprites):
         super().__init__('knife', player, projectile_group, enemy_group, all_sprites)
     
+    def _recalculate_stats(self):
+        """Recalculate stats and the fan's spread angles."""
+        super()._recalculate_stats()
+        
+        # Spread for multiple knives, 10 degrees apart and centred on facing
+        amount = self.amount
+        self._angle_offsets = [10 * i - 5 * (amount - 1) for i in range(amount)]
+    
     def attack(self):
         """Throw knives."""
-        for i in range(self.amount):
-            direction = self.player.facing.copy()
-            
-            # Spread for multiple knives
-            if self.amount > 1:
-                spread = 10 * (self.amount - 1)
-                angle_offset = -spread/2 + (spread / (self.amount - 1)) * i if self.amount > 1 else 0
-                direction = direction.rotate(angle_offset)
+        facing = self.player.facing
+        for angle_offset in self._angle_offsets:
+            direction = facing.rotate(angle_offset) if angle_offset else facing
             
             KnifeProjectile(
-                self.player.pos.copy(),
+                self.player.pos,
                 direction,
                 [self.projectile_group, self.all_sprites],
                 self.damage,
@@ -213,11 +229,14 @@ class WeaponController:
     Handles weapon attacks, upgrades, and evolutions.
     """
     
-    def __init__(self, player, projectile_group, enemy_group, all_sprites):
+    def __init__(self, player, projectile_group, enemy_group, all_sprites, enemy_grid=None,
+                 aura_group=None):
         self.player = player
         self.projectile_group = projectile_group
         self.enemy_group = enemy_group
         self.all_sprites = all_sprites
+        self.enemy_grid = enemy_grid
+        self.aura_group = aura_group
         
         # Inventories
         self.weapons = {}  # weapon_id: Weapon instance
@@ -239,12 +258,17 @@ class WeaponController:
         # Create new weapon
         weapon_class = WEAPON_CLASSES.get(weapon_id)
         if weapon_class:
-            self.weapons[weapon_id] = weapon_class(
+            # Only garlic takes the aura group
+            extra = (self.aura_group,) if weapon_class is GarlicWeapon else ()
+            weapon = weapon_class(
                 self.player,
                 self.projectile_group,
                 self.enemy_group,
-                self.all_sprites
+                self.all_sprites,
+                *extra
             )
+            weapon.enemy_grid = self.enemy_grid
+            self.weapons[weapon_id] = weapon
             return True
         
         return False
@@ -294,8 +318,6 @@ class WeaponController:
     
     def get_upgrade_options(self, count=3):
         """Get random upgrade options for level-up screen."""
-        options = []
-        
         # Collect all possible upgrades
         possible = []
         
@@ -326,13 +348,12 @@ class WeaponController:
         for weapon_id in self.check_evolutions():
             possible.append(('evolution', weapon_id, False, 0))
         
-        # Randomly select options
-        random.shuffle(possible)
-        options = possible[:count]
+        # Randomly select options; sample only draws as many as it returns
+        options = random.sample(possible, min(count, len(possible)))
         
         # If not enough options, add some duplicates or filler
-        while len(options) < count and possible:
-            options.append(random.choice(possible))
+        if possible and len(options) < count:
+            options.extend(random.choices(possible, k=count - len(options)))
         
         return options
     
@@ -350,9 +371,9 @@ class WeaponController:
         """Update all weapons."""
         dead_enemies = []
         for weapon in self.weapons.values():
+            # Weapons that kill directly (like garlic) return a list; the rest None
             result = weapon.update(dt)
-            # Some weapons (like garlic) return dead enemies
-            if result and isinstance(result, list):
+            if result:
                 dead_enemies.extend(result)
         return dead_enemies
     
@@ -361,24 +382,41 @@ class WeaponController:
         damage_dealt = 0
         kills = 0
         dead_enemies = []  # Collect drop info before enemies are removed
+        enemy_grid = self.enemy_grid
         
         for projectile in self.projectile_group:
-            # Skip auras (handled separately)
-            if isinstance(projectile, GarlicAura):
+            # Skip anything that can't hit
+            hit_enemy = getattr(projectile, 'hit_enemy', None)
+            if hit_enemy is None:
+                continue
+            
+            # Broadphase: only enemies in grid cells near the projectile
+            projectile_rect = projectile.rect
+            if enemy_grid is not None:
+                candidates = enemy_grid.query_rect(projectile_rect, MAX_ENEMY_SIZE)
+            else:
+                candidates = self.enemy_group.sprites()
+            if not candidates:
                 continue
             
-            # Check collision with enemies
-            for enemy in list(self.enemy_group):
-                if projectile.rect.colliderect(enemy.rect):
-                    if hasattr(projectile, 'hit_enemy'):
-                        if projectile.hit_enemy(enemy):
-                            knockback_dir = pygame.math.Vector2(enemy.rect.center) - pygame.math.Vector2(projectile.rect.center)
-                            # Get drop info BEFORE the enemy is killed
-                            drop_info = enemy.get_drop_info()
-                            if enemy.take_damage(projectile.damage, knockback_dir):
-                                kills += 1
-                                dead_enemies.append(drop_info)
-                            damage_dealt += projectile.damage
+            # Narrowphase in one C call, then resolve hits in order
+            hits = projectile_rect.collidelistall([enemy.rect for enemy in candidates])
+            px, py = projectile_rect.center
+            for index in hits:
+                enemy = candidates[index]
+                if hit_enemy(enemy):
+                    ex, ey = enemy.rect.center
+                    knockback_dir = (ex - px, ey - py)
+                    # Get drop info BEFORE the enemy is killed
+                    drop_info = enemy.get_drop_info()
+                    if enemy.take_damage(projectile.damage, knockback_dir):
+                        kills += 1
+                        dead_enemies.append(drop_info)
+                    damage_dealt += projectile.damage
+                    
+                    # Out of pierce: the rest of the overlapping enemies are spared
+                    if not projectile.alive():
+                        break
         
         return damage_dealt, kills, dead_enemies
     
@@ -396,7 +434,7 @@ class WeaponController:
                 'name': passive_data.get('name', passive_id),
                 'level': level,
                 'max_level': passive_data.get('max_level', 5),
-                'color': passive_data.get('color', COLORS['white']),
+                'color': passive_data.get('color', COLOR_WHITE),
             })
         
         return {
@@ -6,20 +6,40 @@ Projectile and attack effect sprites for weapons.
 import pygame
 import math
 import random
-from settings import COLORS, WEAPON_DATA
+from functools import lru_cache
+from settings import (
+    WEAPON_DATA, COLOR_WHITE, COLOR_BLACK, COLOR_BLUE, COLOR_GRAY, COLOR_SILVER, COLOR_BROWN
+)
+from utils import prepare_surface, get_font
+
+
+# Garlic auras prune their per-enemy hit timers past this many entries
+DAMAGE_TIMER_LIMIT = 256
+
+# Rotated projectile images come in this many steps per full turn
+ROTATION_STEPS = 64
+
+
+def _rotation_bucket(angle: float) -> int:
+    """Get the nearest rotation step for an angle in degrees."""
+    return int((angle % 360) * ROTATION_STEPS / 360 + 0.5) % ROTATION_STEPS
 
 
 class Projectile(pygame.sprite.Sprite):
     """Base projectile class for ranged attacks."""
     
+    # Pre-rendered surfaces shared by every projectile with the same look
+    _IMAGE_CACHE = {}
+    
     def __init__(self, pos, direction, groups, damage, speed, pierce=1, 
-                 size=8, color=COLORS['white'], lifetime=5.0, size_multiplier=1.0):
+                 size=8, color=COLOR_WHITE, lifetime=5.0, size_multiplier=1.0):
         super().__init__(groups)
         
+        # Both are copied here, so callers can pass the player's own vectors
         self.pos = pygame.math.Vector2(pos)
         self.direction = pygame.math.Vector2(direction)
         if self.direction.magnitude() > 0:
-            self.direction = self.direction.normalize()
+            self.direction.normalize_ip()
         
         self.damage = damage
         self.speed = speed
@@ -32,19 +52,33 @@ class Projectile(pygame.sprite.Sprite):
         self.lifetime = lifetime
         self.age = 0
         
-        # Track hit enemies to prevent multi-hit
+        # Track (enemy, life) pairs already hit to prevent multi-hit
         self.hit_enemies = set()
         
         # Create image
-        self._create_image()
+        self.image = self._get_image()
         self.rect = self.image.get_rect(center=pos)
     
+    def _image_key(self):
+        """Get the key identifying this projectile's look in _IMAGE_CACHE."""
+        return (type(self), self.size, self.color)
+    
+    def _get_image(self):
+        """Get the shared image for this projectile, rendering it on first use."""
+        key = self._image_key()
+        image = Projectile._IMAGE_CACHE.get(key)
+        if image is None:
+            image = prepare_surface(self._create_image())
+            Projectile._IMAGE_CACHE[key] = image
+        return image
+    
     def _create_image(self):
         """Create projectile image."""
         size = self.size * 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (self.size, self.size), self.size)
-        pygame.draw.circle(self.image, COLORS['white'], (self.size, self.size), self.size, 1)
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(image, self.color, (self.size, self.size), self.size)
+        pygame.draw.circle(image, COLOR_WHITE, (self.size, self.size), self.size, 1)
+        return image
     
     def move(self, dt):
         """Move the projectile."""
@@ -53,10 +87,12 @@ class Projectile(pygame.sprite.Sprite):
     
     def hit_enemy(self, enemy):
         """Called when projectile hits an enemy."""
-        if id(enemy) in self.hit_enemies:
+        # Keyed per life, so a pooled enemy respawned mid-flight can be hit again
+        key = (enemy, enemy.life)
+        if key in self.hit_enemies:
             return False
         
-        self.hit_enemies.add(id(enemy))
+        self.hit_enemies.add(key)
         self.hits_remaining -= 1
         
         if self.hits_remaining <= 0:
@@ -80,19 +116,20 @@ class WandProjectile(Projectile):
         self.homing = homing
         self.target = None
         super().__init__(pos, direction, groups, damage, speed, pierce,
-                        size=6, color=COLORS['blue'], lifetime=3.0, size_multiplier=size_multiplier)
+                        size=6, color=COLOR_BLUE, lifetime=3.0, size_multiplier=size_multiplier)
     
     def _create_image(self):
         """Create a glowing orb."""
         size = self.size * 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Outer glow
-        pygame.draw.circle(self.image, (*self.color, 100), (self.size, self.size), self.size)
+        pygame.draw.circle(image, (*self.color, 100), (self.size, self.size), self.size)
         # Inner core
         inner_size = max(1, self.size - 2)
-        pygame.draw.circle(self.image, self.color, (self.size, self.size), inner_size)
-        pygame.draw.circle(self.image, COLORS['white'], (self.size, self.size), max(1, self.size // 2))
+        pygame.draw.circle(image, self.color, (self.size, self.size), inner_size)
+        pygame.draw.circle(image, COLOR_WHITE, (self.size, self.size), max(1, self.size // 2))
+        return image
     
     def set_target(self, target):
         """Set homing target."""
@@ -119,7 +156,11 @@ class KnifeProjectile(Projectile):
         # Calculate rotation before calling parent init
         self.rotation = math.degrees(math.atan2(direction[1], direction[0]))
         super().__init__(pos, direction, groups, damage, speed, pierce,
-                        size=5, color=COLORS['silver'], lifetime=2.0, size_multiplier=size_multiplier)
+                        size=5, color=COLOR_SILVER, lifetime=2.0, size_multiplier=size_multiplier)
+    
+    def _image_key(self):
+        """Knives share images per size and rotation step."""
+        return (type(self), self.size_multiplier, self.color, _rotation_bucket(self.rotation))
     
     def _create_image(self):
         """Create a knife shape."""
@@ -136,11 +177,11 @@ class KnifeProjectile(Projectile):
             (int(15 * self.size_multiplier), height)
         ]
         pygame.draw.polygon(base_image, self.color, points)
-        pygame.draw.polygon(base_image, COLORS['white'], points, 1)
+        pygame.draw.polygon(base_image, COLOR_WHITE, points, 1)
         
-        # Rotate to face direction
-        self.image = pygame.transform.rotate(base_image, -self.rotation)
-        self.rect = self.image.get_rect(center=self.pos)
+        # Rotate to face direction, snapped to the cached rotation step
+        angle = _rotation_bucket(self.rotation) * 360 / ROTATION_STEPS
+        return pygame.transform.rotate(base_image, -angle)
 
 
 class AxeProjectile(Projectile):
@@ -153,12 +194,29 @@ class AxeProjectile(Projectile):
         self.rotation = 0
         self.rotation_speed = 720  # Degrees per second
         super().__init__(pos, direction, groups, damage, speed, pierce,
-                        size=12, color=COLORS['gray'], lifetime=3.0, size_multiplier=size_multiplier)
+                        size=12, color=COLOR_GRAY, lifetime=3.0, size_multiplier=size_multiplier)
+    
+    # Rotated frames keyed like _IMAGE_CACHE, each a list filled in on first use
+    _FRAME_CACHE = {}
+    
+    def _get_image(self):
+        """Use the shared base image and its shared list of rotated frames."""
+        self.base_image = super()._get_image()
+        key = self._image_key()
+        frames = AxeProjectile._FRAME_CACHE.get(key)
+        if frames is None:
+            frames = AxeProjectile._FRAME_CACHE[key] = [None] * ROTATION_STEPS
+        self._frames = frames
+        return self.base_image
+    
+    def _image_key(self):
+        """Axes share images per size and line width."""
+        return (type(self), self.size, self.size_multiplier, self.color)
     
     def _create_image(self):
         """Create an axe shape."""
         size = self.size * 2
-        self.base_image = pygame.Surface((size, size), pygame.SRCALPHA)
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Axe head (diamond shape) - scaled based on size
         head_points = [
@@ -167,16 +225,15 @@ class AxeProjectile(Projectile):
             (self.size, size - 2),
             (4, self.size)
         ]
-        pygame.draw.polygon(self.base_image, self.color, head_points)
+        pygame.draw.polygon(image, self.color, head_points)
         line_width = max(1, int(2 * self.size_multiplier))
-        pygame.draw.polygon(self.base_image, COLORS['brown'], head_points, line_width)
+        pygame.draw.polygon(image, COLOR_BROWN, head_points, line_width)
         
         # Handle
         handle_width = max(1, int(3 * self.size_multiplier))
-        pygame.draw.line(self.base_image, COLORS['brown'], 
+        pygame.draw.line(image, COLOR_BROWN, 
                         (self.size, self.size), (self.size, size - 2), handle_width)
-        
-        self.image = self.base_image.copy()
+        return image
     
     def move(self, dt):
         """Move in an arc."""
@@ -187,9 +244,15 @@ class AxeProjectile(Projectile):
         self.pos.y += self.vertical_speed * dt
         self.vertical_speed += self.gravity * dt
         
-        # Rotation
+        # Rotation, rendering each step's frame only the first time any axe needs it
         self.rotation += self.rotation_speed * dt
-        self.image = pygame.transform.rotate(self.base_image, self.rotation)
+        bucket = _rotation_bucket(self.rotation)
+        image = self._frames[bucket]
+        if image is None:
+            image = self._frames[bucket] = pygame.transform.rotate(
+                self.base_image, bucket * 360 / ROTATION_STEPS
+            )
+        self.image = image
         
         self.rect = self.image.get_rect(center=self.pos)
 
@@ -197,6 +260,12 @@ class AxeProjectile(Projectile):
 class WhipSlash(pygame.sprite.Sprite):
     """Whip attack - horizontal slash."""
     
+    # Pre-faded slash frames keyed by (width, height, line thickness)
+    _IMAGE_CACHE = {}
+    
+    # Number of fade levels a slash steps through over its lifetime
+    FADE_STEPS = 16
+    
     def __init__(self, pos, direction, groups, damage, area=1.0, pierce=999, size_multiplier=1.0):
         super().__init__(groups)
         
@@ -222,49 +291,72 @@ class WhipSlash(pygame.sprite.Sprite):
         
         self.pos.x += offset_x
         
-        # Create image
-        self._create_image()
+        # Create image; fading swaps between shared pre-faded frames
+        self._fades = self._get_fades()
+        self.image = self._fades[0]
         self.rect = self.image.get_rect(center=self.pos)
     
-    def _create_image(self):
+    def _get_fades(self):
+        """Get the shared fade frames for this slash, rendering them on first use."""
+        # Line thickness scales slightly with size
+        line_thickness = max(2, int(3 * self.size_multiplier))
+        key = (self.width, self.height, line_thickness)
+        fades = WhipSlash._IMAGE_CACHE.get(key)
+        if fades is None:
+            image = self._create_image(line_thickness)
+            steps = self.FADE_STEPS
+            fades = []
+            for i in range(steps):
+                # Bake the fade into the per-pixel alpha so blits need no surface alpha
+                faded = image.copy()
+                faded.fill((255, 255, 255, 255 * (steps - i) // steps),
+                           special_flags=pygame.BLEND_RGBA_MULT)
+                fades.append(prepare_surface(faded))
+            WhipSlash._IMAGE_CACHE[key] = fades
+        return fades
+    
+    def _create_image(self, line_thickness):
         """Create slash effect."""
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         # Slash arc
         color = WEAPON_DATA['whip']['color']
         
-        # Draw multiple lines for slash effect - line thickness scales slightly with size
-        line_thickness = max(2, int(3 * self.size_multiplier))
+        # Draw multiple lines for slash effect
         for i in range(5):
             alpha = 255 - i * 40
             y_offset = i * 3
-            pygame.draw.line(self.image, (*color, alpha),
+            pygame.draw.line(image, (*color, alpha),
                            (0, self.height // 2 + y_offset),
                            (self.width, self.height // 2 - y_offset), line_thickness)
+        return image
     
     def hit_enemy(self, enemy):
         """Called when slash hits an enemy."""
-        if id(enemy) in self.hit_enemies:
+        key = (enemy, enemy.life)
+        if key in self.hit_enemies:
             return False
         
-        self.hit_enemies.add(id(enemy))
+        self.hit_enemies.add(key)
         return True
     
     def update(self, dt):
         """Update the slash."""
         self.age += dt
         
-        # Fade out
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        self.image.set_alpha(max(0, alpha))
-        
+        # Fade out by stepping through the pre-faded frames
         if self.age >= self.lifetime:
             self.kill()
+        else:
+            self.image = self._fades[int(self.age / self.lifetime * self.FADE_STEPS)]
 
 
 class GarlicAura(pygame.sprite.Sprite):
     """Garlic aura - damages nearby enemies continuously."""
     
+    # Pre-rendered auras keyed by radius
+    _IMAGE_CACHE = {}
+    
     def __init__(self, player, groups, damage, radius=60, tick_rate=0.5):
         super().__init__(groups)
         
@@ -278,13 +370,21 @@ class GarlicAura(pygame.sprite.Sprite):
         self.damage_timers = {}
         
         # Create image
-        self._create_image()
+        self.image = self._get_image()
         self.rect = self.image.get_rect(center=player.pos)
     
+    def _get_image(self):
+        """Get the shared image for this radius, rendering it on first use."""
+        image = GarlicAura._IMAGE_CACHE.get(self.radius)
+        if image is None:
+            image = prepare_surface(self._create_image())
+            GarlicAura._IMAGE_CACHE[self.radius] = image
+        return image
+    
     def _create_image(self):
         """Create aura effect."""
         size = self.radius * 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         color = WEAPON_DATA['garlic']['color']
         
@@ -293,17 +393,21 @@ class GarlicAura(pygame.sprite.Sprite):
             r = self.radius - i * 10
             if r > 0:
                 alpha = 60 - i * 15
-                pygame.draw.circle(self.image, (*color, alpha), 
+                pygame.draw.circle(image, (*color, alpha), 
                                  (self.radius, self.radius), r)
         
         # Outer ring
-        pygame.draw.circle(self.image, (*color, 100), 
+        pygame.draw.circle(image, (*color, 100), 
                          (self.radius, self.radius), self.radius, 2)
+        return image
     
     def update_radius(self, new_radius):
-        """Update the aura radius."""
+        """Update the aura radius, keeping the rect sized to the new image."""
+        if new_radius == self.radius:
+            return
         self.radius = new_radius
-        self._create_image()
+        self.image = self._get_image()
+        self.rect = self.image.get_rect(center=self.rect.center)
     
     def update_damage(self, new_damage):
         """Update the aura damage."""
@@ -311,25 +415,43 @@ class GarlicAura(pygame.sprite.Sprite):
     
     def can_damage_enemy(self, enemy):
         """Check if enemy can be damaged (tick rate)."""
-        enemy_id = id(enemy)
-        current_time = pygame.time.get_ticks() / 1000
-        
-        if enemy_id not in self.damage_timers:
-            self.damage_timers[enemy_id] = current_time
-            return True
-        
-        if current_time - self.damage_timers[enemy_id] >= self.tick_rate:
-            self.damage_timers[enemy_id] = current_time
+        # Keyed per life, so a pooled enemy respawned mid-tick is hit at once
+        key = (enemy, enemy.life)
+        # Timestamps stay in integer milliseconds
+        current_time = pygame.time.get_ticks()
+        
+        last_hit = self.damage_timers.get(key)
+        if last_hit is None or current_time - last_hit >= self.tick_rate * 1000:
+            self.damage_timers[key] = current_time
             return True
         
         return False
     
-    def get_enemies_in_range(self, enemy_group):
+    def get_enemies_in_range(self, enemy_group, enemy_grid=None):
         """Get all enemies within aura range."""
+        px, py = self.player.pos
+        radius = self.radius
+        radius_sq = radius * radius
+        
+        # Only test enemies in nearby grid cells when a grid is available;
+        # one extra pixel covers rect.center rounding away from the bucketed pos
+        if enemy_grid is not None:
+            candidates = enemy_grid.query((px, py), radius + 1)
+        else:
+            candidates = enemy_group.sprites()
+        
+        # Reject enemies outside the aura's bounding square in one C call
+        area = pygame.Rect(0, 0, radius * 2, radius * 2)
+        area.center = (px, py)
+        hits = area.collidelistall([enemy.rect for enemy in candidates])
+        
         enemies = []
-        for enemy in enemy_group:
-            dist = (pygame.math.Vector2(enemy.rect.center) - self.player.pos).magnitude()
-            if dist <= self.radius:
+        for index in hits:
+            enemy = candidates[index]
+            ex, ey = enemy.rect.center
+            dx = ex - px
+            dy = ey - py
+            if dx * dx + dy * dy <= radius_sq:
                 enemies.append(enemy)
         return enemies
     
@@ -337,18 +459,38 @@ class GarlicAura(pygame.sprite.Sprite):
         """Update aura position to follow player."""
         self.rect.center = self.player.pos
         
-        # Clean up old damage timers
-        current_time = pygame.time.get_ticks() / 1000
-        self.damage_timers = {
-            k: v for k, v in self.damage_timers.items()
-            if current_time - v < self.tick_rate * 2
-        }
+        # Clean up old damage timers only once enough have piled up; a stale
+        # entry never blocks damage, since it is older than the tick rate
+        if len(self.damage_timers) > DAMAGE_TIMER_LIMIT:
+            cutoff = pygame.time.get_ticks() - self.tick_rate * 2000
+            self.damage_timers = {
+                k: v for k, v in self.damage_timers.items()
+                if v > cutoff
+            }
+
+
+@lru_cache(maxsize=256)
+def _render_damage_number(text: str, color: tuple[int, ...]) -> pygame.Surface:
+    """Render a damage number with its drop shadow; copies are faded per popup."""
+    font = get_font(24)
+    
+    # Shadow
+    shadow = font.render(text, True, COLOR_BLACK)
+    text_surf = font.render(text, True, color)
+    
+    # Combine
+    width = text_surf.get_width() + 2
+    height = text_surf.get_height() + 2
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    image.blit(shadow, (2, 2))
+    image.blit(text_surf, (0, 0))
+    return prepare_surface(image)
 
 
 class DamageNumber(pygame.sprite.Sprite):
     """Floating damage number for visual feedback."""
     
-    def __init__(self, pos, damage, groups, color=COLORS['white']):
+    def __init__(self, pos, damage, groups, color=COLOR_WHITE):
         super().__init__(groups)
         
         self.pos = pygame.math.Vector2(pos)
@@ -364,19 +506,8 @@ class DamageNumber(pygame.sprite.Sprite):
     
     def _create_image(self):
         """Create damage number image."""
-        font = pygame.font.Font(None, 24)
-        text = str(int(self.damage))
-        
-        # Shadow
-        shadow = font.render(text, True, COLORS['black'])
-        text_surf = font.render(text, True, self.color)
-        
-        # Combine
-        width = text_surf.get_width() + 2
-        height = text_surf.get_height() + 2
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.image.blit(shadow, (2, 2))
-        self.image.blit(text_surf, (0, 0))
+        # Each popup fades its own surface alpha, so copy the shared render
+        self.image = _render_damage_number(str(int(self.damage)), tuple(self.color)).copy()
     
     def update(self, dt):
         """Update floating number."""
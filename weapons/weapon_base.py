@@ -22,8 +22,14 @@ class Weapon(ABC):
         self.enemy_group = enemy_group
         self.all_sprites = all_sprites
         
-        # Get base data
-        self.data = WEAPON_DATA.get(weapon_id, WEAPON_DATA['whip']).copy()
+        # Optional spatial index of enemies (set by the controller)
+        self.enemy_grid = None
+        
+        # Get base data; a read-only entry shared by every weapon of this type,
+        # so evolution overrides go on the instance and self.data is never written
+        self.data = WEAPON_DATA.get(weapon_id, WEAPON_DATA['whip'])
+        self.name = self.data['name']
+        self.color = self.data['color']
         
         # Current level
         self.level = 1
@@ -75,8 +81,8 @@ class Weapon(ABC):
         self.damage *= self.player.might
         self.cooldown *= (1 - self.player.cooldown_reduction)
         
-        # Update cooldown timer
-        self.cooldown_timer = CooldownTimer(self.cooldown)
+        # Update cooldown timer, keeping the time since the last attack
+        self.cooldown_timer.set_duration(self.cooldown)
     
     def level_up(self):
         """Level up the weapon."""
@@ -110,8 +116,8 @@ class Weapon(ABC):
             return False
         
         self.evolved = True
-        self.data['name'] = evolution_data['name']
-        self.data['color'] = evolution_data['color']
+        self.name = evolution_data['name']
+        self.color = evolution_data['color']
         
         # Apply evolution bonuses
         self.damage *= evolution_data.get('damage_mult', 1.5)
@@ -136,12 +142,12 @@ class Weapon(ABC):
         """Get weapon info for UI display."""
         return {
             'id': self.weapon_id,
-            'name': self.data['name'],
+            'name': self.name,
             'level': self.level,
             'max_level': self.max_level,
             'damage': self.damage,
             'cooldown': self.cooldown,
-            'color': self.data['color'],
+            'color': self.color,
             'evolved': self.evolved,
         }
     